@@ -1,6 +1,7 @@
 import json
 import re
 import time
+from collections.abc import Iterable, Iterator
 from urllib import error, request
 
 import anthropic
@@ -58,6 +59,32 @@ def _sanitize_ollama_output(text: str) -> str:
     return "\n".join(filtered).strip()
 
 
+def _sanitize_ollama_partial_output(text: str) -> str:
+    # 스트림 중간 텍스트는 닫히지 않은 <think> 블록과 아직 끝나지 않은 마지막 줄을 빼고 정리한다.
+    partial = text or ""
+    open_index = partial.lower().rfind("<think>")
+    if open_index >= 0 and partial.lower().find("</think>", open_index) < 0:
+        partial = partial[:open_index]
+    return _sanitize_ollama_output(partial[: partial.rfind("\n") + 1])
+
+
+def _sanitize_ollama_stream(chunks: Iterable[str]) -> Iterator[str]:
+    # 증분 조각을 받아 정리된 누적 답변을 내보낸다. 줄이 끝날 때만 다시 정리하고, 마지막 값은 전체 정리 결과와 같다.
+    parts: list[str] = []
+    last_text = ""
+    for chunk in chunks:
+        parts.append(chunk)
+        if "\n" not in chunk:
+            continue
+        text = _sanitize_ollama_partial_output("".join(parts))
+        if text and text != last_text:
+            last_text = text
+            yield text
+    final_text = _sanitize_ollama_output("".join(parts))
+    if final_text != last_text:
+        yield final_text
+
+
 def _ask_claude(
     client: Anthropic,
     question: str,
@@ -98,6 +125,23 @@ def _ask_claude_with_meta(
     }
 
 
+def _stream_claude(
+    client: Anthropic,
+    question: str,
+    system_prompt: str | None = None,
+    *,
+    max_tokens: int | None = None,
+) -> Iterator[str]:
+    prompt = (system_prompt or s.DEFAULT_SYSTEM_PROMPT).strip()
+    with client.messages.stream(
+        model=s.ANTHROPIC_MODEL,
+        max_tokens=max_tokens or s.ANTHROPIC_MAX_TOKENS,
+        system=prompt,
+        messages=[{"role": "user", "content": question}],
+    ) as stream:
+        yield from stream.text_stream
+
+
 def _check_claude_health(
     client: Anthropic | None = None,
     *,
@@ -225,18 +269,17 @@ def _ask_ollama(
     return _sanitize_ollama_output(str(data.get("response", "")).strip())
 
 
-def _ask_ollama_chat(
+def _build_ollama_chat_request(
     question: str,
-    system_prompt: str | None = None,
+    system_prompt: str | None,
     *,
-    model: str | None = None,
-    timeout_sec: int | None = None,
-    max_tokens: int | None = None,
-    temperature: float | None = None,
-    think: bool | None = None,
-) -> str:
+    model: str | None,
+    max_tokens: int | None,
+    temperature: float | None,
+    think: bool | None,
+    stream: bool,
+) -> request.Request:
     prompt = (system_prompt or s.DEFAULT_SYSTEM_PROMPT).strip()
-    actual_timeout = max(1, timeout_sec if timeout_sec is not None else s.OLLAMA_TIMEOUT_SEC)
     actual_temperature = s.OLLAMA_TEMPERATURE if temperature is None else temperature
     options: dict[str, int | float] = {
         "temperature": actual_temperature,
@@ -249,18 +292,40 @@ def _ask_ollama_chat(
             {"role": "system", "content": prompt},
             {"role": "user", "content": question},
         ],
-        "stream": False,
+        "stream": stream,
         "options": options,
     }
     if think is not None:
         payload["think"] = think
 
-    req = request.Request(
+    return request.Request(
         url=f"{s.OLLAMA_BASE_URL}/api/chat",
         data=json.dumps(payload).encode("utf-8"),
         headers={"Content-Type": "application/json"},
         method="POST",
     )
+
+
+def _ask_ollama_chat(
+    question: str,
+    system_prompt: str | None = None,
+    *,
+    model: str | None = None,
+    timeout_sec: int | None = None,
+    max_tokens: int | None = None,
+    temperature: float | None = None,
+    think: bool | None = None,
+) -> str:
+    actual_timeout = max(1, timeout_sec if timeout_sec is not None else s.OLLAMA_TIMEOUT_SEC)
+    req = _build_ollama_chat_request(
+        question,
+        system_prompt,
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        think=think,
+        stream=False,
+    )
     try:
         with request.urlopen(req, timeout=actual_timeout) as response:
             body = response.read().decode("utf-8")
@@ -285,6 +350,56 @@ def _ask_ollama_chat(
     return _sanitize_ollama_output(str(message.get("content", "")).strip())
 
 
+def _stream_ollama_chat(
+    question: str,
+    system_prompt: str | None = None,
+    *,
+    model: str | None = None,
+    timeout_sec: int | None = None,
+    max_tokens: int | None = None,
+    temperature: float | None = None,
+    think: bool | None = None,
+) -> Iterator[str]:
+    # NDJSON 한 줄마다 message.content 조각을 그대로 내보낸다. 정리는 _sanitize_ollama_stream이 맡는다.
+    # timeout은 전체 응답이 아니라 줄 사이 대기 시간에 걸린다.
+    actual_timeout = max(1, timeout_sec if timeout_sec is not None else s.OLLAMA_TIMEOUT_SEC)
+    req = _build_ollama_chat_request(
+        question,
+        system_prompt,
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        think=think,
+        stream=True,
+    )
+    try:
+        with request.urlopen(req, timeout=actual_timeout) as response:
+            for raw_line in response:
+                line = raw_line.decode("utf-8").strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise RuntimeError("Ollama API returned invalid JSON") from exc
+                if data.get("error"):
+                    raise RuntimeError(f"Ollama API error: {str(data['error'])[:200]}")
+                message = data.get("message")
+                if isinstance(message, dict) and message.get("content"):
+                    yield str(message["content"])
+                if data.get("done"):
+                    return
+    except TimeoutError as exc:
+        raise TimeoutError(f"Ollama API timed out after {actual_timeout}s") from exc
+    except error.HTTPError as exc:
+        detail = exc.read().decode("utf-8", errors="ignore")
+        raise RuntimeError(f"Ollama API HTTP {exc.code}: {detail[:200]}") from exc
+    except error.URLError as exc:
+        if "timed out" in str(exc.reason).lower():
+            raise TimeoutError(f"Ollama API timed out after {actual_timeout}s") from exc
+        raise RuntimeError(f"Ollama API connection failed: {exc.reason}") from exc
+
+
 def _check_ollama_health(
     timeout_sec: int | None = None,
     *,
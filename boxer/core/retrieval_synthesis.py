@@ -9,7 +9,6 @@ from anthropic import Anthropic
 
 from boxer.core import settings as s
 from boxer.core.llm import _ask_claude_with_meta, _ask_ollama_chat
-from boxer.core.utils import _truncate_text
 
 _PHONE_PATTERN = re.compile(r"\b01[016789]-?\d{3,4}-?\d{4}\b")
 _EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
@@ -20,6 +19,27 @@ _NAME_KEYWORDS = (
 )
 _PHONE_KEYWORDS = ("phone", "phonenumber", "mobile", "tel")
 _EMAIL_KEYWORDS = ("email",)
+# 예산이 모자라면 원문 로그 줄/샘플 같은 키부터 통째로 뺀다.
+# 부분 문자열로 고르면 previewLines(노션 본문), errorLines, sampleTime까지 밀려나서 소문자 키 이름으로 정확히 맞춘다.
+_EVIDENCE_LOW_PRIORITY_KEYS = frozenset(
+    {
+        "raw",
+        "rawline",
+        "raw_line",
+        "rawlines",
+        "raw_lines",
+        "samplemessage",
+        "sample_message",
+        "samplelines",
+        "sample_lines",
+        "trace",
+        "traceback",
+        "stacktrace",
+    }
+)
+_EVIDENCE_TRUNCATED_MARKER = '"_truncated":true'
+_EVIDENCE_MIN_STRING_CHARS = 32
+_EVIDENCE_STRING_SUFFIX = "...(truncated)"
 
 
 def _json_default(value: Any) -> Any:
@@ -37,6 +57,10 @@ def _mask_phone(text: str) -> str:
     return f"{digits[:3]}****{digits[-4:]}"
 
 
+def _mask_email(text: str) -> str:
+    return "***@***"
+
+
 def _mask_name(text: str) -> str:
     clean = (text or "").strip()
     if not clean:
@@ -48,48 +72,263 @@ def _mask_name(text: str) -> str:
     return clean[0] + "*" * (len(clean) - 2) + clean[-1]
 
 
+class _MaskingEngine:
+    # 키 분류 결과는 키 문자열마다 한 번만 계산해 두고, 본문 패턴은 하나의 alternation으로 합쳐 문자열당 한 번만 훑는다.
+    # 어댑터 규칙도 같은 엔진에 등록해서 증거 트리를 한 번만 순회한다.
+    def __init__(self, *, key_cache_size: int = 4096) -> None:
+        self._key_rules: list[tuple[tuple[str, ...], Callable[[str], str], bool]] = []
+        self._text_rules: dict[str, tuple[str, Callable[[str], str]]] = {}
+        self._key_cache: dict[tuple[str, bool], Callable[[str], str] | None] = {}
+        self._key_cache_size = key_cache_size
+        self._text_pattern: re.Pattern[str] | None = None
+        self._has_required_rules = False
+
+    def register_key_rule(
+        self,
+        keywords: tuple[str, ...],
+        mask: Callable[[str], str],
+        *,
+        required: bool = False,
+    ) -> None:
+        # 먼저 등록한 규칙이 우선한다. required 규칙은 LLM_SYNTHESIS_MASKING_ENABLED가 꺼져 있어도 적용한다.
+        rule = (tuple(token.lower() for token in keywords if token), mask, required)
+        if rule in self._key_rules:
+            return
+        self._key_rules.append(rule)
+        self._has_required_rules = self._has_required_rules or required
+        self._key_cache.clear()
+
+    def register_text_rule(self, name: str, pattern: str, mask: Callable[[str], str]) -> None:
+        # name은 합친 정규식의 named group 이름이 되므로 pattern 안에서는 named group을 쓰지 않는다.
+        self._text_rules[name] = (pattern, mask)
+        self._text_pattern = None
+
+    def _key_mask(self, key: str, enabled: bool) -> Callable[[str], str] | None:
+        cache_key = (key, enabled)
+        try:
+            return self._key_cache[cache_key]
+        except KeyError:
+            pass
+        lowered = key.lower()
+        key_mask = None
+        for keywords, mask, required in self._key_rules:
+            if (enabled or required) and any(token in lowered for token in keywords):
+                key_mask = mask
+                break
+        if len(self._key_cache) >= self._key_cache_size:
+            self._key_cache.clear()
+        self._key_cache[cache_key] = key_mask
+        return key_mask
+
+    def _replace_text_match(self, match: re.Match[str]) -> str:
+        return self._text_rules[str(match.lastgroup)][1](match.group(0))
+
+    def mask_text(self, text: str) -> str:
+        if self._text_pattern is None:
+            if not self._text_rules:
+                return text
+            self._text_pattern = re.compile(
+                "|".join(f"(?P<{name}>{pattern})" for name, (pattern, _) in self._text_rules.items())
+            )
+        return self._text_pattern.sub(self._replace_text_match, text)
+
+    def mask_value(self, key: str, value: Any, *, enabled: bool = True) -> Any:
+        if isinstance(value, str):
+            key_mask = self._key_mask(key, enabled)
+            if key_mask is not None:
+                return key_mask(value)
+            return self.mask_text(value) if enabled else value
+        if isinstance(value, dict):
+            return {
+                nested_key: self.mask_value(str(nested_key), nested_value, enabled=enabled)
+                for nested_key, nested_value in value.items()
+            }
+        if isinstance(value, list):
+            return [self.mask_value(key, item, enabled=enabled) for item in value]
+        return value
+
+    def mask(self, payload: Any, *, enabled: bool = True) -> Any:
+        if not enabled and not self._has_required_rules:
+            return payload
+        return self.mask_value("", payload, enabled=enabled)
+
+
+_MASKING_ENGINE = _MaskingEngine()
+_MASKING_ENGINE.register_key_rule(_PHONE_KEYWORDS, _mask_phone)
+_MASKING_ENGINE.register_key_rule(_EMAIL_KEYWORDS, _mask_email)
+_MASKING_ENGINE.register_key_rule(_NAME_KEYWORDS, _mask_name)
+_MASKING_ENGINE.register_text_rule("phone", _PHONE_PATTERN.pattern, _mask_phone)
+_MASKING_ENGINE.register_text_rule("email", _EMAIL_PATTERN.pattern, _mask_email)
+
+
+def _register_masking_key_rule(
+    keywords: tuple[str, ...],
+    mask: Callable[[str], str],
+    *,
+    required: bool = False,
+) -> None:
+    _MASKING_ENGINE.register_key_rule(keywords, mask, required=required)
+
+
+def _register_masking_text_rule(name: str, pattern: str, mask: Callable[[str], str]) -> None:
+    _MASKING_ENGINE.register_text_rule(name, pattern, mask)
+
+
 def _mask_text(text: str) -> str:
-    masked = _PHONE_PATTERN.sub(lambda m: _mask_phone(m.group(0)), text)
-    masked = _EMAIL_PATTERN.sub("***@***", masked)
-    return masked
+    return _MASKING_ENGINE.mask_text(text)
 
 
 def _mask_by_key(key: str, value: Any) -> Any:
-    lowered = key.lower()
-    if isinstance(value, str):
-        if any(token in lowered for token in _PHONE_KEYWORDS):
-            return _mask_phone(value)
-        if any(token in lowered for token in _EMAIL_KEYWORDS):
-            return "***@***"
-        if any(token in lowered for token in _NAME_KEYWORDS):
-            return _mask_name(value)
-        return _mask_text(value)
-    if isinstance(value, dict):
-        return {
-            nested_key: _mask_by_key(str(nested_key), nested_value)
-            for nested_key, nested_value in value.items()
-        }
-    if isinstance(value, list):
-        return [_mask_by_key(key, item) for item in value]
-    return value
-
-
-def _mask_evidence_payload(payload: Any) -> Any:
-    if isinstance(payload, dict):
-        return {
-            key: _mask_by_key(str(key), value)
-            for key, value in payload.items()
-        }
-    if isinstance(payload, list):
-        return [_mask_evidence_payload(item) for item in payload]
-    if isinstance(payload, str):
-        return _mask_text(payload)
-    return payload
+    return _MASKING_ENGINE.mask_value(key, value)
+
+
+def _mask_evidence_payload(payload: Any, *, enabled: bool = True) -> Any:
+    return _MASKING_ENGINE.mask(payload, enabled=enabled)
+
+
+def _is_low_priority_evidence_key(key: str) -> bool:
+    return key.lower() in _EVIDENCE_LOW_PRIORITY_KEYS
+
+
+class _EvidencePacker:
+    # 증거 트리를 우선순위대로 훑으면서 예산 안에 들어가는 조각만 JSON으로 만든다.
+    # 저우선 키는 따로 잡은 여유 예산(low_priority_budget)만 쓰게 해서 본문을 밀어내지 못하게 한다.
+    def __init__(
+        self,
+        budget: int,
+        *,
+        include_low_priority: bool,
+        low_priority_budget: int = 0,
+    ) -> None:
+        self.remaining = budget
+        self.low_priority_remaining = low_priority_budget
+        self.include_low_priority = include_low_priority
+        self.truncated = False
+        self.low_priority_dropped = False
+        self._low_priority_depth = 0
+
+    def _charge(self, size: int) -> bool:
+        if self._low_priority_depth:
+            if size > self.low_priority_remaining:
+                self.low_priority_dropped = True
+                return False
+            self.low_priority_remaining -= size
+            return True
+        if size > self.remaining:
+            self.truncated = True
+            return False
+        self.remaining -= size
+        return True
+
+    def _refund(self, size: int) -> None:
+        if self._low_priority_depth:
+            self.low_priority_remaining += size
+        else:
+            self.remaining += size
+
+    def _available(self) -> int:
+        return self.low_priority_remaining if self._low_priority_depth else self.remaining
+
+    def pack(self, value: Any) -> str | None:
+        if isinstance(value, dict):
+            return self._pack_dict(value)
+        if isinstance(value, (list, tuple)):
+            return self._pack_list(value)
+        return self._pack_scalar(value)
+
+    def _pack_scalar(self, value: Any) -> str | None:
+        text = json.dumps(value, ensure_ascii=False, default=_json_default)
+        if self._charge(len(text)):
+            return text
+        available = self._available()
+        if not isinstance(value, str) or available < _EVIDENCE_MIN_STRING_CHARS:
+            return None
+        # 긴 문자열은 남은 예산에 맞게 잘라서라도 넣는다. 이스케이프로 늘어난 만큼 줄여 가며 맞춘다.
+        keep_chars = available - 2 - len(_EVIDENCE_STRING_SUFFIX)
+        while keep_chars > 0:
+            text = json.dumps(value[:keep_chars] + _EVIDENCE_STRING_SUFFIX, ensure_ascii=False)
+            if len(text) <= available:
+                self._charge(len(text))
+                return text
+            keep_chars -= len(text) - available
+        return None
+
+    def _pack_dict(self, value: dict[Any, Any]) -> str | None:
+        if not self._charge(2):
+            return None
+        members: list[str] = []
+        high_priority: list[tuple[str, Any]] = []
+        low_priority: list[tuple[str, Any]] = []
+        for key, item in value.items():
+            target = low_priority if _is_low_priority_evidence_key(str(key)) else high_priority
+            target.append((str(key), item))
+        # 작은 스칼라 필드(상태, 건수 등)를 먼저 담고 큰 하위 구조는 뒤에 담는다.
+        high_priority.sort(key=lambda entry: isinstance(entry[1], (dict, list, tuple)))
+        for key, item in high_priority:
+            self._pack_member(members, key, item)
+        if low_priority and not self.include_low_priority:
+            self.low_priority_dropped = True
+        elif low_priority:
+            self._low_priority_depth += 1
+            try:
+                for key, item in low_priority:
+                    self._pack_member(members, key, item)
+            finally:
+                self._low_priority_depth -= 1
+        return "{" + ",".join(members) + "}"
+
+    def _pack_member(self, members: list[str], key: str, item: Any) -> None:
+        prefix_size = len(json.dumps(key, ensure_ascii=False)) + 1 + (1 if members else 0)
+        if not self._charge(prefix_size):
+            return
+        packed = self.pack(item)
+        if packed is None:
+            self._refund(prefix_size)
+            return
+        members.append(f"{json.dumps(key, ensure_ascii=False)}:{packed}")
+
+    def _pack_list(self, value: list[Any] | tuple[Any, ...]) -> str | None:
+        if not self._charge(2):
+            return None
+        items: list[str] = []
+        for item in value:
+            separator_size = 1 if items else 0
+            if not self._charge(separator_size):
+                break
+            was_truncated = self.truncated
+            packed = self.pack(item)
+            if packed is None:
+                self._refund(separator_size)
+                break
+            items.append(packed)
+            # 앞쪽 항목이 잘리기 시작했으면 뒤 항목은 직렬화하지 않는다.
+            if self.truncated and not was_truncated:
+                break
+        return "[" + ",".join(items) + "]"
+
+
+def _pack_evidence_payload(payload: Any, max_chars: int) -> str:
+    budget = max(0, max_chars - len(_EVIDENCE_TRUNCATED_MARKER) - 1)
+    packer = _EvidencePacker(budget, include_low_priority=False)
+    packed = packer.pack(payload) or ""
+    if not packer.truncated and packer.low_priority_dropped:
+        # 본문이 다 들어갔으면 남은 예산 안에서 저우선 키를 다시 채운다.
+        packer = _EvidencePacker(
+            len(packed),
+            include_low_priority=True,
+            low_priority_budget=budget - len(packed),
+        )
+        packed = packer.pack(payload) or ""
+    if not (packer.truncated or packer.low_priority_dropped):
+        return packed
+    if packed.startswith("{"):
+        separator = "" if packed == "{}" else ","
+        return f"{packed[:-1]}{separator}{_EVIDENCE_TRUNCATED_MARKER}}}"
+    return packed
 
 
 def _serialize_evidence_payload(payload: Any) -> str:
-    raw = json.dumps(payload, ensure_ascii=False, default=_json_default, separators=(",", ":"))
-    return _truncate_text(raw, max(500, s.LLM_SYNTHESIS_MAX_EVIDENCE_CHARS))
+    return _pack_evidence_payload(payload, max(500, s.LLM_SYNTHESIS_MAX_EVIDENCE_CHARS))
 
 
 def _build_retrieval_synthesis_input(
@@ -154,9 +393,8 @@ def _synthesize_retrieval_answer(
     if not normalized_provider:
         return ""
 
-    payload = evidence_payload
-    if s.LLM_SYNTHESIS_MASKING_ENABLED:
-        payload = _mask_evidence_payload(evidence_payload)
+    # 어댑터가 등록한 required 규칙은 마스킹 설정과 상관없이 같은 순회에서 적용된다.
+    payload = _mask_evidence_payload(evidence_payload, enabled=s.LLM_SYNTHESIS_MASKING_ENABLED)
     if evidence_transform is not None:
         payload = evidence_transform(payload)
 
@@ -45,6 +45,12 @@ OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "qwen2.5:1.5b")
 OLLAMA_TIMEOUT_SEC = int(os.getenv("OLLAMA_TIMEOUT_SEC", "300"))
 OLLAMA_HEALTH_TIMEOUT_SEC = int(os.getenv("OLLAMA_HEALTH_TIMEOUT_SEC", "2"))
 OLLAMA_TEMPERATURE = float(os.getenv("OLLAMA_TEMPERATURE", "0.0"))
+LLM_STREAMING_ENABLED = os.getenv("LLM_STREAMING_ENABLED", "false").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
 LLM_SYNTHESIS_ENABLED = os.getenv("LLM_SYNTHESIS_ENABLED", "true").lower() in {
     "1",
     "true",
@@ -73,6 +79,8 @@ RETRIEVAL_SYNTHESIS_SYSTEM_PROMPT = os.getenv(
 THREAD_CONTEXT_FETCH_LIMIT = int(os.getenv("THREAD_CONTEXT_FETCH_LIMIT", "100"))
 THREAD_CONTEXT_MAX_MESSAGES = int(os.getenv("THREAD_CONTEXT_MAX_MESSAGES", "12"))
 THREAD_CONTEXT_MAX_CHARS = int(os.getenv("THREAD_CONTEXT_MAX_CHARS", "5000"))
+THREAD_CONTEXT_CACHE_MAX_THREADS = int(os.getenv("THREAD_CONTEXT_CACHE_MAX_THREADS", "256"))
+THREAD_CONTEXT_CACHE_TTL_SEC = int(os.getenv("THREAD_CONTEXT_CACHE_TTL_SEC", "300"))
 
 NOTION_API_BASE_URL = os.getenv("NOTION_API_BASE_URL", "https://api.notion.com/v1").rstrip("/")
 NOTION_API_VERSION = os.getenv("NOTION_API_VERSION", "2022-06-28").strip()
@@ -93,6 +101,9 @@ DB_QUERY_TIMEOUT_SEC = int(os.getenv("DB_QUERY_TIMEOUT_SEC", "8"))
 DB_QUERY_MAX_ROWS = int(os.getenv("DB_QUERY_MAX_ROWS", "20"))
 DB_QUERY_MAX_SQL_CHARS = int(os.getenv("DB_QUERY_MAX_SQL_CHARS", "600"))
 DB_QUERY_MAX_RESULT_CHARS = int(os.getenv("DB_QUERY_MAX_RESULT_CHARS", "2500"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "8"))
+DB_POOL_MAX_IDLE_SEC = int(os.getenv("DB_POOL_MAX_IDLE_SEC", "300"))
+DB_POOL_PING_INTERVAL_SEC = int(os.getenv("DB_POOL_PING_INTERVAL_SEC", "30"))
 
 S3_QUERY_ENABLED = os.getenv("S3_QUERY_ENABLED", "").lower() in {"1", "true", "yes", "on"}
 AWS_REGION = os.getenv("AWS_REGION", "ap-northeast-2")
@@ -177,6 +188,30 @@ REQUEST_LOG_SQLITE_S3_RESTORE_ON_STARTUP = _getenv_any(
     "REQUEST_AUDIT_SQLITE_S3_RESTORE_ON_STARTUP",
     default="false",
 ).lower() in {"1", "true", "yes", "on"}
+REQUEST_LOG_SQLITE_S3_INCREMENTAL_ENABLED = os.getenv(
+    "REQUEST_LOG_SQLITE_S3_INCREMENTAL_ENABLED",
+    "false",
+).lower() in {"1", "true", "yes", "on"}
+REQUEST_LOG_SQLITE_S3_FULL_BACKUP_EVERY = int(os.getenv("REQUEST_LOG_SQLITE_S3_FULL_BACKUP_EVERY", "24"))
+REQUEST_LOG_SQLITE_S3_COMPRESSION = os.getenv("REQUEST_LOG_SQLITE_S3_COMPRESSION", "gzip").strip().lower()
+REQUEST_LOG_SQLITE_S3_MULTIPART_CHUNK_MB = int(os.getenv("REQUEST_LOG_SQLITE_S3_MULTIPART_CHUNK_MB", "8"))
+REQUEST_LOG_SQLITE_S3_RETENTION_COUNT = int(os.getenv("REQUEST_LOG_SQLITE_S3_RETENTION_COUNT", "0"))
+REQUEST_LOG_HOT_MONTHS = int(os.getenv("REQUEST_LOG_HOT_MONTHS", "0"))
+REQUEST_LOG_ARCHIVE_DIR = os.getenv("REQUEST_LOG_ARCHIVE_DIR", "").strip()
+REQUEST_LOG_EXPORT_DIR = os.getenv("REQUEST_LOG_EXPORT_DIR", "").strip()
+REQUEST_LOG_EXPORT_BATCH_ROWS = int(os.getenv("REQUEST_LOG_EXPORT_BATCH_ROWS", "5000"))
+REQUEST_LOG_EXPORT_COMPRESSION = os.getenv("REQUEST_LOG_EXPORT_COMPRESSION", "zstd").strip().lower()
+REQUEST_LOG_ASYNC_ENABLED = os.getenv("REQUEST_LOG_ASYNC_ENABLED", "true").lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+REQUEST_LOG_QUEUE_MAX_SIZE = int(os.getenv("REQUEST_LOG_QUEUE_MAX_SIZE", "1000"))
+REQUEST_LOG_QUEUE_PUT_TIMEOUT_MS = int(os.getenv("REQUEST_LOG_QUEUE_PUT_TIMEOUT_MS", "200"))
+REQUEST_LOG_BATCH_MAX_RECORDS = int(os.getenv("REQUEST_LOG_BATCH_MAX_RECORDS", "50"))
+REQUEST_LOG_BATCH_MAX_WAIT_MS = int(os.getenv("REQUEST_LOG_BATCH_MAX_WAIT_MS", "200"))
+REQUEST_LOG_SQLITE_READER_POOL_SIZE = int(os.getenv("REQUEST_LOG_SQLITE_READER_POOL_SIZE", "4"))
 
 # Backward-compatible aliases for earlier request audit naming.
 REQUEST_AUDIT_SQLITE_ENABLED = REQUEST_LOG_SQLITE_ENABLED
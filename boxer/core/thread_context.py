@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 from boxer.core import settings as s
@@ -20,36 +23,191 @@ def _trim_context_lines(lines: list[str], max_chars: int) -> str:
     return "\n".join(kept)
 
 
-def _load_thread_context(
+def _request_thread_messages(
+    client: Any,
+    channel_id: str,
+    thread_ts: str,
+    oldest: str | None = None,
+) -> list[dict[str, Any]]:
+    request: dict[str, Any] = {
+        "channel": channel_id,
+        "ts": thread_ts,
+        "limit": max(1, s.THREAD_CONTEXT_FETCH_LIMIT),
+        "inclusive": True,
+    }
+    if oldest:
+        request["oldest"] = oldest
+        request["inclusive"] = False
+    messages: list[dict[str, Any]] = []
+    while True:
+        replies = client.conversations_replies(**request)
+        page = replies.get("messages") or []
+        if isinstance(page, list):
+            messages.extend(msg for msg in page if isinstance(msg, dict))
+        # 이어 받기는 그 사이 쌓인 답글을 빠짐없이 받아야 해서 cursor를 끝까지 따라간다.
+        cursor = str((replies.get("response_metadata") or {}).get("next_cursor") or "")
+        if not oldest or not replies.get("has_more") or not cursor:
+            return messages
+        request["cursor"] = cursor
+
+
+def _merge_thread_messages(
+    cached: list[dict[str, Any]],
+    incoming: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    # ts가 같은 메시지는 새로 받은 쪽(수정본)으로 바꾸고, 최근 FETCH_LIMIT건만 남긴다.
+    by_ts = {str(msg.get("ts") or ""): msg for msg in cached}
+    for msg in incoming:
+        by_ts[str(msg.get("ts") or "")] = msg
+    merged = sorted(by_ts.values(), key=lambda msg: _safe_float(msg.get("ts") or ""))
+    return merged[-max(1, s.THREAD_CONTEXT_FETCH_LIMIT):]
+
+
+class _ThreadMessageCache:
+    # (channel, thread_ts)별 스레드 메시지를 프로세스 안에서 공유한다.
+    # TTL 안에서는 message 이벤트로만 갱신하고, TTL이 지나면 API로 받은 마지막 ts(synced_ts) 이후만 oldest로 이어 받는다.
+    # 이벤트는 빠질 수 있어서, 이벤트로 들어온 메시지는 synced_ts를 올리지 않는다.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
+    def get_messages(
+        self,
+        client: Any,
+        logger: logging.Logger,
+        channel_id: str,
+        thread_ts: str,
+    ) -> list[dict[str, Any]]:
+        key = (channel_id, thread_ts)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if time.monotonic() - entry["synced_at"] < max(0, s.THREAD_CONTEXT_CACHE_TTL_SEC):
+                    return list(entry["messages"])
+                cached_messages = list(entry["messages"])
+                oldest = entry["synced_ts"]
+            else:
+                cached_messages = []
+                oldest = None
+
+        try:
+            incoming = _request_thread_messages(client, channel_id, thread_ts, oldest=oldest)
+        except Exception:
+            logger.exception("Failed to fetch thread context")
+            # 이어 받기에 실패하면 갖고 있던 메시지라도 쓴다. 다음 호출에서 다시 시도한다.
+            return cached_messages
+
+        with self._lock:
+            # 받는 동안 이벤트로 들어온 메시지를 잃지 않게 지금 캐시에 합친다.
+            current = self._entries.get(key)
+            messages = _merge_thread_messages(
+                current["messages"] if current is not None else cached_messages,
+                incoming,
+            )
+            synced_ts = max(
+                [
+                    oldest or "",
+                    (current or {}).get("synced_ts") or "",
+                    *(str(msg.get("ts") or "") for msg in incoming),
+                ],
+                key=lambda ts: _safe_float(ts) if ts else -1.0,
+            )
+            self._entries[key] = {
+                "messages": messages,
+                "synced_at": time.monotonic(),
+                "synced_ts": synced_ts or None,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(1, s.THREAD_CONTEXT_CACHE_MAX_THREADS):
+                self._entries.popitem(last=False)
+        return list(messages)
+
+    def record_message(self, channel_id: str, thread_ts: str, message: dict[str, Any]) -> None:
+        # 이미 받아 둔 스레드에만 반영한다. 처음 보는 스레드는 중간부터 쌓이지 않게 건너뛴다.
+        with self._lock:
+            entry = self._entries.get((channel_id, thread_ts))
+            if entry is not None:
+                entry["messages"] = _merge_thread_messages(entry["messages"], [message])
+
+    def mark_stale(self, channel_id: str, thread_ts: str) -> None:
+        # 이벤트만으로 반영할 수 없는 변경이면 TTL을 끝내서, 다음 조회가 synced_ts 이후를 API로 이어 받게 한다.
+        with self._lock:
+            entry = self._entries.get((channel_id, thread_ts))
+            if entry is not None:
+                entry["synced_at"] = float("-inf")
+
+    def forget_message(self, channel_id: str, thread_ts: str, message_ts: str) -> None:
+        with self._lock:
+            entry = self._entries.get((channel_id, thread_ts))
+            if entry is not None:
+                entry["messages"] = [
+                    msg for msg in entry["messages"] if str(msg.get("ts") or "") != message_ts
+                ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_THREAD_MESSAGE_CACHE = _ThreadMessageCache()
+
+
+def _fetch_thread_messages(
     client: Any,
     logger: logging.Logger,
     channel_id: str,
     thread_ts: str | None,
-    current_ts: str | None,
-) -> str:
+) -> list[dict[str, Any]]:
     if not channel_id or not thread_ts:
-        return ""
+        return []
+
+    if s.THREAD_CONTEXT_CACHE_MAX_THREADS > 0:
+        return _THREAD_MESSAGE_CACHE.get_messages(client, logger, channel_id, thread_ts)
 
     try:
-        replies = client.conversations_replies(
-            channel=channel_id,
-            ts=thread_ts,
-            limit=max(1, s.THREAD_CONTEXT_FETCH_LIMIT),
-            inclusive=True,
-        )
+        return _request_thread_messages(client, channel_id, thread_ts)
     except Exception:
         logger.exception("Failed to fetch thread context")
-        return ""
+        return []
 
-    messages = replies.get("messages") or []
-    if not isinstance(messages, list):
-        return ""
 
+# 이벤트 본문을 그대로 스레드 메시지로 쓸 수 있는 subtype. 나머지는 캐시를 stale로 두고 API로 다시 받는다.
+_THREAD_MESSAGE_EVENT_SUBTYPES = frozenset({"", "bot_message", "thread_broadcast", "file_share", "me_message"})
+
+
+def _record_thread_message_event(event: dict[str, Any]) -> None:
+    # Slack message 이벤트로 캐시된 스레드를 바로 갱신해서, 이어지는 멘션이 API를 다시 부르지 않게 한다.
+    channel_id = str(event.get("channel") or "").strip()
+    subtype = str(event.get("subtype") or "").strip()
+    if not channel_id or s.THREAD_CONTEXT_CACHE_MAX_THREADS <= 0:
+        return
+    if subtype == "message_changed":
+        message = event.get("message")
+        if isinstance(message, dict) and message.get("thread_ts"):
+            _THREAD_MESSAGE_CACHE.record_message(channel_id, str(message["thread_ts"]), message)
+        return
+    if subtype == "message_deleted":
+        previous = event.get("previous_message")
+        if isinstance(previous, dict) and previous.get("thread_ts"):
+            _THREAD_MESSAGE_CACHE.forget_message(
+                channel_id,
+                str(previous["thread_ts"]),
+                str(event.get("deleted_ts") or ""),
+            )
+        return
+    if not event.get("thread_ts"):
+        return
+    if subtype in _THREAD_MESSAGE_EVENT_SUBTYPES:
+        _THREAD_MESSAGE_CACHE.record_message(channel_id, str(event["thread_ts"]), event)
+    else:
+        _THREAD_MESSAGE_CACHE.mark_stale(channel_id, str(event["thread_ts"]))
+
+
+def _render_thread_context(messages: list[dict[str, Any]], current_ts: str | None) -> str:
     filtered: list[dict[str, Any]] = []
     current_ts_float = _safe_float(current_ts or "")
     for msg in messages:
-        if not isinstance(msg, dict):
-            continue
         msg_ts = _safe_float(msg.get("ts") or "")
         if current_ts and msg_ts >= current_ts_float:
             continue
@@ -75,6 +233,52 @@ def _load_thread_context(
     return _trim_context_lines(lines, max(1, s.THREAD_CONTEXT_MAX_CHARS))
 
 
+def _load_thread_context(
+    client: Any,
+    logger: logging.Logger,
+    channel_id: str,
+    thread_ts: str | None,
+    current_ts: str | None,
+) -> str:
+    messages = _fetch_thread_messages(client, logger, channel_id, thread_ts)
+    return _render_thread_context(messages, current_ts)
+
+
+class _ThreadContextLoader:
+    # 한 요청 안에서 여러 분기가 같은 스레드 맥락을 찾아도 conversations_replies는 한 번만 부른다.
+    def __init__(
+        self,
+        client: Any,
+        logger: logging.Logger,
+        channel_id: str,
+        thread_ts: str | None,
+        current_ts: str | None,
+    ) -> None:
+        self._client = client
+        self._logger = logger
+        self._channel_id = channel_id
+        self._thread_ts = thread_ts
+        self._current_ts = current_ts
+        self._messages: list[dict[str, Any]] | None = None
+        self._rendered: str | None = None
+
+    def messages(self) -> list[dict[str, Any]]:
+        # 조회 실패도 빈 목록으로 기억해서 같은 요청 안에서 다시 호출하지 않는다.
+        if self._messages is None:
+            self._messages = _fetch_thread_messages(
+                self._client,
+                self._logger,
+                self._channel_id,
+                self._thread_ts,
+            )
+        return self._messages
+
+    def load(self) -> str:
+        if self._rendered is None:
+            self._rendered = _render_thread_context(self.messages(), self._current_ts)
+        return self._rendered
+
+
 def _build_model_input(question: str, thread_context: str) -> str:
     base_question = (question or "").strip()
     if not thread_context:
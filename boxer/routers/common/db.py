@@ -1,12 +1,18 @@
+import atexit
+import threading
+import time
 from typing import Any
 
 import pymysql
 
 from boxer.core import settings as s
 
+_DB_POOLS: dict[tuple[Any, ...], "_DbConnectionPool"] = {}
+_DB_POOLS_LOCK = threading.Lock()
+_DB_POOLS_ATEXIT_REGISTERED = False
 
-def _create_db_connection(timeout_sec: int | None = None) -> Any:
-    actual_timeout = max(1, timeout_sec if timeout_sec is not None else s.DB_QUERY_TIMEOUT_SEC)
+
+def _open_db_connection(actual_timeout: int) -> Any:
     connection = pymysql.connect(
         host=s.DB_HOST,
         port=s.DB_PORT,
@@ -30,6 +36,137 @@ def _create_db_connection(timeout_sec: int | None = None) -> Any:
     return connection
 
 
+def _close_db_connection_quietly(connection: Any) -> None:
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+class _PooledDbConnection:
+    # close()가 실제로 끊지 않고 풀에 반납하도록 감싼다. 나머지 속성은 원본 커넥션으로 넘긴다.
+    def __init__(self, pool: "_DbConnectionPool", connection: Any) -> None:
+        self._pool = pool
+        self._connection = connection
+
+    def __getattr__(self, name: str) -> Any:
+        connection = self.__dict__.get("_connection")
+        if connection is None:
+            raise pymysql.err.InterfaceError("이미 반납한 DB 커넥션이야")
+        return getattr(connection, name)
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            self._pool.release(connection)
+
+    def __enter__(self) -> "_PooledDbConnection":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+class _DbConnectionPool:
+    def __init__(
+        self,
+        timeout_sec: int,
+        *,
+        max_size: int,
+        max_idle_sec: int,
+        ping_interval_sec: int,
+    ) -> None:
+        self._timeout_sec = timeout_sec
+        self._max_idle_sec = max(1, max_idle_sec)
+        self._ping_interval_sec = max(0, ping_interval_sec)
+        self._slots = threading.BoundedSemaphore(max(1, max_size))
+        self._lock = threading.Lock()
+        # 마지막에 반납한 커넥션부터 재사용해서 오래 놀던 커넥션이 자연스럽게 만료되게 한다.
+        self._idle: list[tuple[Any, float]] = []
+
+    def acquire(self) -> _PooledDbConnection:
+        if not self._slots.acquire(timeout=self._timeout_sec):
+            raise RuntimeError("DB 커넥션을 기다리다 시간이 초과됐어")
+        try:
+            return _PooledDbConnection(self, self._checkout())
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _checkout(self) -> Any:
+        while True:
+            with self._lock:
+                idle_entry = self._idle.pop() if self._idle else None
+            if idle_entry is None:
+                return _open_db_connection(self._timeout_sec)
+
+            connection, released_at = idle_entry
+            idle_sec = time.monotonic() - released_at
+            if idle_sec >= self._max_idle_sec:
+                _close_db_connection_quietly(connection)
+                continue
+            if idle_sec >= self._ping_interval_sec:
+                # reconnect=True면 read-only 세션 설정이 사라지므로 끊긴 커넥션은 버리고 새로 연다.
+                try:
+                    connection.ping(reconnect=False)
+                except pymysql.MySQLError:
+                    _close_db_connection_quietly(connection)
+                    continue
+            return connection
+
+    def release(self, connection: Any) -> None:
+        try:
+            if getattr(connection, "open", False):
+                with self._lock:
+                    self._idle.append((connection, time.monotonic()))
+            else:
+                _close_db_connection_quietly(connection)
+        finally:
+            self._slots.release()
+
+    def close_idle(self) -> None:
+        with self._lock:
+            idle_entries, self._idle = self._idle, []
+        for connection, _ in idle_entries:
+            _close_db_connection_quietly(connection)
+
+
+def _get_db_connection_pool(actual_timeout: int) -> _DbConnectionPool:
+    global _DB_POOLS_ATEXIT_REGISTERED
+    pool_key = (s.DB_HOST, s.DB_PORT, s.DB_USERNAME, s.DB_DATABASE, actual_timeout)
+    with _DB_POOLS_LOCK:
+        pool = _DB_POOLS.get(pool_key)
+        if pool is None:
+            if not _DB_POOLS_ATEXIT_REGISTERED:
+                # 프로세스가 끝날 때 놀고 있는 커넥션을 정상 종료(COM_QUIT)해서 서버에 끊긴 세션이 남지 않게 한다.
+                atexit.register(_close_db_connection_pools)
+                _DB_POOLS_ATEXIT_REGISTERED = True
+            pool = _DbConnectionPool(
+                actual_timeout,
+                max_size=s.DB_POOL_MAX_SIZE,
+                max_idle_sec=s.DB_POOL_MAX_IDLE_SEC,
+                ping_interval_sec=s.DB_POOL_PING_INTERVAL_SEC,
+            )
+            _DB_POOLS[pool_key] = pool
+    return pool
+
+
+def _close_db_connection_pools() -> None:
+    with _DB_POOLS_LOCK:
+        pools = list(_DB_POOLS.values())
+        _DB_POOLS.clear()
+    for pool in pools:
+        pool.close_idle()
+
+
+def _create_db_connection(timeout_sec: int | None = None) -> Any:
+    actual_timeout = max(1, timeout_sec if timeout_sec is not None else s.DB_QUERY_TIMEOUT_SEC)
+    if s.DB_POOL_MAX_SIZE <= 0:
+        return _open_db_connection(actual_timeout)
+    # 호출부는 기존처럼 close()만 부르면 되고, 실제 커넥션은 풀에 반납된다.
+    return _get_db_connection_pool(actual_timeout).acquire()
+
+
 def _validate_readonly_sql(raw_sql: str) -> str:
     sql = (raw_sql or "").strip()
     if not sql:
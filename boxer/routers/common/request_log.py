@@ -1,23 +1,52 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, TypedDict
 from zoneinfo import ZoneInfo
 
 from boxer.core import settings as s
+from boxer.routers.common.s3 import _build_s3_client
 from boxer.routers.common.sqlite_store import (
+    _backup_sqlite_incremental_to_s3,
     _backup_sqlite_to_s3,
+    _build_sqlite_archive_root,
+    _build_sqlite_incremental_root,
     _connect_sqlite,
+    _create_sqlite_temp_path,
+    _download_sqlite_from_s3,
+    _drop_sqlite_change_tracking,
+    _normalize_sqlite_compression,
+    _prune_sqlite_backups_in_s3,
+    _prune_sqlite_incremental_chains_in_s3,
+    _replace_sqlite_file,
+    _reset_sqlite_backup_state,
     _restore_sqlite_from_s3,
+    _restore_sqlite_incremental_from_s3,
     _resolve_sqlite_path,
+    _sqlite_change_tracking_statements,
+    _sqlite_object_key_for_compression,
+    _upload_sqlite_file_to_s3,
+    _validate_sqlite_file,
 )
 
 _REQUEST_LOG_TABLE_NAME = "request_log"
 _LEGACY_REQUEST_AUDIT_TABLE_NAME = "request_audit_log"
 _REQUEST_LOG_INDEX_PREFIX = _LEGACY_REQUEST_AUDIT_TABLE_NAME
-_REQUEST_LOG_SCHEMA_STATEMENTS = (
+_REQUEST_LOG_ROLLUP_TABLE_NAME = "request_log_daily_rollup"
+_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME = "request_log_daily_rollup_state"
+_REQUEST_LOG_FTS_TABLE_NAME = "request_log_fts"
+_REQUEST_LOG_ARCHIVE_TABLE_NAME = "request_log_archive"
+# trigram 토크나이저는 3글자 미만 검색어를 인덱스로 찾지 못해서 LIKE로 보완한다.
+_REQUEST_LOG_FTS_MIN_TERM_CHARS = 3
+# 월별 아카이브 파일도 같은 테이블/인덱스 구성을 쓴다.
+_REQUEST_LOG_TABLE_STATEMENTS = (
     f"""
     CREATE TABLE IF NOT EXISTS {_REQUEST_LOG_TABLE_NAME} (
         seq INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -74,6 +103,176 @@ _REQUEST_LOG_SCHEMA_STATEMENTS = (
     ON {_REQUEST_LOG_TABLE_NAME}(sourcePlatform, channelId, threadId)
     """,
 )
+_REQUEST_LOG_SCHEMA_STATEMENTS = (
+    *_REQUEST_LOG_TABLE_STATEMENTS,
+    f"""
+    CREATE TABLE IF NOT EXISTS {_REQUEST_LOG_ROLLUP_TABLE_NAME} (
+        requestDateLocal TEXT NOT NULL,
+        routeName TEXT NOT NULL,
+        routeMode TEXT NOT NULL,
+        userId TEXT NOT NULL,
+        userLabel TEXT NOT NULL,
+        status TEXT NOT NULL,
+        requestCount INTEGER NOT NULL,
+        firstRequestedAtLocal TEXT,
+        lastRequestedAtLocal TEXT,
+        PRIMARY KEY (requestDateLocal, routeName, routeMode, userId, userLabel, status)
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME} (
+        requestDateLocal TEXT PRIMARY KEY,
+        dirty INTEGER NOT NULL DEFAULT 1,
+        rolledUpAtUtc TEXT
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {_REQUEST_LOG_ARCHIVE_TABLE_NAME} (
+        month TEXT PRIMARY KEY,
+        fileName TEXT NOT NULL,
+        rowCount INTEGER NOT NULL,
+        archivedAtUtc TEXT NOT NULL,
+        s3Key TEXT
+    )
+    """,
+)
+
+# 한국어 부분 일치 검색을 위해 trigram 토크나이저를 쓰고, 원본 테이블과는 트리거로 맞춘다.
+_REQUEST_LOG_FTS_STATEMENTS = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {_REQUEST_LOG_FTS_TABLE_NAME} USING fts5(
+        requestText,
+        normalizedQuestion,
+        content='{_REQUEST_LOG_TABLE_NAME}',
+        content_rowid='seq',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_REQUEST_LOG_FTS_TABLE_NAME}_after_insert
+    AFTER INSERT ON {_REQUEST_LOG_TABLE_NAME}
+    BEGIN
+        INSERT INTO {_REQUEST_LOG_FTS_TABLE_NAME}(rowid, requestText, normalizedQuestion)
+        VALUES (new.seq, new.requestText, new.normalizedQuestion);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_REQUEST_LOG_FTS_TABLE_NAME}_after_delete
+    AFTER DELETE ON {_REQUEST_LOG_TABLE_NAME}
+    BEGIN
+        INSERT INTO {_REQUEST_LOG_FTS_TABLE_NAME}({_REQUEST_LOG_FTS_TABLE_NAME}, rowid, requestText, normalizedQuestion)
+        VALUES ('delete', old.seq, old.requestText, old.normalizedQuestion);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {_REQUEST_LOG_FTS_TABLE_NAME}_after_update
+    AFTER UPDATE OF requestText, normalizedQuestion ON {_REQUEST_LOG_TABLE_NAME}
+    WHEN old.requestText IS NOT new.requestText
+      OR old.normalizedQuestion IS NOT new.normalizedQuestion
+    BEGIN
+        INSERT INTO {_REQUEST_LOG_FTS_TABLE_NAME}({_REQUEST_LOG_FTS_TABLE_NAME}, rowid, requestText, normalizedQuestion)
+        VALUES ('delete', old.seq, old.requestText, old.normalizedQuestion);
+        INSERT INTO {_REQUEST_LOG_FTS_TABLE_NAME}(rowid, requestText, normalizedQuestion)
+        VALUES (new.seq, new.requestText, new.normalizedQuestion);
+    END
+    """,
+)
+
+# 증분 백업 delta를 복원본에 적용하기 전에, 바뀌거나 지워질 행의 날짜를 롤업 dirty로 표시한다.
+_REQUEST_LOG_DELTA_REPLAY_STATEMENTS = (
+    f"""
+    INSERT INTO main.{_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME} (requestDateLocal, dirty)
+    SELECT requestDateLocal, 1 FROM delta.{_REQUEST_LOG_TABLE_NAME}
+    UNION
+    SELECT requestDateLocal, 1 FROM main.{_REQUEST_LOG_TABLE_NAME}
+    WHERE seq IN (SELECT rowKey FROM delta.deleted_keys)
+    ON CONFLICT(requestDateLocal) DO UPDATE SET dirty = 1
+    """,
+)
+
+# 저장된 행의 날짜를 dirty로 표시해 두면, 마감된 날짜만 골라 롤업을 다시 만든다.
+_REQUEST_LOG_ROLLUP_MARK_DIRTY_SQL = f"""
+INSERT INTO {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME} (requestDateLocal, dirty)
+VALUES (?, 1)
+ON CONFLICT(requestDateLocal) DO UPDATE SET dirty = 1
+"""
+
+
+def _request_log_rollup_rebuild_sql(source: str) -> str:
+    return f"""
+INSERT INTO {_REQUEST_LOG_ROLLUP_TABLE_NAME} (
+    requestDateLocal,
+    routeName,
+    routeMode,
+    userId,
+    userLabel,
+    status,
+    requestCount,
+    firstRequestedAtLocal,
+    lastRequestedAtLocal
+)
+SELECT
+    requestDateLocal,
+    routeName,
+    COALESCE(NULLIF(TRIM(routeMode), ''), ''),
+    userId,
+    COALESCE(NULLIF(TRIM(userName), ''), userId),
+    status,
+    COUNT(*),
+    MIN(createdAtLocal),
+    MAX(createdAtLocal)
+FROM {source}
+WHERE requestDateLocal = ?
+GROUP BY
+    requestDateLocal,
+    routeName,
+    COALESCE(NULLIF(TRIM(routeMode), ''), ''),
+    userId,
+    COALESCE(NULLIF(TRIM(userName), ''), userId),
+    status
+"""
+
+
+_REQUEST_LOG_ROLLUP_REBUILD_SQL = _request_log_rollup_rebuild_sql(_REQUEST_LOG_TABLE_NAME)
+_REQUEST_LOG_ROLLUP_SOURCE_COLUMNS = (
+    "requestDateLocal, routeName, routeMode, userId, userName, status, createdAtLocal"
+)
+
+_REQUEST_LOG_UPSERT_CONFLICT_SQL = f"""
+ON CONFLICT(sourcePlatform, channelId, messageId) DO UPDATE SET
+    routeName = CASE
+        WHEN excluded.routeName = 'unknown' THEN {_REQUEST_LOG_TABLE_NAME}.routeName
+        ELSE excluded.routeName
+    END,
+    routeMode = COALESCE(excluded.routeMode, {_REQUEST_LOG_TABLE_NAME}.routeMode),
+    handlerType = CASE
+        WHEN excluded.handlerType = 'unknown' THEN {_REQUEST_LOG_TABLE_NAME}.handlerType
+        ELSE excluded.handlerType
+    END,
+    status = excluded.status,
+    userName = COALESCE(excluded.userName, {_REQUEST_LOG_TABLE_NAME}.userName),
+    permalink = COALESCE(excluded.permalink, {_REQUEST_LOG_TABLE_NAME}.permalink),
+    threadPermalink = COALESCE(excluded.threadPermalink, {_REQUEST_LOG_TABLE_NAME}.threadPermalink),
+    normalizedQuestion = COALESCE(
+        excluded.normalizedQuestion,
+        {_REQUEST_LOG_TABLE_NAME}.normalizedQuestion
+    ),
+    requestKey = COALESCE(excluded.requestKey, {_REQUEST_LOG_TABLE_NAME}.requestKey),
+    subjectType = COALESCE(excluded.subjectType, {_REQUEST_LOG_TABLE_NAME}.subjectType),
+    subjectKey = COALESCE(excluded.subjectKey, {_REQUEST_LOG_TABLE_NAME}.subjectKey),
+    requestedDate = COALESCE(excluded.requestedDate, {_REQUEST_LOG_TABLE_NAME}.requestedDate),
+    replyCount = MAX({_REQUEST_LOG_TABLE_NAME}.replyCount, excluded.replyCount),
+    firstRepliedAtUtc = COALESCE(
+        {_REQUEST_LOG_TABLE_NAME}.firstRepliedAtUtc,
+        excluded.firstRepliedAtUtc
+    ),
+    firstRepliedAtLocal = COALESCE(
+        {_REQUEST_LOG_TABLE_NAME}.firstRepliedAtLocal,
+        excluded.firstRepliedAtLocal
+    ),
+    errorType = COALESCE(excluded.errorType, {_REQUEST_LOG_TABLE_NAME}.errorType),
+    metadataJson = COALESCE(excluded.metadataJson, {_REQUEST_LOG_TABLE_NAME}.metadataJson)
+"""
 
 _REQUEST_LOG_UPSERT_SQL = f"""
 INSERT INTO {_REQUEST_LOG_TABLE_NAME} (
@@ -137,40 +336,27 @@ INSERT INTO {_REQUEST_LOG_TABLE_NAME} (
     :errorType,
     :metadataJson
 )
-ON CONFLICT(sourcePlatform, channelId, messageId) DO UPDATE SET
-    routeName = CASE
-        WHEN excluded.routeName = 'unknown' THEN {_REQUEST_LOG_TABLE_NAME}.routeName
-        ELSE excluded.routeName
-    END,
-    routeMode = COALESCE(excluded.routeMode, {_REQUEST_LOG_TABLE_NAME}.routeMode),
-    handlerType = CASE
-        WHEN excluded.handlerType = 'unknown' THEN {_REQUEST_LOG_TABLE_NAME}.handlerType
-        ELSE excluded.handlerType
-    END,
-    status = excluded.status,
-    userName = COALESCE(excluded.userName, {_REQUEST_LOG_TABLE_NAME}.userName),
-    permalink = COALESCE(excluded.permalink, {_REQUEST_LOG_TABLE_NAME}.permalink),
-    threadPermalink = COALESCE(excluded.threadPermalink, {_REQUEST_LOG_TABLE_NAME}.threadPermalink),
-    normalizedQuestion = COALESCE(
-        excluded.normalizedQuestion,
-        {_REQUEST_LOG_TABLE_NAME}.normalizedQuestion
-    ),
-    requestKey = COALESCE(excluded.requestKey, {_REQUEST_LOG_TABLE_NAME}.requestKey),
-    subjectType = COALESCE(excluded.subjectType, {_REQUEST_LOG_TABLE_NAME}.subjectType),
-    subjectKey = COALESCE(excluded.subjectKey, {_REQUEST_LOG_TABLE_NAME}.subjectKey),
-    requestedDate = COALESCE(excluded.requestedDate, {_REQUEST_LOG_TABLE_NAME}.requestedDate),
-    replyCount = MAX({_REQUEST_LOG_TABLE_NAME}.replyCount, excluded.replyCount),
-    firstRepliedAtUtc = COALESCE(
-        {_REQUEST_LOG_TABLE_NAME}.firstRepliedAtUtc,
-        excluded.firstRepliedAtUtc
-    ),
-    firstRepliedAtLocal = COALESCE(
-        {_REQUEST_LOG_TABLE_NAME}.firstRepliedAtLocal,
-        excluded.firstRepliedAtLocal
-    ),
-    errorType = COALESCE(excluded.errorType, {_REQUEST_LOG_TABLE_NAME}.errorType),
-    metadataJson = COALESCE(excluded.metadataJson, {_REQUEST_LOG_TABLE_NAME}.metadataJson)
+""" + _REQUEST_LOG_UPSERT_CONFLICT_SQL
+
+
+_REQUEST_LOG_UPSERT_RETURNING_SQL = (
+    _REQUEST_LOG_UPSERT_SQL
+    + "RETURNING seq, createdAtUtc, routeName, handlerType, status, replyCount, userName, requestDateLocal\n"
+)
+_REQUEST_LOG_SAVED_ROW_SQL = f"""
+SELECT seq, createdAtUtc, routeName, handlerType, status, replyCount, userName, requestDateLocal
+FROM {_REQUEST_LOG_TABLE_NAME}
+WHERE sourcePlatform = :sourcePlatform
+  AND channelId = :channelId
+  AND messageId = :messageId
 """
+# upsert ... RETURNING은 SQLite 3.35부터 지원한다.
+_SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+# 같은 CTE를 여러 번 참조해도 테이블은 한 번만 읽도록 MATERIALIZED 힌트를 준다(3.35+).
+_SQLITE_MATERIALIZED_HINT = "MATERIALIZED " if _SQLITE_SUPPORTS_RETURNING else ""
+
+_REQUEST_LOG_STORES: dict[Path, "_RequestLogStore"] = {}
+_REQUEST_LOG_STORES_LOCK = threading.Lock()
 
 
 class RequestLogRecord(TypedDict, total=False):
@@ -361,47 +547,461 @@ def _ensure_request_log_columns(connection) -> None:
         )
 
 
-def _ensure_request_log_schema(
-    db_path: str | Path | None = None,
-) -> Path:
-    actual_path = _request_log_db_path(db_path)
-    connection = _connect_sqlite(actual_path, row_factory=False)
+def _sqlite_table_exists(connection: sqlite3.Connection, table_name: str) -> bool:
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table_name,),
+    ).fetchone()
+    return row is not None
+
+
+def _ensure_request_log_fts(connection: sqlite3.Connection) -> bool:
+    fts_existed = _sqlite_table_exists(connection, _REQUEST_LOG_FTS_TABLE_NAME)
+    try:
+        for statement in _REQUEST_LOG_FTS_STATEMENTS:
+            connection.execute(statement)
+    except sqlite3.OperationalError:
+        # FTS5/trigram을 지원하지 않는 SQLite 빌드에서는 LIKE 검색으로만 동작한다.
+        return False
+    if not fts_existed:
+        connection.execute(
+            f"INSERT INTO {_REQUEST_LOG_FTS_TABLE_NAME}({_REQUEST_LOG_FTS_TABLE_NAME}) VALUES ('rebuild')"
+        )
+    return True
+
+
+def _ensure_request_log_change_tracking(connection: sqlite3.Connection) -> None:
+    # 증분 백업을 끄면 변경 기록이 쌓이지 않게 지우고, 다시 켜면 상태가 비어 있어 base부터 새로 올린다.
+    if not s.REQUEST_LOG_SQLITE_S3_INCREMENTAL_ENABLED:
+        _drop_sqlite_change_tracking(connection, _REQUEST_LOG_TABLE_NAME)
+        return
+    for statement in _sqlite_change_tracking_statements(_REQUEST_LOG_TABLE_NAME, "seq"):
+        connection.execute(statement)
+
+
+def _request_log_archive_dir(db_path: Path) -> Path:
+    if s.REQUEST_LOG_ARCHIVE_DIR:
+        return _resolve_sqlite_path(s.REQUEST_LOG_ARCHIVE_DIR)
+    return db_path.with_name(f"{db_path.stem}-archive")
+
+
+def _request_log_archive_file_name(db_path: Path, month: str) -> str:
+    return f"{db_path.stem}-{month}{db_path.suffix or '.sqlite3'}"
+
+
+def _prepare_request_log_archive_file(archive_path: Path) -> None:
+    # 아카이브는 다 쓰고 나면 읽기만 하므로 WAL 없이 단일 파일로 둔다. 그래야 그대로 S3에 올릴 수 있다.
+    connection = _connect_sqlite(archive_path, row_factory=False, wal_enabled=False)
     try:
-        _migrate_legacy_request_audit_table(connection)
-        for statement in _REQUEST_LOG_SCHEMA_STATEMENTS:
+        connection.execute("PRAGMA journal_mode = DELETE")
+        for statement in _REQUEST_LOG_TABLE_STATEMENTS:
             connection.execute(statement)
         _ensure_request_log_columns(connection)
+        _ensure_request_log_fts(connection)
     finally:
         connection.close()
-    return actual_path
 
 
-def _save_request_log_record(
-    record: RequestLogRecord,
-    *,
-    db_path: str | Path | None = None,
-) -> dict[str, Any]:
-    actual_path = _ensure_request_log_schema(db_path)
-    normalized_record = _normalize_request_log_record(record)
-    connection = _connect_sqlite(actual_path, row_factory=False)
+def _request_log_file_identity(db_path: Path) -> tuple[int, int] | None:
     try:
-        cursor = connection.execute(_REQUEST_LOG_UPSERT_SQL, normalized_record)
-        row = connection.execute(
+        stat_result = os.stat(db_path)
+    except FileNotFoundError:
+        return None
+    return stat_result.st_dev, stat_result.st_ino
+
+
+class _RequestLogStore:
+    # 프로세스당 DB 파일 하나에 하나씩 두고, 스키마 준비와 쓰기 커넥션을 재사용한다.
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._file_identity: tuple[int, int] | None = None
+        self._readers: list[sqlite3.Connection] = []
+        self.fts_enabled = False
+        # 파일이 바뀌어 커넥션을 다시 열 때마다 올려서, 이전 세대의 읽기 커넥션은 반납 시 닫는다.
+        self._generation = 0
+
+    def _prepare_locked(self) -> sqlite3.Connection:
+        # S3 복원 등으로 파일이 바뀌었으면 커넥션을 다시 열고 마이그레이션도 다시 돌린다.
+        file_identity = _request_log_file_identity(self.db_path)
+        if self._writer is not None and file_identity is not None and file_identity == self._file_identity:
+            return self._writer
+
+        self._close_locked()
+        connection = _connect_sqlite(self.db_path, row_factory=False, check_same_thread=False)
+        try:
+            _migrate_legacy_request_audit_table(connection)
+            rollup_existed = _sqlite_table_exists(connection, _REQUEST_LOG_ROLLUP_STATE_TABLE_NAME)
+            for statement in _REQUEST_LOG_SCHEMA_STATEMENTS:
+                connection.execute(statement)
+            _ensure_request_log_columns(connection)
+            if not rollup_existed:
+                # 롤업 도입 전에 쌓인 날짜들은 처음 한 번만 dirty로 채워 둔다.
+                connection.execute(
+                    f"""
+                    INSERT OR IGNORE INTO {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME} (requestDateLocal, dirty)
+                    SELECT DISTINCT requestDateLocal, 1 FROM {_REQUEST_LOG_TABLE_NAME}
+                    """
+                )
+            self.fts_enabled = _ensure_request_log_fts(connection)
+            _ensure_request_log_change_tracking(connection)
+        except Exception:
+            connection.close()
+            raise
+        self._writer = connection
+        self._file_identity = _request_log_file_identity(self.db_path)
+        return connection
+
+    def _close_locked(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        for reader in self._readers:
+            reader.close()
+        self._readers = []
+        self._writer = None
+        self._file_identity = None
+        self._generation += 1
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._prepare_locked()
+            generation = self._generation
+            connection = self._readers.pop() if self._readers else None
+        if connection is None:
+            connection = _connect_sqlite(
+                self.db_path,
+                row_factory=True,
+                wal_enabled=False,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA query_only = ON")
+
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+
+        with self._lock:
+            if generation == self._generation and len(self._readers) < max(
+                0, s.REQUEST_LOG_SQLITE_READER_POOL_SIZE
+            ):
+                self._readers.append(connection)
+                connection = None
+        if connection is not None:
+            connection.close()
+
+    def ensure_schema(self) -> Path:
+        with self._lock:
+            self._prepare_locked()
+        return self.db_path
+
+    def upsert(self, normalized_record: dict[str, Any]) -> tuple[int, tuple[Any, ...] | None]:
+        return self.upsert_many([normalized_record])[0]
+
+    def upsert_many(
+        self,
+        normalized_records: list[dict[str, Any]],
+    ) -> list[tuple[int, tuple[Any, ...] | None]]:
+        with self._lock:
+            connection = self._prepare_locked()
+            results: list[tuple[int, tuple[Any, ...] | None]] = []
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for normalized_record in normalized_records:
+                    if _SQLITE_SUPPORTS_RETURNING:
+                        row = connection.execute(
+                            _REQUEST_LOG_UPSERT_RETURNING_SQL,
+                            normalized_record,
+                        ).fetchone()
+                        rowcount = 1 if row is not None else 0
+                    else:
+                        cursor = connection.execute(_REQUEST_LOG_UPSERT_SQL, normalized_record)
+                        row = connection.execute(_REQUEST_LOG_SAVED_ROW_SQL, normalized_record).fetchone()
+                        rowcount = cursor.rowcount
+                    connection.execute(
+                        _REQUEST_LOG_ROLLUP_MARK_DIRTY_SQL,
+                        (row[7] if row else normalized_record["requestDateLocal"],),
+                    )
+                    results.append((rowcount, row))
+                connection.execute("COMMIT")
+            except Exception:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+            return results
+
+    def compact_daily_rollup(self, today_local: str) -> list[str]:
+        # 오늘 이전(마감된) 날짜 중 dirty인 날짜만 원본에서 다시 집계한다.
+        # S3에서 받아야 하는 아카이브는 락 밖에서 먼저 받아 두고, writer 락은 롤업을 쓰는 동안만 잡는다.
+        archive_paths = self._resolve_dirty_archive_files(today_local)
+        if archive_paths is None:
+            return []
+        with self._lock:
+            connection = self._prepare_locked()
+            dirty_dates = [
+                str(row[0])
+                for row in connection.execute(
+                    f"""
+                    SELECT requestDateLocal
+                    FROM {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME}
+                    WHERE dirty = 1 AND requestDateLocal < ?
+                    ORDER BY requestDateLocal
+                    """,
+                    (today_local,),
+                ).fetchall()
+            ]
+            if not dirty_dates:
+                return []
+
+            # 이미 아카이브된 달에 늦게 들어온 행은 아카이브로 합친 뒤 아카이브 파일에서 다시 집계한다.
+            rebuild_sql_by_month = self._fold_archived_months_locked(
+                connection,
+                sorted({date_label[:7] for date_label in dirty_dates}),
+                archive_paths,
+            )
+            rolled_up_at = _render_iso(datetime.now(timezone.utc).replace(microsecond=0))
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    for date_label in dirty_dates:
+                        connection.execute(
+                            f"DELETE FROM {_REQUEST_LOG_ROLLUP_TABLE_NAME} WHERE requestDateLocal = ?",
+                            (date_label,),
+                        )
+                        connection.execute(
+                            rebuild_sql_by_month.get(date_label[:7], _REQUEST_LOG_ROLLUP_REBUILD_SQL),
+                            (date_label,),
+                        )
+                        connection.execute(
+                            f"""
+                            UPDATE {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME}
+                            SET dirty = 0, rolledUpAtUtc = ?
+                            WHERE requestDateLocal = ?
+                            """,
+                            (rolled_up_at, date_label),
+                        )
+                    connection.execute("COMMIT")
+                except Exception:
+                    if connection.in_transaction:
+                        connection.execute("ROLLBACK")
+                    raise
+            finally:
+                for index in range(len(rebuild_sql_by_month)):
+                    connection.execute(f"DETACH DATABASE archive_{index}")
+            return dirty_dates
+
+    def _resolve_dirty_archive_files(self, today_local: str) -> dict[str, Path] | None:
+        # dirty 날짜가 없으면 None을 돌려준다. 읽기 커넥션만 쓰므로 writer와 경합하지 않는다.
+        with self.reader() as connection:
+            has_dirty = connection.execute(
+                f"""
+                SELECT 1 FROM {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME}
+                WHERE dirty = 1 AND requestDateLocal < ?
+                LIMIT 1
+                """,
+                (today_local,),
+            ).fetchone()
+            if has_dirty is None:
+                return None
+            archive_rows = connection.execute(
+                f"""
+                SELECT month, fileName, s3Key
+                FROM {_REQUEST_LOG_ARCHIVE_TABLE_NAME}
+                WHERE month IN (
+                    SELECT DISTINCT substr(requestDateLocal, 1, 7)
+                    FROM {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME}
+                    WHERE dirty = 1 AND requestDateLocal < ?
+                )
+                """,
+                (today_local,),
+            ).fetchall()
+        archive_paths: dict[str, Path] = {}
+        for month, file_name, s3_key in archive_rows:
+            archive_path = _ensure_request_log_archive_file(self.db_path, str(file_name), s3_key)
+            if archive_path is not None:
+                archive_paths[str(month)] = archive_path
+        return archive_paths
+
+    def _fold_archived_months_locked(
+        self,
+        connection: sqlite3.Connection,
+        months: list[str],
+        archive_paths: dict[str, Path],
+    ) -> dict[str, str]:
+        if not months:
+            return {}
+        placeholders = ", ".join("?" for _ in months)
+        archive_rows = connection.execute(
             f"""
-            SELECT seq, createdAtUtc, routeName, handlerType, status, replyCount, userName
-            FROM {_REQUEST_LOG_TABLE_NAME}
-            WHERE sourcePlatform = :sourcePlatform
-              AND channelId = :channelId
-              AND messageId = :messageId
+            SELECT month, fileName, s3Key
+            FROM {_REQUEST_LOG_ARCHIVE_TABLE_NAME}
+            WHERE month IN ({placeholders})
+            ORDER BY month
             """,
-            normalized_record,
+            months,
+        ).fetchall()
+        rebuild_sql_by_month: dict[str, str] = {}
+        for month, file_name, _ in archive_rows:
+            # 락 밖에서 받아 둔 파일을 쓰고, 그 사이 새로 아카이브된 달은 로컬 파일만 본다.
+            archive_path = archive_paths.get(str(month))
+            if archive_path is None:
+                archive_path = _request_log_archive_dir(self.db_path) / str(file_name)
+                if not archive_path.exists():
+                    continue
+            self._archive_month_locked(connection, str(month), archive_path)
+            alias = f"archive_{len(rebuild_sql_by_month)}"
+            connection.execute(f"ATTACH DATABASE ? AS {alias}", (str(archive_path),))
+            rebuild_sql_by_month[str(month)] = _request_log_rollup_rebuild_sql(
+                f"{alias}.{_REQUEST_LOG_TABLE_NAME}"
+            )
+        return rebuild_sql_by_month
+
+    def archive_month(self, month: str, archive_path: Path) -> int:
+        with self._lock:
+            return self._archive_month_locked(self._prepare_locked(), month, archive_path)
+
+    def _archive_month_locked(
+        self,
+        connection: sqlite3.Connection,
+        month: str,
+        archive_path: Path,
+    ) -> int:
+        # 한 달치 행을 아카이브 파일로 옮기고 hot 파일에서는 지운다.
+        # 두 파일에 걸친 커밋이 중간에 끊겨도 다음 실행의 upsert가 중복을 합쳐 준다.
+        month_start = f"{month}-01"
+        next_month_start = _shift_request_log_month(month_start, 1)
+        month_range = (month_start, next_month_start)
+        has_rows = connection.execute(
+            f"""
+            SELECT 1 FROM {_REQUEST_LOG_TABLE_NAME}
+            WHERE requestDateLocal >= ? AND requestDateLocal < ?
+            LIMIT 1
+            """,
+            month_range,
         ).fetchone()
-    finally:
-        connection.close()
+        if has_rows is None:
+            return 0
+
+        _prepare_request_log_archive_file(archive_path)
+        columns = ", ".join(
+            str(row[1])
+            for row in connection.execute(
+                f"PRAGMA main.table_info({_REQUEST_LOG_TABLE_NAME})"
+            ).fetchall()
+        )
+        archived_at = _render_iso(datetime.now(timezone.utc).replace(microsecond=0))
+        connection.execute("ATTACH DATABASE ? AS archive", (str(archive_path),))
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    f"""
+                    INSERT INTO archive.{_REQUEST_LOG_TABLE_NAME} ({columns})
+                    SELECT {columns}
+                    FROM main.{_REQUEST_LOG_TABLE_NAME}
+                    WHERE requestDateLocal >= ? AND requestDateLocal < ?
+                    ORDER BY seq
+                    {_REQUEST_LOG_UPSERT_CONFLICT_SQL}
+                    """,
+                    month_range,
+                )
+                moved_count = connection.execute(
+                    f"""
+                    DELETE FROM main.{_REQUEST_LOG_TABLE_NAME}
+                    WHERE requestDateLocal >= ? AND requestDateLocal < ?
+                    """,
+                    month_range,
+                ).rowcount
+                row_count = connection.execute(
+                    f"SELECT COUNT(*) FROM archive.{_REQUEST_LOG_TABLE_NAME}"
+                ).fetchone()[0]
+                # 내용이 바뀐 달은 S3 사본이 낡았으므로 다시 올릴 때까지 s3Key를 비워 둔다.
+                connection.execute(
+                    f"""
+                    INSERT INTO main.{_REQUEST_LOG_ARCHIVE_TABLE_NAME}
+                        (month, fileName, rowCount, archivedAtUtc, s3Key)
+                    VALUES (?, ?, ?, ?, NULL)
+                    ON CONFLICT(month) DO UPDATE SET
+                        fileName = excluded.fileName,
+                        rowCount = excluded.rowCount,
+                        archivedAtUtc = excluded.archivedAtUtc,
+                        s3Key = NULL
+                    """,
+                    (month, archive_path.name, int(row_count), archived_at),
+                )
+                # 지운 행과 레지스트리 변경을 delta만으로는 복원할 수 없으니 다음 백업은 새 base로 뜬다.
+                _reset_sqlite_backup_state(connection, _REQUEST_LOG_TABLE_NAME)
+                connection.execute("COMMIT")
+            except Exception:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+        finally:
+            connection.execute("DETACH DATABASE archive")
+        return int(moved_count)
+
+    def record_archive_upload(self, month: str, s3_key: str) -> None:
+        with self._lock:
+            connection = self._prepare_locked()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    f"UPDATE {_REQUEST_LOG_ARCHIVE_TABLE_NAME} SET s3Key = ? WHERE month = ?",
+                    (s3_key, month),
+                )
+                _reset_sqlite_backup_state(connection, _REQUEST_LOG_TABLE_NAME)
+                connection.execute("COMMIT")
+            except Exception:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+
+    def vacuum(self) -> None:
+        # 옮긴 만큼 줄어든 페이지를 돌려줘야 hot 파일이 실제로 작아진다.
+        with self._lock:
+            self._prepare_locked().execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+
+def _get_request_log_store(db_path: str | Path | None = None) -> _RequestLogStore:
+    actual_path = _request_log_db_path(db_path)
+    with _REQUEST_LOG_STORES_LOCK:
+        store = _REQUEST_LOG_STORES.get(actual_path)
+        if store is None:
+            store = _RequestLogStore(actual_path)
+            _REQUEST_LOG_STORES[actual_path] = store
+    return store
+
+
+def _close_request_log_stores() -> None:
+    with _REQUEST_LOG_STORES_LOCK:
+        stores = list(_REQUEST_LOG_STORES.values())
+        _REQUEST_LOG_STORES.clear()
+    for store in stores:
+        store.close()
+
+
+def _ensure_request_log_schema(
+    db_path: str | Path | None = None,
+) -> Path:
+    return _get_request_log_store(db_path).ensure_schema()
+
 
+def _build_request_log_save_result(
+    db_path: Path,
+    normalized_record: dict[str, Any],
+    rowcount: int,
+    row: tuple[Any, ...] | None,
+) -> dict[str, Any]:
     return {
-        "dbPath": str(actual_path),
-        "rowcount": cursor.rowcount,
+        "dbPath": str(db_path),
+        "rowcount": rowcount,
         "seq": row[0] if row else None,
         "createdAtUtc": row[1] if row else None,
         "routeName": row[2] if row else normalized_record["routeName"],
@@ -409,7 +1009,35 @@ def _save_request_log_record(
         "status": row[4] if row else normalized_record["status"],
         "replyCount": row[5] if row else normalized_record["replyCount"],
         "userName": row[6] if row else normalized_record["userName"],
-}
+    }
+
+
+def _save_request_log_record(
+    record: RequestLogRecord,
+    *,
+    db_path: str | Path | None = None,
+) -> dict[str, Any]:
+    store = _get_request_log_store(db_path)
+    normalized_record = _normalize_request_log_record(record)
+    rowcount, row = store.upsert(normalized_record)
+    return _build_request_log_save_result(store.db_path, normalized_record, rowcount, row)
+
+
+def _save_request_log_records(
+    records: list[RequestLogRecord],
+    *,
+    db_path: str | Path | None = None,
+) -> list[dict[str, Any]]:
+    # 여러 건을 트랜잭션 하나로 묶어 저장한다. 한 건이라도 실패하면 전체를 되돌린다.
+    if not records:
+        return []
+    store = _get_request_log_store(db_path)
+    normalized_records = [_normalize_request_log_record(record) for record in records]
+    results = store.upsert_many(normalized_records)
+    return [
+        _build_request_log_save_result(store.db_path, normalized_record, rowcount, row)
+        for normalized_record, (rowcount, row) in zip(normalized_records, results)
+    ]
 
 
 def _build_request_log_filter_clause(
@@ -448,24 +1076,150 @@ def _build_request_log_filter_clause(
     return f"WHERE {' AND '.join(clauses)}", parameters
 
 
+def _ensure_request_log_archive_file(
+    db_path: Path,
+    file_name: str,
+    s3_key: str | None,
+) -> Path | None:
+    # 로컬에 없는 아카이브는 처음 필요할 때 S3에서 받아 둔다.
+    archive_path = _request_log_archive_dir(db_path) / file_name
+    if archive_path.exists():
+        return archive_path
+    bucket = str(s.REQUEST_LOG_SQLITE_S3_BACKUP_BUCKET or "").strip()
+    if not s3_key or not bucket:
+        return None
+
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _create_sqlite_temp_path(archive_path, "download")
+    try:
+        verified = _download_sqlite_from_s3(
+            _build_s3_client(),
+            bucket=bucket,
+            object_key=str(s3_key),
+            target_path=temp_path,
+        )
+        if not verified:
+            _validate_sqlite_file(temp_path)
+        _replace_sqlite_file(temp_path, archive_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return archive_path
+
+
+def _select_request_log_archive_rows(
+    connection: sqlite3.Connection,
+    *,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> list[sqlite3.Row]:
+    clauses: list[str] = []
+    parameters: list[Any] = []
+    if date_from:
+        clauses.append("month >= ?")
+        parameters.append(str(date_from)[:7])
+    if date_to:
+        clauses.append("month <= ?")
+        parameters.append(str(date_to)[:7])
+    where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return connection.execute(
+        f"""
+        SELECT fileName, s3Key
+        FROM {_REQUEST_LOG_ARCHIVE_TABLE_NAME}
+        {where_clause}
+        ORDER BY month DESC
+        """,
+        parameters,
+    ).fetchall()
+
+
+def _connect_request_log_archive(store: _RequestLogStore, archive_row: sqlite3.Row) -> sqlite3.Connection | None:
+    archive_path = _ensure_request_log_archive_file(
+        store.db_path,
+        str(archive_row["fileName"]),
+        archive_row["s3Key"],
+    )
+    if archive_path is None:
+        return None
+    archive_connection = _connect_sqlite(archive_path, row_factory=True, wal_enabled=False)
+    archive_connection.execute("PRAGMA query_only = ON")
+    return archive_connection
+
+
+def _query_request_log_statements(
+    statements: list[tuple[str, list[Any] | tuple[Any, ...] | None]],
+    *,
+    db_path: str | Path | None = None,
+    include_archives: bool = False,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> list[list[dict[str, Any]]]:
+    # 여러 SQL을 본 DB와 아카이브마다 같은 커넥션에서 이어 실행한다. 아카이브는 호출당 한 번만 찾고 연다.
+    store = _get_request_log_store(db_path)
+    actual_statements = [(sql, tuple(parameters or ())) for sql, parameters in statements]
+    archive_rows: list[sqlite3.Row] = []
+    with store.reader() as connection:
+        results = [
+            [dict(row) for row in connection.execute(sql, parameters).fetchall()]
+            for sql, parameters in actual_statements
+        ]
+        if include_archives:
+            archive_rows = _select_request_log_archive_rows(
+                connection,
+                date_from=date_from,
+                date_to=date_to,
+            )
+
+    for archive_row in archive_rows:
+        archive_connection = _connect_request_log_archive(store, archive_row)
+        if archive_connection is None:
+            continue
+        try:
+            for result, (sql, parameters) in zip(results, actual_statements):
+                result.extend(dict(row) for row in archive_connection.execute(sql, parameters).fetchall())
+        finally:
+            archive_connection.close()
+    return results
+
+
 def _query_request_log_rows(
     sql: str,
     parameters: list[Any] | tuple[Any, ...] | None = None,
     *,
     db_path: str | Path | None = None,
+    include_archives: bool = False,
+    date_from: str | None = None,
+    date_to: str | None = None,
 ) -> list[dict[str, Any]]:
-    actual_path = _ensure_request_log_schema(db_path)
-    connection = _connect_sqlite(
-        actual_path,
-        row_factory=True,
-        wal_enabled=False,
-    )
-    try:
-        connection.execute("PRAGMA query_only = ON")
-        rows = connection.execute(sql, tuple(parameters or ())).fetchall()
-    finally:
-        connection.close()
-    return [dict(row) for row in rows]
+    # include_archives면 같은 SQL을 날짜 범위에 걸치는 월별 아카이브 파일에도 돌려서 이어 붙인다.
+    return _query_request_log_statements(
+        [(sql, parameters)],
+        db_path=db_path,
+        include_archives=include_archives,
+        date_from=date_from,
+        date_to=date_to,
+    )[0]
+
+
+@contextmanager
+def _open_request_log_row_cursors(
+    sql: str,
+    parameters: list[Any] | tuple[Any, ...] | None = None,
+    *,
+    db_path: str | Path | None = None,
+) -> Iterator[list[Iterator[dict[str, Any]]]]:
+    # 본 DB와 월별 아카이브마다 같은 SQL을 한 번씩만 실행하고 커서를 열어 둔 채 넘긴다.
+    # 아카이브 목록과 본 DB를 같은 읽기 스냅샷에서 보므로 도중에 아카이브가 돌아도 행이 빠지거나 겹치지 않는다.
+    store = _get_request_log_store(db_path)
+    actual_parameters = tuple(parameters or ())
+    with store.reader() as connection, ExitStack() as stack:
+        cursors = [connection.execute(sql, actual_parameters)]
+        for archive_row in _select_request_log_archive_rows(connection):
+            archive_connection = _connect_request_log_archive(store, archive_row)
+            if archive_connection is None:
+                continue
+            stack.callback(archive_connection.close)
+            cursors.append(archive_connection.execute(sql, actual_parameters))
+        yield [(dict(row) for row in cursor) for cursor in cursors]
 
 
 def _query_request_log_value(
@@ -498,6 +1252,55 @@ def _normalize_request_log_query_limit(
     return min(normalized, max_limit)
 
 
+def _query_request_log_page(
+    where_clause: str,
+    parameters: list[Any],
+    *,
+    limit: int,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    db_path: str | Path | None = None,
+) -> tuple[int, list[dict[str, Any]]]:
+    # COUNT와 목록을 같은 커넥션에서 이어 돌려서, 아카이브 파일을 한 번만 찾고(S3에서 받고) 연다.
+    count_rows, rows = _query_request_log_statements(
+        [
+            (f"SELECT COUNT(*) AS value FROM {_REQUEST_LOG_TABLE_NAME} {where_clause}", parameters),
+            (
+                f"""
+                SELECT
+                    seq,
+                    createdAtUtc,
+                    createdAtLocal,
+                    requestDateLocal,
+                    userId,
+                    userName,
+                    routeName,
+                    routeMode,
+                    handlerType,
+                    status,
+                    requestText,
+                    normalizedQuestion,
+                    permalink,
+                    threadPermalink,
+                    replyCount
+                FROM {_REQUEST_LOG_TABLE_NAME}
+                {where_clause}
+                ORDER BY seq DESC
+                LIMIT ?
+                """,
+                [*parameters, limit],
+            ),
+        ],
+        db_path=db_path,
+        include_archives=True,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    # 파티션마다 최신 limit건씩 읽었으니 합친 뒤 seq 순으로 다시 자른다.
+    rows.sort(key=lambda row: int(row["seq"]), reverse=True)
+    return sum(int(row["value"] or 0) for row in count_rows), rows[:limit]
+
+
 def _list_request_log_recent(
     *,
     target_date: str | None = None,
@@ -510,38 +1313,12 @@ def _list_request_log_recent(
         target_date=target_date,
         user_query=user_query,
     )
-    total_count = int(
-        _query_request_log_value(
-            f"SELECT COUNT(*) AS value FROM {_REQUEST_LOG_TABLE_NAME} {where_clause}",
-            parameters,
-            db_path=db_path,
-        )
-        or 0
-    )
-    rows = _query_request_log_rows(
-        f"""
-        SELECT
-            seq,
-            createdAtUtc,
-            createdAtLocal,
-            requestDateLocal,
-            userId,
-            userName,
-            routeName,
-            routeMode,
-            handlerType,
-            status,
-            requestText,
-            normalizedQuestion,
-            permalink,
-            threadPermalink,
-            replyCount
-        FROM {_REQUEST_LOG_TABLE_NAME}
-        {where_clause}
-        ORDER BY seq DESC
-        LIMIT ?
-        """,
-        [*parameters, actual_limit],
+    total_count, rows = _query_request_log_page(
+        where_clause,
+        parameters,
+        limit=actual_limit,
+        date_from=target_date,
+        date_to=target_date,
         db_path=db_path,
     )
     return {
@@ -554,6 +1331,293 @@ def _list_request_log_recent(
     }
 
 
+def _split_request_log_search_terms(search_text: str) -> list[str]:
+    terms: list[str] = []
+    for term in str(search_text or "").split():
+        if term and term not in terms:
+            terms.append(term)
+    return terms
+
+
+def _escape_like_pattern(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_request_log(
+    search_text: str,
+    *,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    limit: int | None = None,
+    db_path: str | Path | None = None,
+) -> dict[str, Any]:
+    terms = _split_request_log_search_terms(search_text)
+    if not terms:
+        raise ValueError("검색어가 필요해")
+
+    actual_limit = _normalize_request_log_query_limit(limit, default=20, max_limit=50)
+    store = _get_request_log_store(db_path)
+    store.ensure_schema()
+
+    clauses: list[str] = []
+    parameters: list[Any] = []
+    fts_terms = [
+        term for term in terms
+        if store.fts_enabled and len(term) >= _REQUEST_LOG_FTS_MIN_TERM_CHARS
+    ]
+    if fts_terms:
+        # 각 검색어를 구문으로 감싸 AND로 묶는다. 따옴표는 FTS5 규칙대로 두 번 써서 이스케이프한다.
+        match_query = " AND ".join('"' + term.replace('"', '""') + '"' for term in fts_terms)
+        clauses.append(
+            f"seq IN (SELECT rowid FROM {_REQUEST_LOG_FTS_TABLE_NAME} "
+            f"WHERE {_REQUEST_LOG_FTS_TABLE_NAME} MATCH ?)"
+        )
+        parameters.append(match_query)
+    for term in terms:
+        if term in fts_terms:
+            continue
+        pattern = f"%{_escape_like_pattern(term)}%"
+        clauses.append(
+            "(requestText LIKE ? ESCAPE '\\' OR COALESCE(normalizedQuestion, '') LIKE ? ESCAPE '\\')"
+        )
+        parameters.extend([pattern, pattern])
+    if date_from:
+        clauses.append("requestDateLocal >= ?")
+        parameters.append(date_from)
+    if date_to:
+        clauses.append("requestDateLocal <= ?")
+        parameters.append(date_to)
+
+    where_clause = f"WHERE {' AND '.join(clauses)}"
+    total_count, rows = _query_request_log_page(
+        where_clause,
+        parameters,
+        limit=actual_limit,
+        date_from=date_from,
+        date_to=date_to,
+        db_path=db_path,
+    )
+    return {
+        "dbPath": str(store.db_path),
+        "searchText": " ".join(terms),
+        "dateFrom": date_from,
+        "dateTo": date_to,
+        "limit": actual_limit,
+        "fullTextSearch": bool(fts_terms),
+        "totalCount": total_count,
+        "rows": rows,
+    }
+
+
+def _request_log_today_local() -> str:
+    return datetime.now(_request_log_timezone()).date().isoformat()
+
+
+def _compact_request_log_daily_rollup(
+    *,
+    db_path: str | Path | None = None,
+    today_local: str | None = None,
+) -> list[str]:
+    return _get_request_log_store(db_path).compact_daily_rollup(
+        today_local or _request_log_today_local()
+    )
+
+
+def _has_dirty_request_log_rollup_dates(
+    *,
+    db_path: str | Path | None = None,
+    today_local: str | None = None,
+) -> bool:
+    # 읽기 커넥션으로만 확인해서, 할 일이 없을 때는 요약 조회가 writer 락을 잡지 않게 한다.
+    return bool(
+        _query_request_log_value(
+            f"""
+            SELECT EXISTS(
+                SELECT 1
+                FROM {_REQUEST_LOG_ROLLUP_STATE_TABLE_NAME}
+                WHERE dirty = 1 AND requestDateLocal < ?
+            ) AS value
+            """,
+            [today_local or _request_log_today_local()],
+            db_path=db_path,
+        )
+    )
+
+
+def _shift_request_log_month(month_start: str, months: int) -> str:
+    start_date = date.fromisoformat(month_start)
+    month_index = start_date.year * 12 + start_date.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1).isoformat()
+
+
+def _upload_request_log_archive_to_s3(
+    archive_path: Path,
+    *,
+    db_path: Path,
+    bucket: str,
+    s3_client: Any | None = None,
+) -> str:
+    compression = _normalize_sqlite_compression(s.REQUEST_LOG_SQLITE_S3_COMPRESSION)
+    root = _build_sqlite_archive_root(
+        db_path,
+        key_prefix=s.REQUEST_LOG_SQLITE_S3_PREFIX,
+        object_key=s.REQUEST_LOG_SQLITE_S3_OBJECT_KEY,
+    )
+    object_key = _sqlite_object_key_for_compression(f"{root}/{archive_path.name}", compression)
+    _upload_sqlite_file_to_s3(
+        s3_client or _build_s3_client(),
+        archive_path,
+        bucket=bucket,
+        object_key=object_key,
+        storage_class=s.REQUEST_LOG_SQLITE_S3_STORAGE_CLASS,
+        server_side_encryption=s.REQUEST_LOG_SQLITE_S3_SERVER_SIDE_ENCRYPTION,
+        compression=compression,
+        multipart_chunk_size=s.REQUEST_LOG_SQLITE_S3_MULTIPART_CHUNK_MB * 1024 * 1024,
+    )
+    return object_key
+
+
+def _archive_request_log_cold_months(
+    *,
+    db_path: str | Path | None = None,
+    hot_months: int | None = None,
+    today_local: str | None = None,
+    s3_client: Any | None = None,
+) -> dict[str, Any]:
+    # 최근 hot_months개월(이번 달 포함)만 hot 파일에 남기고, 그 이전 달은 월별 파일로 옮긴다.
+    store = _get_request_log_store(db_path)
+    actual_hot_months = int(hot_months if hot_months is not None else s.REQUEST_LOG_HOT_MONTHS)
+    if actual_hot_months <= 0:
+        return {
+            "dbPath": str(store.db_path),
+            "hotMonths": actual_hot_months,
+            "cutoffDate": None,
+            "compactedDates": [],
+            "archived": [],
+        }
+
+    actual_today = today_local or _request_log_today_local()
+    cutoff_date = _shift_request_log_month(f"{actual_today[:7]}-01", -(actual_hot_months - 1))
+    # 옮기기 전에 롤업을 마감해 두면 요약 쿼리는 계속 hot 파일만 읽으면 된다.
+    compacted_dates = store.compact_daily_rollup(actual_today)
+    months = [
+        str(row["month"])
+        for row in _query_request_log_rows(
+            f"""
+            SELECT DISTINCT substr(requestDateLocal, 1, 7) AS month
+            FROM {_REQUEST_LOG_TABLE_NAME}
+            WHERE requestDateLocal < ?
+            ORDER BY month
+            """,
+            [cutoff_date],
+            db_path=db_path,
+        )
+    ]
+
+    bucket = (
+        str(s.REQUEST_LOG_SQLITE_S3_BACKUP_BUCKET or "").strip()
+        if s.REQUEST_LOG_SQLITE_S3_BACKUP_ENABLED
+        else ""
+    )
+    if bucket:
+        # 늦게 들어온 행이 롤업 중에 합쳐진 달은 S3 사본만 다시 올리면 된다.
+        months = sorted(
+            {
+                *months,
+                *(
+                    str(row["month"])
+                    for row in _query_request_log_rows(
+                        f"SELECT month FROM {_REQUEST_LOG_ARCHIVE_TABLE_NAME} WHERE s3Key IS NULL",
+                        db_path=db_path,
+                    )
+                ),
+            }
+        )
+    archived: list[dict[str, Any]] = []
+    for month in months:
+        archive_path = _request_log_archive_dir(store.db_path) / _request_log_archive_file_name(
+            store.db_path,
+            month,
+        )
+        moved_count = store.archive_month(month, archive_path)
+        object_key = None
+        if bucket:
+            object_key = _upload_request_log_archive_to_s3(
+                archive_path,
+                db_path=store.db_path,
+                bucket=bucket,
+                s3_client=s3_client,
+            )
+            store.record_archive_upload(month, object_key)
+        archived.append(
+            {
+                "month": month,
+                "path": str(archive_path),
+                "movedCount": moved_count,
+                "key": object_key,
+            }
+        )
+    if any(item["movedCount"] for item in archived):
+        store.vacuum()
+    return {
+        "dbPath": str(store.db_path),
+        "hotMonths": actual_hot_months,
+        "cutoffDate": cutoff_date,
+        "compactedDates": compacted_dates,
+        "archived": archived,
+    }
+
+
+def _build_request_log_summary_source(
+    *,
+    target_date: str | None = None,
+    db_path: str | Path | None = None,
+) -> tuple[str, list[Any]]:
+    # 마감된 날짜는 일별 롤업에서, 오늘(이후) 날짜만 원본 request_log에서 읽는다.
+    # 롤업 마감은 백업 job에서 돌고, 여기서는 아직 마감 안 된 지난 날짜가 남아 있을 때만 직접 돌린다.
+    today_local = _request_log_today_local()
+    if _has_dirty_request_log_rollup_dates(db_path=db_path, today_local=today_local):
+        _compact_request_log_daily_rollup(db_path=db_path, today_local=today_local)
+
+    rollup_clauses = ["requestDateLocal < ?"]
+    raw_clauses = ["requestDateLocal >= ?"]
+    rollup_parameters: list[Any] = [today_local]
+    raw_parameters: list[Any] = [today_local]
+    normalized_target_date = str(target_date or "").strip()
+    if normalized_target_date:
+        rollup_clauses.append("requestDateLocal = ?")
+        raw_clauses.append("requestDateLocal = ?")
+        rollup_parameters.append(normalized_target_date)
+        raw_parameters.append(normalized_target_date)
+
+    source_sql = f"""
+        SELECT
+            userId,
+            userLabel,
+            routeName,
+            routeMode,
+            status,
+            requestCount,
+            firstRequestedAtLocal,
+            lastRequestedAtLocal
+        FROM {_REQUEST_LOG_ROLLUP_TABLE_NAME}
+        WHERE {' AND '.join(rollup_clauses)}
+        UNION ALL
+        SELECT
+            userId,
+            COALESCE(NULLIF(TRIM(userName), ''), userId),
+            routeName,
+            COALESCE(NULLIF(TRIM(routeMode), ''), ''),
+            status,
+            1,
+            createdAtLocal,
+            createdAtLocal
+        FROM {_REQUEST_LOG_TABLE_NAME}
+        WHERE {' AND '.join(raw_clauses)}
+    """
+    return source_sql, [*rollup_parameters, *raw_parameters]
+
+
 def _summarize_request_log_by_user(
     *,
     target_date: str | None = None,
@@ -561,10 +1625,13 @@ def _summarize_request_log_by_user(
     db_path: str | Path | None = None,
 ) -> dict[str, Any]:
     actual_limit = _normalize_request_log_query_limit(limit, default=10, max_limit=20)
-    where_clause, parameters = _build_request_log_filter_clause(target_date=target_date)
+    source_sql, parameters = _build_request_log_summary_source(
+        target_date=target_date,
+        db_path=db_path,
+    )
     total_count = int(
         _query_request_log_value(
-            f"SELECT COUNT(*) AS value FROM {_REQUEST_LOG_TABLE_NAME} {where_clause}",
+            f"SELECT SUM(requestCount) AS value FROM ({source_sql})",
             parameters,
             db_path=db_path,
         )
@@ -572,11 +1639,7 @@ def _summarize_request_log_by_user(
     )
     unique_user_count = int(
         _query_request_log_value(
-            f"""
-            SELECT COUNT(DISTINCT userId) AS value
-            FROM {_REQUEST_LOG_TABLE_NAME}
-            {where_clause}
-            """,
+            f"SELECT COUNT(DISTINCT userId) AS value FROM ({source_sql})",
             parameters,
             db_path=db_path,
         )
@@ -586,13 +1649,12 @@ def _summarize_request_log_by_user(
         f"""
         SELECT
             userId,
-            COALESCE(NULLIF(TRIM(userName), ''), userId) AS userLabel,
-            COUNT(*) AS requestCount,
-            SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) AS errorCount,
-            MAX(createdAtLocal) AS lastRequestedAtLocal
-        FROM {_REQUEST_LOG_TABLE_NAME}
-        {where_clause}
-        GROUP BY userId, COALESCE(NULLIF(TRIM(userName), ''), userId)
+            userLabel,
+            SUM(requestCount) AS requestCount,
+            SUM(CASE WHEN status = 'error' THEN requestCount ELSE 0 END) AS errorCount,
+            MAX(lastRequestedAtLocal) AS lastRequestedAtLocal
+        FROM ({source_sql})
+        GROUP BY userId, userLabel
         ORDER BY requestCount DESC, lastRequestedAtLocal DESC, userId ASC
         LIMIT ?
         """,
@@ -616,10 +1678,13 @@ def _summarize_request_log_by_route(
     db_path: str | Path | None = None,
 ) -> dict[str, Any]:
     actual_limit = _normalize_request_log_query_limit(limit, default=10, max_limit=20)
-    where_clause, parameters = _build_request_log_filter_clause(target_date=target_date)
+    source_sql, parameters = _build_request_log_summary_source(
+        target_date=target_date,
+        db_path=db_path,
+    )
     total_count = int(
         _query_request_log_value(
-            f"SELECT COUNT(*) AS value FROM {_REQUEST_LOG_TABLE_NAME} {where_clause}",
+            f"SELECT SUM(requestCount) AS value FROM ({source_sql})",
             parameters,
             db_path=db_path,
         )
@@ -630,10 +1695,9 @@ def _summarize_request_log_by_route(
             f"""
             SELECT COUNT(*) AS value
             FROM (
-                SELECT routeName, COALESCE(NULLIF(TRIM(routeMode), ''), '') AS routeMode
-                FROM {_REQUEST_LOG_TABLE_NAME}
-                {where_clause}
-                GROUP BY routeName, COALESCE(NULLIF(TRIM(routeMode), ''), '')
+                SELECT routeName, routeMode
+                FROM ({source_sql})
+                GROUP BY routeName, routeMode
             )
             """,
             parameters,
@@ -645,13 +1709,12 @@ def _summarize_request_log_by_route(
         f"""
         SELECT
             routeName,
-            COALESCE(NULLIF(TRIM(routeMode), ''), '') AS routeMode,
-            COUNT(*) AS requestCount,
-            SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) AS errorCount,
-            MAX(createdAtLocal) AS lastRequestedAtLocal
-        FROM {_REQUEST_LOG_TABLE_NAME}
-        {where_clause}
-        GROUP BY routeName, COALESCE(NULLIF(TRIM(routeMode), ''), '')
+            routeMode,
+            SUM(requestCount) AS requestCount,
+            SUM(CASE WHEN status = 'error' THEN requestCount ELSE 0 END) AS errorCount,
+            MAX(lastRequestedAtLocal) AS lastRequestedAtLocal
+        FROM ({source_sql})
+        GROUP BY routeName, routeMode
         ORDER BY requestCount DESC, lastRequestedAtLocal DESC, routeName ASC
         LIMIT ?
         """,
@@ -675,41 +1738,115 @@ def _summarize_request_log_overview(
     top_limit: int | None = None,
 ) -> dict[str, Any]:
     actual_top_limit = _normalize_request_log_query_limit(top_limit, default=5, max_limit=10)
-    where_clause, parameters = _build_request_log_filter_clause(target_date=target_date)
-    summary_rows = _query_request_log_rows(
+    source_sql, parameters = _build_request_log_summary_source(
+        target_date=target_date,
+        db_path=db_path,
+    )
+    # 필터 결과를 한 번만 읽고 요약/사용자별/라우트별 집계를 한 쿼리로 같이 뽑는다.
+    rows = _query_request_log_rows(
         f"""
+        WITH filtered AS {_SQLITE_MATERIALIZED_HINT}(
+            {source_sql}
+        ),
+        user_groups AS (
+            SELECT
+                userId AS groupKey,
+                userLabel AS groupLabel,
+                SUM(requestCount) AS requestCount,
+                SUM(CASE WHEN status = 'error' THEN requestCount ELSE 0 END) AS errorCount,
+                MAX(lastRequestedAtLocal) AS lastRequestedAtLocal
+            FROM filtered
+            GROUP BY userId, userLabel
+        ),
+        route_groups AS (
+            SELECT
+                routeName AS groupKey,
+                routeMode AS groupLabel,
+                SUM(requestCount) AS requestCount,
+                SUM(CASE WHEN status = 'error' THEN requestCount ELSE 0 END) AS errorCount,
+                MAX(lastRequestedAtLocal) AS lastRequestedAtLocal
+            FROM filtered
+            GROUP BY routeName, routeMode
+        ),
+        ranked_users AS (
+            SELECT
+                *,
+                ROW_NUMBER() OVER (
+                    ORDER BY requestCount DESC, lastRequestedAtLocal DESC, groupKey ASC, groupLabel ASC
+                ) AS groupRank
+            FROM user_groups
+        ),
+        ranked_routes AS (
+            SELECT
+                *,
+                ROW_NUMBER() OVER (
+                    ORDER BY requestCount DESC, lastRequestedAtLocal DESC, groupKey ASC, groupLabel ASC
+                ) AS groupRank
+            FROM route_groups
+        )
         SELECT
-            COUNT(*) AS totalCount,
-            SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) AS errorCount,
+            0 AS kindOrder,
+            0 AS groupRank,
+            NULL AS groupKey,
+            NULL AS groupLabel,
+            SUM(requestCount) AS requestCount,
+            SUM(CASE WHEN status = 'error' THEN requestCount ELSE 0 END) AS errorCount,
             COUNT(DISTINCT userId) AS uniqueUserCount,
-            MIN(createdAtLocal) AS firstRequestedAtLocal,
-            MAX(createdAtLocal) AS lastRequestedAtLocal
-        FROM {_REQUEST_LOG_TABLE_NAME}
-        {where_clause}
+            MIN(firstRequestedAtLocal) AS firstRequestedAtLocal,
+            MAX(lastRequestedAtLocal) AS lastRequestedAtLocal
+        FROM filtered
+        UNION ALL
+        SELECT 1, groupRank, groupKey, groupLabel, requestCount, errorCount, NULL, NULL, lastRequestedAtLocal
+        FROM ranked_users
+        WHERE groupRank <= ?
+        UNION ALL
+        SELECT 2, groupRank, groupKey, groupLabel, requestCount, errorCount, NULL, NULL, lastRequestedAtLocal
+        FROM ranked_routes
+        WHERE groupRank <= ?
+        ORDER BY kindOrder, groupRank
         """,
-        parameters,
+        [*parameters, actual_top_limit, actual_top_limit],
         db_path=db_path,
     )
-    summary = summary_rows[0] if summary_rows else {}
+
+    summary: dict[str, Any] = {}
+    top_users: list[dict[str, Any]] = []
+    top_routes: list[dict[str, Any]] = []
+    for row in rows:
+        if row["kindOrder"] == 0:
+            summary = row
+        elif row["kindOrder"] == 1:
+            top_users.append(
+                {
+                    "userId": row["groupKey"],
+                    "userLabel": row["groupLabel"],
+                    "requestCount": row["requestCount"],
+                    "errorCount": row["errorCount"],
+                    "lastRequestedAtLocal": row["lastRequestedAtLocal"],
+                }
+            )
+        else:
+            top_routes.append(
+                {
+                    "routeName": row["groupKey"],
+                    "routeMode": row["groupLabel"],
+                    "requestCount": row["requestCount"],
+                    "errorCount": row["errorCount"],
+                    "lastRequestedAtLocal": row["lastRequestedAtLocal"],
+                }
+            )
+
     return {
         "dbPath": str(_request_log_db_path(db_path)),
         "targetDate": target_date,
         "topLimit": actual_top_limit,
-        "totalCount": int(summary.get("totalCount") or 0),
+        "totalCount": int(summary.get("requestCount") or 0),
         "errorCount": int(summary.get("errorCount") or 0),
         "uniqueUserCount": int(summary.get("uniqueUserCount") or 0),
         "firstRequestedAtLocal": summary.get("firstRequestedAtLocal"),
         "lastRequestedAtLocal": summary.get("lastRequestedAtLocal"),
-        "topUsers": _summarize_request_log_by_user(
-            target_date=target_date,
-            limit=actual_top_limit,
-            db_path=db_path,
-        ).get("rows", []),
-        "topRoutes": _summarize_request_log_by_route(
-            target_date=target_date,
-            limit=actual_top_limit,
-            db_path=db_path,
-        ).get("rows", []),
+        "topUsers": top_users,
+        "topRoutes": top_routes,
     }
 
 
@@ -726,6 +1863,21 @@ def _backup_request_log_to_s3(
     if not actual_bucket:
         raise RuntimeError("REQUEST_LOG_SQLITE_S3_BACKUP_BUCKET이 비어 있어")
 
+    if s.REQUEST_LOG_SQLITE_S3_INCREMENTAL_ENABLED:
+        return _backup_sqlite_incremental_to_s3(
+            actual_path,
+            table_name=_REQUEST_LOG_TABLE_NAME,
+            key_column="seq",
+            bucket=actual_bucket,
+            object_key=object_key if object_key is not None else s.REQUEST_LOG_SQLITE_S3_OBJECT_KEY,
+            key_prefix=key_prefix if key_prefix is not None else s.REQUEST_LOG_SQLITE_S3_PREFIX,
+            full_backup_every=s.REQUEST_LOG_SQLITE_S3_FULL_BACKUP_EVERY,
+            s3_client=s3_client,
+            storage_class=s.REQUEST_LOG_SQLITE_S3_STORAGE_CLASS,
+            server_side_encryption=s.REQUEST_LOG_SQLITE_S3_SERVER_SIDE_ENCRYPTION,
+            compression=s.REQUEST_LOG_SQLITE_S3_COMPRESSION,
+            multipart_chunk_size=s.REQUEST_LOG_SQLITE_S3_MULTIPART_CHUNK_MB * 1024 * 1024,
+        )
     return _backup_sqlite_to_s3(
         actual_path,
         bucket=actual_bucket,
@@ -734,6 +1886,8 @@ def _backup_request_log_to_s3(
         s3_client=s3_client,
         storage_class=s.REQUEST_LOG_SQLITE_S3_STORAGE_CLASS,
         server_side_encryption=s.REQUEST_LOG_SQLITE_S3_SERVER_SIDE_ENCRYPTION,
+        compression=s.REQUEST_LOG_SQLITE_S3_COMPRESSION,
+        multipart_chunk_size=s.REQUEST_LOG_SQLITE_S3_MULTIPART_CHUNK_MB * 1024 * 1024,
     )
 
 
@@ -763,11 +1917,30 @@ def _restore_request_log_from_s3(
     if not actual_bucket:
         raise RuntimeError("REQUEST_LOG_SQLITE_S3_BACKUP_BUCKET이 비어 있어")
 
+    # 복원은 WAL 파일까지 지우고 DB 파일을 갈아끼우므로, 열린 쓰기 커넥션을 먼저 닫는다.
+    _get_request_log_store(db_path).close()
+    actual_object_key = object_key if object_key is not None else s.REQUEST_LOG_SQLITE_S3_OBJECT_KEY
+    actual_key_prefix = key_prefix if key_prefix is not None else s.REQUEST_LOG_SQLITE_S3_PREFIX
+    if s.REQUEST_LOG_SQLITE_S3_INCREMENTAL_ENABLED:
+        restore_result = _restore_sqlite_incremental_from_s3(
+            _request_log_db_path(db_path),
+            table_name=_REQUEST_LOG_TABLE_NAME,
+            key_column="seq",
+            bucket=actual_bucket,
+            object_key=actual_object_key,
+            key_prefix=actual_key_prefix,
+            s3_client=s3_client,
+            only_if_missing=only_if_missing,
+            replay_statements=_REQUEST_LOG_DELTA_REPLAY_STATEMENTS,
+        )
+        # 증분 체인이 아직 없으면(전환 직후) 기존 전체 스냅샷에서 복원한다.
+        if restore_result.get("reason") != "remote_missing":
+            return restore_result
     return _restore_sqlite_from_s3(
         _request_log_db_path(db_path),
         bucket=actual_bucket,
-        object_key=object_key if object_key is not None else s.REQUEST_LOG_SQLITE_S3_OBJECT_KEY,
-        key_prefix=key_prefix if key_prefix is not None else s.REQUEST_LOG_SQLITE_S3_PREFIX,
+        object_key=actual_object_key,
+        key_prefix=actual_key_prefix,
         s3_client=s3_client,
         only_if_missing=only_if_missing,
     )
@@ -788,6 +1961,49 @@ def _restore_request_log_from_configured_s3(
     )
 
 
+def _prune_request_log_backups_in_s3(
+    *,
+    db_path: str | Path | None = None,
+    bucket: str | None = None,
+    object_key: str | None = None,
+    key_prefix: str | None = None,
+    keep_count: int | None = None,
+    s3_client: Any | None = None,
+) -> dict[str, Any]:
+    actual_bucket = str(bucket or s.REQUEST_LOG_SQLITE_S3_BACKUP_BUCKET).strip()
+    if not actual_bucket:
+        raise RuntimeError("REQUEST_LOG_SQLITE_S3_BACKUP_BUCKET이 비어 있어")
+
+    actual_keep_count = int(keep_count if keep_count is not None else s.REQUEST_LOG_SQLITE_S3_RETENTION_COUNT)
+    actual_object_key = object_key if object_key is not None else s.REQUEST_LOG_SQLITE_S3_OBJECT_KEY
+    actual_key_prefix = key_prefix if key_prefix is not None else s.REQUEST_LOG_SQLITE_S3_PREFIX
+    if s.REQUEST_LOG_SQLITE_S3_INCREMENTAL_ENABLED:
+        deleted = _prune_sqlite_incremental_chains_in_s3(
+            bucket=actual_bucket,
+            root=_build_sqlite_incremental_root(
+                _request_log_db_path(db_path),
+                key_prefix=actual_key_prefix,
+                object_key=actual_object_key,
+            ),
+            keep_count=actual_keep_count,
+            s3_client=s3_client,
+        )
+    elif str(actual_object_key or "").strip():
+        # 고정 object key는 매번 같은 키를 덮어쓰므로 지울 이전 스냅샷이 없다.
+        deleted = []
+    else:
+        deleted = _prune_sqlite_backups_in_s3(
+            bucket=actual_bucket,
+            key_prefix=actual_key_prefix,
+            keep_count=actual_keep_count,
+            s3_client=s3_client,
+        )
+    return {
+        "keepCount": actual_keep_count,
+        "deleted": deleted,
+    }
+
+
 def _run_request_log_backup_job(
     *,
     db_path: str | Path | None = None,
@@ -795,10 +2011,29 @@ def _run_request_log_backup_job(
 ) -> dict[str, Any] | None:
     if not s.REQUEST_LOG_SQLITE_S3_BACKUP_ENABLED:
         return None
-    return _backup_request_log_to_s3(
+    archive_result = None
+    if s.REQUEST_LOG_HOT_MONTHS > 0:
+        # 식은 달을 먼저 떼어내야 이번 백업이 작은 hot 파일만 올린다. 롤업 마감도 아카이브 단계에서 한 번 한다.
+        archive_result = _archive_request_log_cold_months(
+            db_path=db_path,
+            s3_client=s3_client,
+        )
+        compacted_dates = archive_result["compactedDates"]
+    else:
+        compacted_dates = _compact_request_log_daily_rollup(db_path=db_path)
+    result = _backup_request_log_to_s3(
         db_path=db_path,
         s3_client=s3_client,
     )
+    result["compactedDates"] = compacted_dates
+    if archive_result is not None:
+        result["archive"] = archive_result
+    if s.REQUEST_LOG_SQLITE_S3_RETENTION_COUNT > 0:
+        result["pruned"] = _prune_request_log_backups_in_s3(
+            db_path=db_path,
+            s3_client=s3_client,
+        )
+    return result
 
 
 def _initialize_request_log_storage(
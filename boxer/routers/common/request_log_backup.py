@@ -3,16 +3,43 @@ from __future__ import annotations
 import argparse
 import json
 
-from boxer.routers.common.request_log import _run_request_log_backup_job
+from boxer.routers.common.request_log import (
+    _archive_request_log_cold_months,
+    _compact_request_log_daily_rollup,
+    _prune_request_log_backups_in_s3,
+    _run_request_log_backup_job,
+)
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Backup request log SQLite snapshot to configured S3",
     )
-    parser.parse_args()
+    parser.add_argument(
+        "--prune-only",
+        action="store_true",
+        help="Skip the backup and only prune snapshots beyond REQUEST_LOG_SQLITE_S3_RETENTION_COUNT",
+    )
+    parser.add_argument(
+        "--archive-only",
+        action="store_true",
+        help="Skip the backup and only move months older than REQUEST_LOG_HOT_MONTHS into archive files",
+    )
+    parser.add_argument(
+        "--compact-only",
+        action="store_true",
+        help="Skip the backup and only rebuild the daily rollup for closed dates",
+    )
+    args = parser.parse_args()
 
-    result = _run_request_log_backup_job()
+    if args.prune_only:
+        result = _prune_request_log_backups_in_s3()
+    elif args.archive_only:
+        result = _archive_request_log_cold_months()
+    elif args.compact_only:
+        result = {"compactedDates": _compact_request_log_daily_rollup()}
+    else:
+        result = _run_request_log_backup_job()
     print(json.dumps(result, ensure_ascii=False))
     return 0
 
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import os
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - runtime guard
+    pa = None
+    pq = None
+
+from boxer.core import settings as s
+from boxer.routers.common.request_log import (
+    _REQUEST_LOG_TABLE_NAME,
+    _ensure_request_log_schema,
+    _open_request_log_row_cursors,
+)
+from boxer.routers.common.sqlite_store import _resolve_sqlite_path
+
+_REQUEST_LOG_EXPORT_STATE_FILE_NAME = "_export_state.json"
+_REQUEST_LOG_EXPORT_PARTITION_COLUMN = "requestDateLocal"
+_REQUEST_LOG_EXPORT_INTEGER_COLUMNS = frozenset({"seq", "isThreadRoot", "replyCount"})
+_REQUEST_LOG_EXPORT_COLUMNS = (
+    "seq",
+    "createdAtUtc",
+    "createdAtLocal",
+    "requestDateLocal",
+    "sourcePlatform",
+    "workspaceId",
+    "eventType",
+    "routeName",
+    "routeMode",
+    "handlerType",
+    "status",
+    "userId",
+    "userName",
+    "channelId",
+    "threadId",
+    "messageId",
+    "isThreadRoot",
+    "permalink",
+    "threadPermalink",
+    "requestText",
+    "normalizedQuestion",
+    "requestKey",
+    "subjectType",
+    "subjectKey",
+    "requestedDate",
+    "replyCount",
+    "firstRepliedAtUtc",
+    "firstRepliedAtLocal",
+    "errorType",
+    "metadataJson",
+)
+
+
+def _request_log_export_dir(
+    db_path: Path,
+    export_dir: str | Path | None = None,
+) -> Path:
+    actual_dir = export_dir if export_dir is not None else s.REQUEST_LOG_EXPORT_DIR
+    if actual_dir:
+        return _resolve_sqlite_path(actual_dir)
+    return db_path.with_name(f"{db_path.stem}-export")
+
+
+def _read_request_log_export_watermark(export_dir: Path) -> int:
+    state_path = export_dir / _REQUEST_LOG_EXPORT_STATE_FILE_NAME
+    try:
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return 0
+    return int(payload.get("lastSeq") or 0) if isinstance(payload, dict) else 0
+
+
+def _write_request_log_export_watermark(export_dir: Path, last_seq: int) -> None:
+    state_path = export_dir / _REQUEST_LOG_EXPORT_STATE_FILE_NAME
+    temp_path = state_path.with_name(f"{state_path.name}.tmp")
+    temp_path.write_text(
+        json.dumps(
+            {
+                "lastSeq": last_seq,
+                "updatedAtUtc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(temp_path, state_path)
+
+
+def _iter_request_log_export_batches(
+    *,
+    after_seq: int,
+    batch_rows: int,
+    db_path: str | Path | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    # 아카이브된 달도 seq를 그대로 갖고 있어서 같은 워터마크로 이어 읽는다.
+    # 본 DB와 아카이브마다 실행당 한 번씩만 조회하고, seq로 정렬된 커서들을 병합해 batch_rows건씩 자른다.
+    actual_batch_rows = max(1, batch_rows)
+    with _open_request_log_row_cursors(
+        f"""
+        SELECT {', '.join(_REQUEST_LOG_EXPORT_COLUMNS)}
+        FROM {_REQUEST_LOG_TABLE_NAME}
+        WHERE seq > ?
+        ORDER BY seq
+        """,
+        [after_seq],
+        db_path=db_path,
+    ) as cursors:
+        rows = heapq.merge(*cursors, key=lambda row: int(row["seq"]))
+        while True:
+            batch = list(islice(rows, actual_batch_rows))
+            if not batch:
+                return
+            yield batch
+
+
+def _request_log_export_schema() -> Any:
+    # 날짜는 hive 파티션 경로(requestDateLocal=YYYY-MM-DD)에 있으므로 파일 안에는 다시 넣지 않는다.
+    return pa.schema(
+        [
+            pa.field(column, pa.int64() if column in _REQUEST_LOG_EXPORT_INTEGER_COLUMNS else pa.string())
+            for column in _REQUEST_LOG_EXPORT_COLUMNS
+            if column != _REQUEST_LOG_EXPORT_PARTITION_COLUMN
+        ]
+    )
+
+
+def _export_request_log_to_parquet(
+    *,
+    db_path: str | Path | None = None,
+    export_dir: str | Path | None = None,
+    batch_rows: int | None = None,
+    compression: str | None = None,
+) -> dict[str, Any]:
+    if pq is None:
+        raise RuntimeError("Parquet export에는 pyarrow가 필요해 (pip install boxer[export])")
+
+    actual_path = _ensure_request_log_schema(db_path)
+    actual_export_dir = _request_log_export_dir(actual_path, export_dir)
+    actual_export_dir.mkdir(parents=True, exist_ok=True)
+    after_seq = _read_request_log_export_watermark(actual_export_dir)
+    schema = _request_log_export_schema()
+    # 한 번 실행할 때 날짜마다 파일 하나를 열어 두고 batch를 row group으로 이어 쓴다.
+    # 파일 이름에 시작 워터마크를 넣어서, 중간에 실패한 실행을 다시 돌리면 같은 파일을 덮어쓴다.
+    part_name = f"part-{after_seq + 1:012d}.parquet"
+    writers: dict[str, Any] = {}
+    temp_paths: dict[str, Path] = {}
+    row_count = 0
+    last_seq = after_seq
+    try:
+        for batch in _iter_request_log_export_batches(
+            after_seq=after_seq,
+            batch_rows=batch_rows if batch_rows is not None else s.REQUEST_LOG_EXPORT_BATCH_ROWS,
+            db_path=actual_path,
+        ):
+            rows_by_date: dict[str, list[dict[str, Any]]] = {}
+            for row in batch:
+                rows_by_date.setdefault(str(row[_REQUEST_LOG_EXPORT_PARTITION_COLUMN]), []).append(row)
+            for request_date, date_rows in rows_by_date.items():
+                writer = writers.get(request_date)
+                if writer is None:
+                    partition_dir = actual_export_dir / f"{_REQUEST_LOG_EXPORT_PARTITION_COLUMN}={request_date}"
+                    partition_dir.mkdir(parents=True, exist_ok=True)
+                    temp_paths[request_date] = partition_dir / f"{part_name}.tmp"
+                    writer = pq.ParquetWriter(
+                        temp_paths[request_date],
+                        schema,
+                        compression=compression or s.REQUEST_LOG_EXPORT_COMPRESSION,
+                    )
+                    writers[request_date] = writer
+                writer.write_table(pa.Table.from_pylist(date_rows, schema=schema))
+            row_count += len(batch)
+            last_seq = int(batch[-1]["seq"])
+    except Exception:
+        for writer in writers.values():
+            writer.close()
+        for temp_path in temp_paths.values():
+            temp_path.unlink(missing_ok=True)
+        raise
+
+    files: list[str] = []
+    for request_date, writer in sorted(writers.items()):
+        writer.close()
+        final_path = temp_paths[request_date].with_name(part_name)
+        os.replace(temp_paths[request_date], final_path)
+        files.append(str(final_path))
+    # 파일을 모두 제자리에 옮긴 뒤에 워터마크를 올려야 실패해도 빠진 구간이 생기지 않는다.
+    if last_seq != after_seq:
+        _write_request_log_export_watermark(actual_export_dir, last_seq)
+    return {
+        "dbPath": str(actual_path),
+        "exportDir": str(actual_export_dir),
+        "afterSeq": after_seq,
+        "lastSeq": last_seq,
+        "rowCount": row_count,
+        "files": files,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Export new request log rows to Parquet files partitioned by requestDateLocal",
+    )
+    parser.add_argument(
+        "--export-dir",
+        default=None,
+        help="Output directory (defaults to REQUEST_LOG_EXPORT_DIR)",
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=None,
+        help="Rows read from SQLite per batch (defaults to REQUEST_LOG_EXPORT_BATCH_ROWS)",
+    )
+    args = parser.parse_args()
+
+    result = _export_request_log_to_parquet(
+        export_dir=args.export_dir,
+        batch_rows=args.batch_rows,
+    )
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
+import re
 import sqlite3
 import tempfile
+from collections.abc import Sequence
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any
 from zoneinfo import ZoneInfo
 
 from boxer.core import settings as s
 from boxer.routers.common.s3 import _build_s3_client
 
+_SQLITE_DELTA_DELETED_TABLE_NAME = "deleted_keys"
+_SQLITE_GZIP_SUFFIX = ".gz"
+_SQLITE_MANIFEST_SUFFIX = ".manifest.json"
+_SQLITE_STREAM_CHUNK_BYTES = 1024 * 1024
+# S3 multipart는 마지막 part를 빼고 최소 5MiB여야 한다.
+_S3_MIN_MULTIPART_CHUNK_BYTES = 5 * 1024 * 1024
+_SQLITE_INCREMENTAL_BASE_ID_FORMAT = "%Y%m%dT%H%M%SZ"
+_SQLITE_INCREMENTAL_ROOT_SUFFIX = "-incremental"
+_SQLITE_ARCHIVE_ROOT_SUFFIX = "-archive"
+_SQLITE_LATEST_POINTER_NAME = "latest.json"
+_S3_DELETE_BATCH_SIZE = 1000
+
 
 def _resolve_sqlite_path(raw_path: str | Path) -> Path:
     path = Path(raw_path).expanduser()
@@ -30,6 +47,7 @@ def _connect_sqlite(
     timeout_sec: int | None = None,
     row_factory: bool = True,
     wal_enabled: bool = True,
+    check_same_thread: bool = True,
 ) -> sqlite3.Connection:
     actual_timeout = max(
         1,
@@ -40,6 +58,7 @@ def _connect_sqlite(
         resolved_path,
         timeout=float(actual_timeout),
         isolation_level=None,
+        check_same_thread=check_same_thread,
     )
     connection.execute(
         f"PRAGMA busy_timeout = {max(1000, s.REQUEST_LOG_SQLITE_BUSY_TIMEOUT_MS)}"
@@ -163,17 +182,120 @@ def _list_sqlite_backups_in_s3(
     return objects
 
 
+def _is_sqlite_snapshot_object_key(key: str) -> bool:
+    if key.endswith(_SQLITE_MANIFEST_SUFFIX):
+        return False
+    parts = key.split("/")
+    if parts[-1] == _SQLITE_LATEST_POINTER_NAME:
+        return False
+    # 같은 prefix 아래의 증분 체인(base/delta)이나 월별 아카이브는 전체 스냅샷이 아니다.
+    return not any(
+        part.endswith((_SQLITE_INCREMENTAL_ROOT_SUFFIX, _SQLITE_ARCHIVE_ROOT_SUFFIX))
+        for part in parts[:-1]
+    )
+
+
+def _sqlite_latest_pointer_key(root: str) -> str:
+    normalized_root = str(root or "").strip().strip("/")
+    if normalized_root:
+        return f"{normalized_root}/{_SQLITE_LATEST_POINTER_NAME}"
+    return _SQLITE_LATEST_POINTER_NAME
+
+
+def _read_s3_json(client: Any, *, bucket: str, object_key: str) -> dict[str, Any] | None:
+    try:
+        response = client.get_object(Bucket=bucket, Key=object_key)
+    except Exception:
+        return None
+    body = response["Body"]
+    try:
+        payload = json.loads(body.read().decode("utf-8"))
+    except ValueError:
+        return None
+    finally:
+        body.close()
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_s3_json(
+    client: Any,
+    *,
+    bucket: str,
+    object_key: str,
+    payload: dict[str, Any],
+    extra_args: dict[str, str] | None = None,
+) -> None:
+    client.put_object(
+        Bucket=bucket,
+        Key=object_key,
+        Body=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+        ContentType="application/json",
+        **(extra_args or {}),
+    )
+
+
+def _write_sqlite_latest_pointer(
+    client: Any,
+    *,
+    bucket: str,
+    root: str,
+    payload: dict[str, Any],
+    server_side_encryption: str | None = None,
+) -> None:
+    # 포인터는 매번 덮어쓰는 작은 파일이라 storage class는 기본값으로 둔다.
+    _write_s3_json(
+        client,
+        bucket=bucket,
+        object_key=_sqlite_latest_pointer_key(root),
+        payload={
+            **payload,
+            "updatedAtUtc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        },
+        extra_args=_sqlite_s3_extra_args(None, server_side_encryption),
+    )
+
+
+def _delete_s3_objects(client: Any, *, bucket: str, keys: Sequence[str]) -> None:
+    for start in range(0, len(keys), _S3_DELETE_BATCH_SIZE):
+        batch = keys[start:start + _S3_DELETE_BATCH_SIZE]
+        client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+
+
 def _find_latest_sqlite_backup_in_s3(
     *,
     bucket: str,
     key_prefix: str = "",
     s3_client: Any | None = None,
 ) -> dict[str, Any] | None:
+    client = s3_client or _build_s3_client()
+    actual_bucket = str(bucket or "").strip()
+    # latest.json이 있으면 요청 한 번으로 끝나고, 없을 때(포인터 도입 전 백업)만 prefix 전체를 훑는다.
+    pointer = _read_s3_json(
+        client,
+        bucket=actual_bucket,
+        object_key=_sqlite_latest_pointer_key(key_prefix),
+    )
+    if pointer is not None and str(pointer.get("key") or "").strip():
+        return {
+            "bucket": actual_bucket,
+            "key": str(pointer["key"]).strip(),
+            "lastModified": pointer.get("updatedAtUtc"),
+            "size": int(pointer.get("size") or 0),
+            "etag": None,
+        }
+
     objects = _list_sqlite_backups_in_s3(
-        bucket=bucket,
+        bucket=actual_bucket,
         key_prefix=key_prefix,
-        s3_client=s3_client,
+        s3_client=client,
     )
+    objects = [
+        item for item in objects
+        if _is_sqlite_snapshot_object_key(str(item.get("key") or ""))
+    ]
     if not objects:
         return None
     return max(
@@ -185,6 +307,274 @@ def _find_latest_sqlite_backup_in_s3(
     )
 
 
+def _normalize_sqlite_compression(compression: str | None) -> str:
+    normalized = str(compression or "").strip().lower()
+    if normalized in {"gzip", "gz"}:
+        return "gzip"
+    return "none"
+
+
+def _sqlite_object_key_for_compression(object_key: str, compression: str) -> str:
+    if compression == "gzip" and not object_key.endswith(_SQLITE_GZIP_SUFFIX):
+        return f"{object_key}{_SQLITE_GZIP_SUFFIX}"
+    return object_key
+
+
+def _sqlite_s3_extra_args(
+    storage_class: str | None = None,
+    server_side_encryption: str | None = None,
+) -> dict[str, str]:
+    extra_args: dict[str, str] = {}
+
+    actual_storage_class = str(storage_class or "").strip()
+    if actual_storage_class:
+        extra_args["StorageClass"] = actual_storage_class
+
+    actual_sse = str(server_side_encryption or "").strip()
+    if actual_sse:
+        extra_args["ServerSideEncryption"] = actual_sse
+    return extra_args
+
+
+class _S3MultipartWriter:
+    # 압축 스트림을 받아 part 크기만큼 모이면 바로 올린다. part 하나로 끝나는 작은 파일은 put_object로 보낸다.
+    def __init__(
+        self,
+        client: Any,
+        *,
+        bucket: str,
+        object_key: str,
+        chunk_size: int,
+        extra_args: dict[str, str],
+    ) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._object_key = object_key
+        self._chunk_size = max(_S3_MIN_MULTIPART_CHUNK_BYTES, chunk_size)
+        self._extra_args = extra_args
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._parts: list[dict[str, Any]] = []
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._buffer.extend(data)
+        self.size += len(data)
+        self.sha256.update(data)
+        while len(self._buffer) >= self._chunk_size:
+            self._upload_part(bytes(self._buffer[:self._chunk_size]))
+            del self._buffer[:self._chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def _upload_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            response = self._client.create_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._object_key,
+                **self._extra_args,
+            )
+            self._upload_id = str(response["UploadId"])
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._object_key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def complete(self) -> int:
+        if self._upload_id is None:
+            self._client.put_object(
+                Bucket=self._bucket,
+                Key=self._object_key,
+                Body=bytes(self._buffer),
+                **self._extra_args,
+            )
+            return 1
+        if self._buffer:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._object_key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        return len(self._parts)
+
+    def abort(self) -> None:
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._object_key,
+                UploadId=self._upload_id,
+            )
+
+
+class _HashingReader:
+    def __init__(self, raw: Any) -> None:
+        self._raw = raw
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size) if size is not None and size >= 0 else self._raw.read()
+        self.size += len(data)
+        self.sha256.update(data)
+        return data
+
+
+def _upload_sqlite_file_to_s3(
+    client: Any,
+    file_path: Path,
+    *,
+    bucket: str,
+    object_key: str,
+    storage_class: str | None = None,
+    server_side_encryption: str | None = None,
+    compression: str = "none",
+    multipart_chunk_size: int = _S3_MIN_MULTIPART_CHUNK_BYTES,
+) -> dict[str, Any] | None:
+    extra_args = _sqlite_s3_extra_args(storage_class, server_side_encryption)
+    if _normalize_sqlite_compression(compression) != "gzip":
+        if extra_args:
+            client.upload_file(str(file_path), bucket, object_key, ExtraArgs=extra_args)
+        else:
+            client.upload_file(str(file_path), bucket, object_key)
+        return None
+
+    # 압축본을 디스크에 다시 쓰지 않고 gzip 스트림을 그대로 multipart part로 흘려보낸다.
+    writer = _S3MultipartWriter(
+        client,
+        bucket=bucket,
+        object_key=object_key,
+        chunk_size=multipart_chunk_size,
+        extra_args=extra_args,
+    )
+    raw_sha256 = hashlib.sha256()
+    raw_size = 0
+    try:
+        with open(file_path, "rb") as source, gzip.GzipFile(fileobj=writer, mode="wb", mtime=0) as compressor:
+            while True:
+                chunk = source.read(_SQLITE_STREAM_CHUNK_BYTES)
+                if not chunk:
+                    break
+                raw_sha256.update(chunk)
+                raw_size += len(chunk)
+                compressor.write(chunk)
+        part_count = writer.complete()
+    except Exception:
+        writer.abort()
+        raise
+
+    manifest = {
+        "key": object_key,
+        "format": "sqlite3",
+        "compression": "gzip",
+        "rawSize": raw_size,
+        "rawSha256": raw_sha256.hexdigest(),
+        "compressedSize": writer.size,
+        "compressedSha256": writer.sha256.hexdigest(),
+        "partCount": part_count,
+        "createdAtUtc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+    }
+    _write_s3_json(
+        client,
+        bucket=bucket,
+        object_key=f"{object_key}{_SQLITE_MANIFEST_SUFFIX}",
+        payload=manifest,
+        extra_args=extra_args,
+    )
+    return manifest
+
+
+def _load_sqlite_backup_manifest(
+    client: Any,
+    *,
+    bucket: str,
+    object_key: str,
+) -> dict[str, Any] | None:
+    return _read_s3_json(
+        client,
+        bucket=bucket,
+        object_key=f"{object_key}{_SQLITE_MANIFEST_SUFFIX}",
+    )
+
+
+def _download_sqlite_from_s3(
+    client: Any,
+    *,
+    bucket: str,
+    object_key: str,
+    target_path: Path,
+) -> bool:
+    if not object_key.endswith(_SQLITE_GZIP_SUFFIX):
+        client.download_file(bucket, object_key, str(target_path))
+        return False
+
+    manifest = _load_sqlite_backup_manifest(client, bucket=bucket, object_key=object_key)
+    body = client.get_object(Bucket=bucket, Key=object_key)["Body"]
+    reader = _HashingReader(body)
+    raw_sha256 = hashlib.sha256()
+    raw_size = 0
+    try:
+        with gzip.GzipFile(fileobj=reader, mode="rb") as decompressor, open(target_path, "wb") as destination:
+            while True:
+                chunk = decompressor.read(_SQLITE_STREAM_CHUNK_BYTES)
+                if not chunk:
+                    break
+                raw_sha256.update(chunk)
+                raw_size += len(chunk)
+                destination.write(chunk)
+    finally:
+        body.close()
+
+    if manifest is None:
+        return False
+    if (
+        reader.sha256.hexdigest() != manifest.get("compressedSha256")
+        or raw_sha256.hexdigest() != manifest.get("rawSha256")
+        or raw_size != int(manifest.get("rawSize") or -1)
+    ):
+        raise RuntimeError("다운로드한 SQLite snapshot 체크섬이 manifest와 달라")
+    # manifest 체크섬이 맞으면 올린 스냅샷과 같은 바이트이므로 전체 integrity_check는 생략한다.
+    return True
+
+
+def _create_sqlite_temp_path(db_path: Path, label: str) -> Path:
+    temp_file = tempfile.NamedTemporaryFile(
+        prefix=f"{db_path.stem}-{label}-",
+        suffix=db_path.suffix or ".sqlite3",
+        delete=False,
+    )
+    temp_file.close()
+    return Path(temp_file.name)
+
+
+def _validate_sqlite_file(file_path: Path) -> None:
+    # with 문은 커밋만 하고 닫지 않으므로 직접 닫아야 파일을 옮기기 전에 WAL이 정리된다.
+    validation_connection = sqlite3.connect(file_path)
+    try:
+        row = validation_connection.execute("PRAGMA integrity_check").fetchone()
+    finally:
+        validation_connection.close()
+    if not row or str(row[0]).strip().lower() != "ok":
+        raise RuntimeError("다운로드한 SQLite snapshot 무결성 검증에 실패했어")
+
+
+def _replace_sqlite_file(source_path: Path, target_path: Path) -> None:
+    Path(f"{target_path}-wal").unlink(missing_ok=True)
+    Path(f"{target_path}-shm").unlink(missing_ok=True)
+    target_path.unlink(missing_ok=True)
+    source_path.replace(target_path)
+
+
 def _backup_sqlite_to_s3(
     db_path: str | Path,
     *,
@@ -194,46 +584,63 @@ def _backup_sqlite_to_s3(
     s3_client: Any | None = None,
     storage_class: str | None = None,
     server_side_encryption: str | None = None,
+    compression: str = "none",
+    multipart_chunk_size: int = _S3_MIN_MULTIPART_CHUNK_BYTES,
 ) -> dict[str, Any]:
     actual_bucket = str(bucket or "").strip()
     if not actual_bucket:
         raise ValueError("S3 백업 버킷이 필요해")
 
+    actual_compression = _normalize_sqlite_compression(compression)
     snapshot_path = _create_sqlite_snapshot(db_path)
-    resolved_object_key = _build_sqlite_snapshot_key(
-        db_path,
-        key_prefix=key_prefix,
-        object_key=object_key,
+    resolved_object_key = _sqlite_object_key_for_compression(
+        _build_sqlite_snapshot_key(
+            db_path,
+            key_prefix=key_prefix,
+            object_key=object_key,
+        ),
+        actual_compression,
     )
     client = s3_client or _build_s3_client()
-    extra_args: dict[str, str] = {}
-
-    actual_storage_class = str(storage_class or "").strip()
-    if actual_storage_class:
-        extra_args["StorageClass"] = actual_storage_class
-
-    actual_sse = str(server_side_encryption or "").strip()
-    if actual_sse:
-        extra_args["ServerSideEncryption"] = actual_sse
-
     try:
-        if extra_args:
-            client.upload_file(
-                str(snapshot_path),
-                actual_bucket,
-                resolved_object_key,
-                ExtraArgs=extra_args,
-            )
-        else:
-            client.upload_file(str(snapshot_path), actual_bucket, resolved_object_key)
+        manifest = _upload_sqlite_file_to_s3(
+            client,
+            snapshot_path,
+            bucket=actual_bucket,
+            object_key=resolved_object_key,
+            storage_class=storage_class,
+            server_side_encryption=server_side_encryption,
+            compression=actual_compression,
+            multipart_chunk_size=multipart_chunk_size,
+        )
     finally:
         snapshot_path.unlink(missing_ok=True)
 
-    return {
+    # 고정 object key는 위치가 정해져 있어 포인터가 필요 없고, 날짜별 키일 때만 최신 위치를 남긴다.
+    if not str(object_key or "").strip().strip("/"):
+        _write_sqlite_latest_pointer(
+            client,
+            bucket=actual_bucket,
+            root=key_prefix,
+            payload={
+                "key": resolved_object_key,
+                "compression": actual_compression,
+                "size": manifest["compressedSize"] if manifest is not None else None,
+            },
+            server_side_encryption=server_side_encryption,
+        )
+
+    result: dict[str, Any] = {
         "bucket": actual_bucket,
         "key": resolved_object_key,
         "dbPath": str(_resolve_sqlite_path(db_path)),
+        "compression": actual_compression,
     }
+    if manifest is not None:
+        result["rawSize"] = manifest["rawSize"]
+        result["size"] = manifest["compressedSize"]
+        result["manifestKey"] = f"{resolved_object_key}{_SQLITE_MANIFEST_SUFFIX}"
+    return result
 
 
 def _restore_sqlite_from_s3(
@@ -257,9 +664,25 @@ def _restore_sqlite_from_s3(
     resolved_object_key = str(object_key or "").strip().strip("/")
     backup_target: dict[str, Any] | None
     if resolved_object_key:
-        try:
-            metadata = client.head_object(Bucket=str(bucket), Key=resolved_object_key)
-        except Exception:
+        backup_target = None
+        # 압축 백업으로 바뀐 뒤에도 예전 비압축 키를 복원할 수 있게 .gz부터 차례로 찾는다.
+        for candidate_key in (
+            _sqlite_object_key_for_compression(resolved_object_key, "gzip"),
+            resolved_object_key,
+        ):
+            try:
+                metadata = client.head_object(Bucket=str(bucket), Key=candidate_key)
+            except Exception:
+                continue
+            backup_target = {
+                "bucket": str(bucket or "").strip(),
+                "key": candidate_key,
+                "lastModified": metadata.get("LastModified"),
+                "size": int(metadata.get("ContentLength") or 0),
+                "etag": metadata.get("ETag"),
+            }
+            break
+        if backup_target is None:
             return {
                 "restored": False,
                 "reason": "remote_missing",
@@ -267,13 +690,6 @@ def _restore_sqlite_from_s3(
                 "bucket": str(bucket or "").strip(),
                 "key": resolved_object_key,
             }
-        backup_target = {
-            "bucket": str(bucket or "").strip(),
-            "key": resolved_object_key,
-            "lastModified": metadata.get("LastModified"),
-            "size": int(metadata.get("ContentLength") or 0),
-            "etag": metadata.get("ETag"),
-        }
     else:
         backup_target = _find_latest_sqlite_backup_in_s3(
             bucket=bucket,
@@ -288,24 +704,17 @@ def _restore_sqlite_from_s3(
             "bucket": str(bucket or "").strip(),
         }
 
-    temp_file = tempfile.NamedTemporaryFile(
-        prefix=f"{target_path.stem}-restore-",
-        suffix=target_path.suffix or ".sqlite3",
-        delete=False,
-    )
-    temp_file.close()
-    temp_path = Path(temp_file.name)
-
+    temp_path = _create_sqlite_temp_path(target_path, "restore")
     try:
-        client.download_file(str(bucket), str(backup_target["key"]), str(temp_path))
-        with sqlite3.connect(temp_path) as validation_connection:
-            row = validation_connection.execute("PRAGMA integrity_check").fetchone()
-            if not row or str(row[0]).strip().lower() != "ok":
-                raise RuntimeError("다운로드한 SQLite snapshot 무결성 검증에 실패했어")
-        Path(f"{target_path}-wal").unlink(missing_ok=True)
-        Path(f"{target_path}-shm").unlink(missing_ok=True)
-        target_path.unlink(missing_ok=True)
-        temp_path.replace(target_path)
+        verified = _download_sqlite_from_s3(
+            client,
+            bucket=str(bucket),
+            object_key=str(backup_target["key"]),
+            target_path=temp_path,
+        )
+        if not verified:
+            _validate_sqlite_file(temp_path)
+        _replace_sqlite_file(temp_path, target_path)
     finally:
         temp_path.unlink(missing_ok=True)
 
@@ -317,3 +726,691 @@ def _restore_sqlite_from_s3(
         "size": backup_target.get("size"),
         "lastModified": backup_target.get("lastModified"),
     }
+
+
+# 증분 백업은 테이블 변경을 트리거로 {table}_changes에 쌓아 두고, 마지막 백업 이후 바뀐 행만
+# 별도 SQLite 파일(delta)로 내보낸다. S3에는 {root}/{baseId}/base, delta-000001 ... 순서로 올린다.
+def _sqlite_change_table_name(table_name: str) -> str:
+    return f"{table_name}_changes"
+
+
+def _sqlite_backup_state_table_name(table_name: str) -> str:
+    return f"{table_name}_backup_state"
+
+
+def _sqlite_change_tracking_statements(table_name: str, key_column: str) -> tuple[str, ...]:
+    change_table = _sqlite_change_table_name(table_name)
+    return (
+        f"""
+        CREATE TABLE IF NOT EXISTS {change_table} (
+            changeSeq INTEGER PRIMARY KEY AUTOINCREMENT,
+            rowKey INTEGER NOT NULL
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS {_sqlite_backup_state_table_name(table_name)} (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            baseId TEXT NOT NULL,
+            deltaIndex INTEGER NOT NULL,
+            changeWatermark INTEGER NOT NULL
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {change_table}_after_insert
+        AFTER INSERT ON {table_name}
+        BEGIN
+            INSERT INTO {change_table}(rowKey) VALUES (new.{key_column});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {change_table}_after_update
+        AFTER UPDATE ON {table_name}
+        BEGIN
+            INSERT INTO {change_table}(rowKey) VALUES (new.{key_column});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {change_table}_after_delete
+        AFTER DELETE ON {table_name}
+        BEGIN
+            INSERT INTO {change_table}(rowKey) VALUES (old.{key_column});
+        END
+        """,
+    )
+
+
+def _drop_sqlite_change_tracking(connection: sqlite3.Connection, table_name: str) -> None:
+    change_table = _sqlite_change_table_name(table_name)
+    for suffix in ("after_insert", "after_update", "after_delete"):
+        connection.execute(f"DROP TRIGGER IF EXISTS {change_table}_{suffix}")
+    connection.execute(f"DROP TABLE IF EXISTS {change_table}")
+    connection.execute(f"DROP TABLE IF EXISTS {_sqlite_backup_state_table_name(table_name)}")
+
+
+def _reset_sqlite_backup_state(connection: sqlite3.Connection, table_name: str) -> None:
+    # delta는 table_name 한 테이블의 변경만 담는다. 다른 테이블까지 같이 바꾼 쓰기는 이걸 불러서
+    # 다음 백업이 delta 대신 새 base를 뜨게 한다. 증분 백업을 안 쓰면 상태 테이블이 없으니 그냥 넘어간다.
+    state_table = _sqlite_backup_state_table_name(table_name)
+    exists = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (state_table,),
+    ).fetchone()
+    if exists is not None:
+        connection.execute(f"DELETE FROM {state_table} WHERE id = 1")
+
+
+def _build_sqlite_sibling_root(
+    db_path: str | Path,
+    *,
+    suffix: str,
+    key_prefix: str = "",
+    object_key: str = "",
+) -> str:
+    normalized_object_key = str(object_key or "").strip().strip("/")
+    if normalized_object_key:
+        object_path = PurePosixPath(normalized_object_key)
+        return str(object_path.with_name(f"{object_path.stem}{suffix}"))
+
+    resolved_path = _resolve_sqlite_path(db_path)
+    normalized_prefix = str(key_prefix or "").strip().strip("/")
+    root_name = f"{resolved_path.stem}{suffix}"
+    if normalized_prefix:
+        return f"{normalized_prefix}/{root_name}"
+    return root_name
+
+
+def _build_sqlite_incremental_root(
+    db_path: str | Path,
+    *,
+    key_prefix: str = "",
+    object_key: str = "",
+) -> str:
+    return _build_sqlite_sibling_root(
+        db_path,
+        suffix=_SQLITE_INCREMENTAL_ROOT_SUFFIX,
+        key_prefix=key_prefix,
+        object_key=object_key,
+    )
+
+
+def _build_sqlite_archive_root(
+    db_path: str | Path,
+    *,
+    key_prefix: str = "",
+    object_key: str = "",
+) -> str:
+    return _build_sqlite_sibling_root(
+        db_path,
+        suffix=_SQLITE_ARCHIVE_ROOT_SUFFIX,
+        key_prefix=key_prefix,
+        object_key=object_key,
+    )
+
+
+def _sqlite_change_watermark(connection: sqlite3.Connection, table_name: str) -> int:
+    row = connection.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = ?",
+        (_sqlite_change_table_name(table_name),),
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _read_sqlite_backup_state(
+    connection: sqlite3.Connection,
+    table_name: str,
+) -> tuple[str, int, int] | None:
+    row = connection.execute(
+        f"""
+        SELECT baseId, deltaIndex, changeWatermark
+        FROM {_sqlite_backup_state_table_name(table_name)}
+        WHERE id = 1
+        """
+    ).fetchone()
+    if row is None:
+        return None
+    return str(row[0]), int(row[1]), int(row[2])
+
+
+def _commit_sqlite_backup_state(
+    connection: sqlite3.Connection,
+    table_name: str,
+    *,
+    base_id: str,
+    delta_index: int,
+    change_watermark: int,
+) -> None:
+    # 올린 변경분까지만 지우므로, 백업 도중 새로 쌓인 변경은 다음 delta로 넘어간다.
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.execute(
+            f"DELETE FROM {_sqlite_change_table_name(table_name)} WHERE changeSeq <= ?",
+            (change_watermark,),
+        )
+        connection.execute(
+            f"""
+            INSERT INTO {_sqlite_backup_state_table_name(table_name)} (id, baseId, deltaIndex, changeWatermark)
+            VALUES (1, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                baseId = excluded.baseId,
+                deltaIndex = excluded.deltaIndex,
+                changeWatermark = excluded.changeWatermark
+            """,
+            (base_id, delta_index, change_watermark),
+        )
+        connection.execute("COMMIT")
+    except Exception:
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+
+
+def _export_sqlite_table_delta(
+    connection: sqlite3.Connection,
+    delta_path: Path,
+    *,
+    table_name: str,
+    key_column: str,
+    after_watermark: int,
+) -> tuple[int, int]:
+    change_table = _sqlite_change_table_name(table_name)
+    connection.execute("ATTACH DATABASE ? AS delta", (str(delta_path),))
+    try:
+        # 워터마크와 행 내용을 같은 읽기 트랜잭션에서 떠야 delta가 한 시점의 상태가 된다.
+        connection.execute("BEGIN")
+        try:
+            until_watermark = int(
+                connection.execute(
+                    f"SELECT COALESCE(MAX(changeSeq), ?) FROM main.{change_table}",
+                    (after_watermark,),
+                ).fetchone()[0]
+            )
+            if until_watermark <= after_watermark:
+                connection.execute("ROLLBACK")
+                return after_watermark, 0
+            changed_keys_sql = (
+                f"SELECT rowKey FROM main.{change_table} WHERE changeSeq > ? AND changeSeq <= ?"
+            )
+            connection.execute(
+                f"""
+                CREATE TABLE delta.{table_name} AS
+                SELECT * FROM main.{table_name}
+                WHERE {key_column} IN ({changed_keys_sql})
+                """,
+                (after_watermark, until_watermark),
+            )
+            connection.execute(
+                f"""
+                CREATE TABLE delta.{_SQLITE_DELTA_DELETED_TABLE_NAME} AS
+                SELECT DISTINCT rowKey FROM main.{change_table}
+                WHERE changeSeq > ? AND changeSeq <= ?
+                  AND rowKey NOT IN (SELECT {key_column} FROM main.{table_name})
+                """,
+                (after_watermark, until_watermark),
+            )
+            change_count = int(
+                connection.execute(
+                    f"""
+                    SELECT
+                        (SELECT COUNT(*) FROM delta.{table_name})
+                        + (SELECT COUNT(*) FROM delta.{_SQLITE_DELTA_DELETED_TABLE_NAME})
+                    """
+                ).fetchone()[0]
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+    finally:
+        connection.execute("DETACH DATABASE delta")
+    return until_watermark, change_count
+
+
+def _apply_sqlite_table_delta(
+    connection: sqlite3.Connection,
+    delta_path: Path,
+    *,
+    table_name: str,
+    key_column: str,
+    replay_statements: Sequence[str] = (),
+) -> None:
+    connection.execute("ATTACH DATABASE ? AS delta", (str(delta_path),))
+    try:
+        main_columns = [
+            str(row[1]) for row in connection.execute(f"PRAGMA main.table_info({table_name})").fetchall()
+        ]
+        delta_columns = {
+            str(row[1]) for row in connection.execute(f"PRAGMA delta.table_info({table_name})").fetchall()
+        }
+        columns = [column for column in main_columns if column in delta_columns]
+        column_list = ", ".join(columns)
+        update_list = ", ".join(
+            f"{column} = excluded.{column}" for column in columns if column != key_column
+        )
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in replay_statements:
+                connection.execute(statement)
+            connection.execute(
+                f"""
+                DELETE FROM main.{table_name}
+                WHERE {key_column} IN (SELECT rowKey FROM delta.{_SQLITE_DELTA_DELETED_TABLE_NAME})
+                """
+            )
+            # REPLACE는 삭제 트리거를 건너뛰므로, 기존 행은 UPSERT로 갱신해 트리거(FTS 등)가 그대로 돌게 한다.
+            connection.execute(
+                f"""
+                INSERT INTO main.{table_name} ({column_list})
+                SELECT {column_list} FROM delta.{table_name} WHERE true
+                ON CONFLICT({key_column}) DO UPDATE SET {update_list}
+                """
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+    finally:
+        connection.execute("DETACH DATABASE delta")
+
+
+def _new_sqlite_incremental_base_id() -> str:
+    return datetime.now(timezone.utc).strftime(_SQLITE_INCREMENTAL_BASE_ID_FORMAT)
+
+
+def _backup_sqlite_incremental_to_s3(
+    db_path: str | Path,
+    *,
+    table_name: str,
+    key_column: str,
+    bucket: str,
+    key_prefix: str = "",
+    object_key: str = "",
+    full_backup_every: int = 24,
+    s3_client: Any | None = None,
+    storage_class: str | None = None,
+    server_side_encryption: str | None = None,
+    compression: str = "none",
+    multipart_chunk_size: int = _S3_MIN_MULTIPART_CHUNK_BYTES,
+) -> dict[str, Any]:
+    actual_bucket = str(bucket or "").strip()
+    if not actual_bucket:
+        raise ValueError("S3 백업 버킷이 필요해")
+
+    resolved_path = _resolve_sqlite_path(db_path)
+    root = _build_sqlite_incremental_root(
+        resolved_path,
+        key_prefix=key_prefix,
+        object_key=object_key,
+    )
+    actual_compression = _normalize_sqlite_compression(compression)
+    suffix = _sqlite_object_key_for_compression(resolved_path.suffix or ".sqlite3", actual_compression)
+    client = s3_client or _build_s3_client()
+    connection = _connect_sqlite(resolved_path, row_factory=False)
+    try:
+        state = _read_sqlite_backup_state(connection, table_name)
+        if state is not None and state[1] < max(0, full_backup_every):
+            base_id, delta_index, after_watermark = state
+            delta_path = _create_sqlite_temp_path(resolved_path, "delta")
+            try:
+                until_watermark, change_count = _export_sqlite_table_delta(
+                    connection,
+                    delta_path,
+                    table_name=table_name,
+                    key_column=key_column,
+                    after_watermark=after_watermark,
+                )
+                if change_count <= 0:
+                    return {
+                        "bucket": actual_bucket,
+                        "key": None,
+                        "dbPath": str(resolved_path),
+                        "mode": "delta",
+                        "baseId": base_id,
+                        "deltaIndex": delta_index,
+                        "changeCount": 0,
+                        "skipped": True,
+                    }
+                delta_key = f"{root}/{base_id}/delta-{delta_index + 1:06d}{suffix}"
+                _upload_sqlite_file_to_s3(
+                    client,
+                    delta_path,
+                    bucket=actual_bucket,
+                    object_key=delta_key,
+                    storage_class=storage_class,
+                    server_side_encryption=server_side_encryption,
+                    compression=actual_compression,
+                    multipart_chunk_size=multipart_chunk_size,
+                )
+            finally:
+                delta_path.unlink(missing_ok=True)
+            pointer = _read_s3_json(
+                client,
+                bucket=actual_bucket,
+                object_key=_sqlite_latest_pointer_key(root),
+            )
+            if pointer is not None and pointer.get("baseId") == base_id:
+                base_key = str(pointer.get("baseKey") or "")
+                delta_keys = [str(key) for key in pointer.get("deltaKeys") or []]
+            else:
+                # 포인터가 없거나 다른 체인을 가리키면 키 규칙으로 현재 체인 목록을 다시 만든다.
+                base_key = f"{root}/{base_id}/base{suffix}"
+                delta_keys = [
+                    f"{root}/{base_id}/delta-{index:06d}{suffix}"
+                    for index in range(1, delta_index + 1)
+                ]
+            _write_sqlite_latest_pointer(
+                client,
+                bucket=actual_bucket,
+                root=root,
+                payload={"baseId": base_id, "baseKey": base_key, "deltaKeys": [*delta_keys, delta_key]},
+                server_side_encryption=server_side_encryption,
+            )
+            _commit_sqlite_backup_state(
+                connection,
+                table_name,
+                base_id=base_id,
+                delta_index=delta_index + 1,
+                change_watermark=until_watermark,
+            )
+            return {
+                "bucket": actual_bucket,
+                "key": delta_key,
+                "dbPath": str(resolved_path),
+                "mode": "delta",
+                "baseId": base_id,
+                "deltaIndex": delta_index + 1,
+                "changeCount": change_count,
+                "skipped": False,
+            }
+
+        snapshot_path = _create_sqlite_snapshot(resolved_path)
+        try:
+            # 스냅샷 파일 안의 시퀀스를 읽어야 스냅샷과 워터마크가 정확히 같은 시점을 가리킨다.
+            snapshot_connection = sqlite3.connect(snapshot_path)
+            try:
+                base_watermark = _sqlite_change_watermark(snapshot_connection, table_name)
+            finally:
+                snapshot_connection.close()
+            base_id = _new_sqlite_incremental_base_id()
+            base_key = f"{root}/{base_id}/base{suffix}"
+            _upload_sqlite_file_to_s3(
+                client,
+                snapshot_path,
+                bucket=actual_bucket,
+                object_key=base_key,
+                storage_class=storage_class,
+                server_side_encryption=server_side_encryption,
+                compression=actual_compression,
+                multipart_chunk_size=multipart_chunk_size,
+            )
+        finally:
+            snapshot_path.unlink(missing_ok=True)
+        _write_sqlite_latest_pointer(
+            client,
+            bucket=actual_bucket,
+            root=root,
+            payload={"baseId": base_id, "baseKey": base_key, "deltaKeys": []},
+            server_side_encryption=server_side_encryption,
+        )
+        _commit_sqlite_backup_state(
+            connection,
+            table_name,
+            base_id=base_id,
+            delta_index=0,
+            change_watermark=base_watermark,
+        )
+        return {
+            "bucket": actual_bucket,
+            "key": base_key,
+            "dbPath": str(resolved_path),
+            "mode": "base",
+            "baseId": base_id,
+            "deltaIndex": 0,
+            "skipped": False,
+        }
+    finally:
+        connection.close()
+
+
+def _find_latest_sqlite_incremental_chain_in_s3(
+    *,
+    bucket: str,
+    root: str,
+    s3_client: Any | None = None,
+) -> dict[str, Any] | None:
+    client = s3_client or _build_s3_client()
+    pointer = _read_s3_json(
+        client,
+        bucket=bucket,
+        object_key=_sqlite_latest_pointer_key(root),
+    )
+    if pointer is not None and pointer.get("baseId") and pointer.get("baseKey"):
+        return {
+            "baseId": str(pointer["baseId"]),
+            "base": {"key": str(pointer["baseKey"])},
+            "deltas": [{"key": str(key)} for key in pointer.get("deltaKeys") or []],
+            "lastModified": pointer.get("updatedAtUtc"),
+        }
+
+    objects = _list_sqlite_backups_in_s3(
+        bucket=bucket,
+        key_prefix=root,
+        s3_client=client,
+    )
+    key_pattern = re.compile(
+        rf"^{re.escape(root)}/(?P<base_id>\d{{8}}T\d{{6}}Z)/(?:(?P<base>base)|delta-(?P<delta>\d{{6}}))(?:\.[^/]*)?$"
+    )
+    chains: dict[str, dict[str, Any]] = {}
+    for item in objects:
+        key = str(item.get("key") or "")
+        if key.endswith(_SQLITE_MANIFEST_SUFFIX):
+            continue
+        match = key_pattern.match(key)
+        if not match:
+            continue
+        chain = chains.setdefault(match.group("base_id"), {"base": None, "deltas": {}})
+        if match.group("base"):
+            chain["base"] = item
+        else:
+            chain["deltas"][int(match.group("delta"))] = item
+
+    for base_id in sorted(chains, reverse=True):
+        chain = chains[base_id]
+        if chain["base"] is None:
+            continue
+        # 중간 delta가 빠졌으면 그 뒤 delta는 기준 상태가 달라서 이어 붙이지 않는다.
+        deltas: list[dict[str, Any]] = []
+        while len(deltas) + 1 in chain["deltas"]:
+            deltas.append(chain["deltas"][len(deltas) + 1])
+        return {
+            "baseId": base_id,
+            "base": chain["base"],
+            "deltas": deltas,
+            "lastModified": (deltas[-1] if deltas else chain["base"]).get("lastModified"),
+        }
+    return None
+
+
+def _restore_sqlite_incremental_from_s3(
+    db_path: str | Path,
+    *,
+    table_name: str,
+    key_column: str,
+    bucket: str,
+    key_prefix: str = "",
+    object_key: str = "",
+    s3_client: Any | None = None,
+    only_if_missing: bool = True,
+    replay_statements: Sequence[str] = (),
+) -> dict[str, Any]:
+    target_path = _ensure_sqlite_parent_dir(db_path)
+    if only_if_missing and _sqlite_file_exists(target_path):
+        return {
+            "restored": False,
+            "reason": "local_exists",
+            "dbPath": str(target_path),
+        }
+
+    client = s3_client or _build_s3_client()
+    actual_bucket = str(bucket or "").strip()
+    root = _build_sqlite_incremental_root(
+        target_path,
+        key_prefix=key_prefix,
+        object_key=object_key,
+    )
+    chain = _find_latest_sqlite_incremental_chain_in_s3(
+        bucket=actual_bucket,
+        root=root,
+        s3_client=client,
+    )
+    if chain is None:
+        return {
+            "restored": False,
+            "reason": "remote_missing",
+            "dbPath": str(target_path),
+            "bucket": actual_bucket,
+        }
+
+    temp_path = _create_sqlite_temp_path(target_path, "restore")
+    delta_path = _create_sqlite_temp_path(target_path, "restore-delta")
+    try:
+        verified = _download_sqlite_from_s3(
+            client,
+            bucket=actual_bucket,
+            object_key=str(chain["base"]["key"]),
+            target_path=temp_path,
+        )
+        if not verified:
+            _validate_sqlite_file(temp_path)
+        connection = sqlite3.connect(temp_path, isolation_level=None)
+        try:
+            for delta in chain["deltas"]:
+                _download_sqlite_from_s3(
+                    client,
+                    bucket=actual_bucket,
+                    object_key=str(delta["key"]),
+                    target_path=delta_path,
+                )
+                _apply_sqlite_table_delta(
+                    connection,
+                    delta_path,
+                    table_name=table_name,
+                    key_column=key_column,
+                    replay_statements=replay_statements,
+                )
+            # 복원본은 체인 끝 상태와 같으므로 쌓인 변경을 비우고 다음 백업이 같은 체인에 이어지게 한다.
+            _commit_sqlite_backup_state(
+                connection,
+                table_name,
+                base_id=str(chain["baseId"]),
+                delta_index=len(chain["deltas"]),
+                change_watermark=_sqlite_change_watermark(connection, table_name),
+            )
+        finally:
+            connection.close()
+        _replace_sqlite_file(temp_path, target_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+        delta_path.unlink(missing_ok=True)
+
+    return {
+        "restored": True,
+        "dbPath": str(target_path),
+        "bucket": actual_bucket,
+        "key": str(chain["base"]["key"]),
+        "baseId": chain["baseId"],
+        "deltaCount": len(chain["deltas"]),
+        "lastModified": chain.get("lastModified"),
+    }
+
+
+def _prune_sqlite_backups_in_s3(
+    *,
+    bucket: str,
+    key_prefix: str = "",
+    keep_count: int,
+    s3_client: Any | None = None,
+) -> list[str]:
+    # 날짜별 전체 스냅샷을 최신 keep_count개만 남긴다. latest.json이 가리키는 스냅샷은 항상 남긴다.
+    if keep_count <= 0:
+        return []
+
+    client = s3_client or _build_s3_client()
+    actual_bucket = str(bucket or "").strip()
+    objects = _list_sqlite_backups_in_s3(
+        bucket=actual_bucket,
+        key_prefix=key_prefix,
+        s3_client=client,
+    )
+    object_keys = {str(item.get("key") or "") for item in objects}
+    snapshots = sorted(
+        (item for item in objects if _is_sqlite_snapshot_object_key(str(item.get("key") or ""))),
+        key=lambda item: (
+            str(item.get("lastModified") or ""),
+            str(item.get("key") or ""),
+        ),
+        reverse=True,
+    )
+    pointer = _read_s3_json(
+        client,
+        bucket=actual_bucket,
+        object_key=_sqlite_latest_pointer_key(key_prefix),
+    )
+    protected_key = str((pointer or {}).get("key") or "")
+    expired_keys = [
+        str(item["key"]) for item in snapshots[keep_count:]
+        if str(item["key"]) != protected_key
+    ]
+    delete_keys = [
+        key
+        for expired_key in expired_keys
+        for key in (expired_key, f"{expired_key}{_SQLITE_MANIFEST_SUFFIX}")
+        if key in object_keys
+    ]
+    _delete_s3_objects(client, bucket=actual_bucket, keys=delete_keys)
+    return expired_keys
+
+
+def _prune_sqlite_incremental_chains_in_s3(
+    *,
+    bucket: str,
+    root: str,
+    keep_count: int,
+    s3_client: Any | None = None,
+) -> list[str]:
+    # 증분 체인은 base와 delta가 함께 있어야 복원되므로 체인 단위로 지운다.
+    if keep_count <= 0:
+        return []
+
+    client = s3_client or _build_s3_client()
+    actual_bucket = str(bucket or "").strip()
+    objects = _list_sqlite_backups_in_s3(
+        bucket=actual_bucket,
+        key_prefix=root,
+        s3_client=client,
+    )
+    chain_pattern = re.compile(rf"^{re.escape(root)}/(?P<base_id>\d{{8}}T\d{{6}}Z)/")
+    chain_keys: dict[str, list[str]] = {}
+    for item in objects:
+        key = str(item.get("key") or "")
+        match = chain_pattern.match(key)
+        if match:
+            chain_keys.setdefault(match.group("base_id"), []).append(key)
+
+    pointer = _read_s3_json(
+        client,
+        bucket=actual_bucket,
+        object_key=_sqlite_latest_pointer_key(root),
+    )
+    protected_base_id = str((pointer or {}).get("baseId") or "")
+    expired_base_ids = [
+        base_id for base_id in sorted(chain_keys, reverse=True)[keep_count:]
+        if base_id != protected_base_id
+    ]
+    _delete_s3_objects(
+        client,
+        bucket=actual_bucket,
+        keys=[key for base_id in expired_base_ids for key in chain_keys[base_id]],
+    )
+    return expired_base_ids
@@ -1,18 +1,28 @@
+import atexit
 import logging
+import queue
+import threading
+import time
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Any, Callable, Protocol, TypedDict
 
 from slack_bolt import App
 
 from boxer.core import settings as s
+from boxer.core.thread_context import _record_thread_message_event
 from boxer.core.utils import _extract_question, _format_reply_text, _validate_tokens
 from boxer_adapter_slack import settings as ss
 from boxer.routers.common.request_log import (
     _initialize_request_log_storage,
     _save_request_log_record,
+    _save_request_log_records,
 )
 
 _SLACK_USER_NAME_CACHE: dict[tuple[str, str], str | None] = {}
+_REQUEST_LOG_INGEST_QUEUE: "_RequestLogIngestQueue | None" = None
+_REQUEST_LOG_INGEST_QUEUE_LOCK = threading.Lock()
+_REQUEST_LOG_INGEST_STOP = object()
 
 
 class SlackRequestLogContext(TypedDict, total=False):
@@ -255,25 +265,49 @@ def _load_slack_user_name(
     return user_name
 
 
-def _persist_request_log(
+def _snapshot_request_log_event(
     payload: MentionPayload | MessagePayload,
     *,
     event_type: str,
-    client: Any,
-    logger: logging.Logger,
-) -> None:
-    if not s.REQUEST_LOG_SQLITE_ENABLED:
-        return
-
+) -> dict[str, Any] | None:
+    # 핸들러 스레드에서는 payload 값만 복사하고, Slack API 호출과 저장은 writer 스레드에서 한다.
     current_ts = str(payload.get("current_ts") or "").strip()
     if not current_ts:
-        return
+        return None
 
     context = _ensure_request_log_context(payload)
-    channel_id = str(payload.get("channel_id") or "").strip()
-    thread_ts = str(payload.get("thread_ts") or "").strip() or current_ts
-    workspace_id = str(payload.get("workspace_id") or "").strip()
-    user_id = str(payload.get("user_id") or "unknown").strip() or "unknown"
+    metadata = context.get("metadata")
+    return {
+        "event_type": event_type,
+        "current_ts": current_ts,
+        "channel_id": str(payload.get("channel_id") or "").strip(),
+        "thread_ts": str(payload.get("thread_ts") or "").strip() or current_ts,
+        "workspace_id": str(payload.get("workspace_id") or "").strip(),
+        "user_id": str(payload.get("user_id") or "unknown").strip() or "unknown",
+        "raw_text": str(payload.get("raw_text") or "").strip(),
+        "question": str(payload.get("question") or "").strip(),
+        # writer 스레드가 늦게 저장해도 요청 시각이 밀리지 않도록 큐에 넣는 시점에 찍는다.
+        "created_at_utc": datetime.now(timezone.utc).replace(microsecond=0),
+        "context": {
+            **context,
+            "metadata": dict(metadata) if isinstance(metadata, dict) else metadata,
+        },
+    }
+
+
+def _build_request_log_record_from_snapshot(
+    snapshot: dict[str, Any],
+    *,
+    client: Any,
+    logger: logging.Logger,
+) -> dict[str, Any]:
+    event_type = str(snapshot["event_type"])
+    context = snapshot["context"]
+    current_ts = str(snapshot["current_ts"])
+    channel_id = str(snapshot["channel_id"])
+    thread_ts = str(snapshot["thread_ts"])
+    workspace_id = str(snapshot["workspace_id"])
+    user_id = str(snapshot["user_id"])
     permalink = str(context.get("permalink") or "").strip() or None
     if permalink is None:
         permalink = _load_slack_permalink(client, channel_id, current_ts, logger)
@@ -283,59 +317,258 @@ def _persist_request_log(
         thread_permalink = _load_slack_permalink(client, channel_id, thread_ts, logger)
 
     if event_type == "app_mention":
-        normalized_question = str(payload.get("question") or "").strip() or None
+        normalized_question = str(snapshot.get("question") or "").strip() or None
     else:
-        normalized_question = str(payload.get("raw_text") or "").strip() or None
+        normalized_question = str(snapshot.get("raw_text") or "").strip() or None
 
     user_name = str(context.get("user_name") or "").strip() or None
     if user_name is None:
         user_name = _load_slack_user_name(client, workspace_id, user_id, logger)
-        if user_name is not None:
-            context["user_name"] = user_name
 
+    return {
+        "createdAtUtc": snapshot.get("created_at_utc"),
+        "sourcePlatform": "slack",
+        "workspaceId": workspace_id,
+        "eventType": event_type,
+        "routeName": str(context.get("route_name") or event_type).strip() or event_type,
+        "routeMode": str(context.get("route_mode") or "").strip() or None,
+        "handlerType": (
+            str(context.get("handler_type") or "").strip()
+            or ("router" if event_type == "app_mention" else "message_event")
+        ),
+        "status": str(context.get("status") or "handled").strip() or "handled",
+        "userId": user_id,
+        "userName": user_name,
+        "channelId": channel_id,
+        "threadId": thread_ts,
+        "messageId": current_ts,
+        "isThreadRoot": int(thread_ts == current_ts),
+        "permalink": permalink,
+        "threadPermalink": thread_permalink,
+        "requestText": str(snapshot.get("raw_text") or ""),
+        "normalizedQuestion": normalized_question,
+        "requestKey": str(context.get("request_key") or "").strip() or None,
+        "subjectType": str(context.get("subject_type") or "").strip() or None,
+        "subjectKey": str(context.get("subject_key") or "").strip() or None,
+        "requestedDate": str(context.get("requested_date") or "").strip() or None,
+        "replyCount": int(context.get("reply_count") or 0),
+        "firstRepliedAtUtc": context.get("first_replied_at_utc"),
+        "errorType": str(context.get("error_type") or "").strip() or None,
+        "metadata": context.get("metadata"),
+    }
+
+
+def _write_request_log_snapshot(
+    snapshot: dict[str, Any],
+    *,
+    client: Any,
+    logger: logging.Logger,
+) -> None:
     try:
         _save_request_log_record(
-            {
-                "sourcePlatform": "slack",
-                "workspaceId": workspace_id,
-                "eventType": event_type,
-                "routeName": str(context.get("route_name") or event_type).strip() or event_type,
-                "routeMode": str(context.get("route_mode") or "").strip() or None,
-                "handlerType": (
-                    str(context.get("handler_type") or "").strip()
-                    or ("router" if event_type == "app_mention" else "message_event")
-                ),
-                "status": str(context.get("status") or "handled").strip() or "handled",
-                "userId": user_id,
-                "userName": user_name,
-                "channelId": channel_id,
-                "threadId": thread_ts,
-                "messageId": current_ts,
-                "isThreadRoot": int(thread_ts == current_ts),
-                "permalink": permalink,
-                "threadPermalink": thread_permalink,
-                "requestText": str(payload.get("raw_text") or "").strip(),
-                "normalizedQuestion": normalized_question,
-                "requestKey": str(context.get("request_key") or "").strip() or None,
-                "subjectType": str(context.get("subject_type") or "").strip() or None,
-                "subjectKey": str(context.get("subject_key") or "").strip() or None,
-                "requestedDate": str(context.get("requested_date") or "").strip() or None,
-                "replyCount": int(context.get("reply_count") or 0),
-                "firstRepliedAtUtc": context.get("first_replied_at_utc"),
-                "errorType": str(context.get("error_type") or "").strip() or None,
-                "metadata": context.get("metadata"),
-            }
+            _build_request_log_record_from_snapshot(snapshot, client=client, logger=logger)
         )
     except Exception:
         logger.warning(
             "Failed to persist request log event_type=%s channel=%s ts=%s",
-            event_type,
-            channel_id,
-            current_ts,
+            snapshot.get("event_type"),
+            snapshot.get("channel_id"),
+            snapshot.get("current_ts"),
             exc_info=True,
         )
 
 
+class _RequestLogIngestQueue:
+    # 이벤트 핸들러는 큐에 넣기만 하고, writer 스레드 하나가 N건 또는 T ms 단위로 묶어 저장한다.
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        put_timeout_sec: float,
+        batch_max_records: int,
+        batch_max_wait_sec: float,
+    ) -> None:
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, max_size))
+        self._put_timeout_sec = max(0.0, put_timeout_sec)
+        self._batch_max_records = max(1, batch_max_records)
+        self._batch_max_wait_sec = max(0.0, batch_max_wait_sec)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="request-log-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def submit(self, snapshot: dict[str, Any], *, client: Any, logger: logging.Logger) -> bool:
+        if self._closed:
+            return False
+        self._ensure_started()
+        try:
+            # 큐가 차면 잠깐 기다리고, 그래도 차 있으면 버린다. 동기 저장으로 새치기하면 순서가 꼬인다.
+            self._queue.put((snapshot, client, logger), timeout=self._put_timeout_sec)
+        except queue.Full:
+            return False
+        return True
+
+    def flush(self, timeout_sec: float = 5.0) -> bool:
+        if self._thread is None:
+            return True
+        flushed = threading.Event()
+        try:
+            self._queue.put(flushed, timeout=timeout_sec)
+        except queue.Full:
+            return False
+        return flushed.wait(timeout_sec)
+
+    def close(self, timeout_sec: float = 5.0) -> None:
+        self._closed = True
+        thread = self._thread
+        if thread is None:
+            return
+        try:
+            self._queue.put(_REQUEST_LOG_INGEST_STOP, timeout=timeout_sec)
+        except queue.Full:
+            return
+        thread.join(timeout_sec)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: list[tuple[dict[str, Any], Any, logging.Logger]] = []
+            flush_events: list[threading.Event] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self._batch_max_wait_sec
+            while True:
+                if item is _REQUEST_LOG_INGEST_STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    flush_events.append(item)
+                else:
+                    batch.append(item)
+                if stopping or flush_events or len(batch) >= self._batch_max_records:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if stopping:
+                # 종료 시에는 남은 이벤트까지 모두 저장한다.
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        flush_events.append(item)
+                    elif item is not _REQUEST_LOG_INGEST_STOP:
+                        batch.append(item)
+
+            self._write_batch(batch)
+            for flushed in flush_events:
+                flushed.set()
+
+    def _write_batch(self, batch: list[tuple[dict[str, Any], Any, logging.Logger]]) -> None:
+        if not batch:
+            return
+        prepared: list[tuple[dict[str, Any], dict[str, Any], logging.Logger]] = []
+        for snapshot, client, logger in batch:
+            try:
+                record = _build_request_log_record_from_snapshot(snapshot, client=client, logger=logger)
+            except Exception:
+                logger.warning(
+                    "Failed to build request log event_type=%s channel=%s ts=%s",
+                    snapshot.get("event_type"),
+                    snapshot.get("channel_id"),
+                    snapshot.get("current_ts"),
+                    exc_info=True,
+                )
+                continue
+            prepared.append((snapshot, record, logger))
+
+        try:
+            _save_request_log_records([record for _, record, _ in prepared])
+            return
+        except Exception:
+            logging.getLogger(__name__).warning(
+                "Failed to persist request log batch size=%s, retrying one by one",
+                len(prepared),
+                exc_info=True,
+            )
+
+        # 배치 저장이 실패하면 문제 레코드만 빠지도록 한 건씩 다시 저장한다.
+        for snapshot, record, logger in prepared:
+            try:
+                _save_request_log_record(record)
+            except Exception:
+                logger.warning(
+                    "Failed to persist request log event_type=%s channel=%s ts=%s",
+                    snapshot.get("event_type"),
+                    snapshot.get("channel_id"),
+                    snapshot.get("current_ts"),
+                    exc_info=True,
+                )
+
+
+def _get_request_log_ingest_queue() -> _RequestLogIngestQueue:
+    global _REQUEST_LOG_INGEST_QUEUE
+    with _REQUEST_LOG_INGEST_QUEUE_LOCK:
+        if _REQUEST_LOG_INGEST_QUEUE is None:
+            _REQUEST_LOG_INGEST_QUEUE = _RequestLogIngestQueue(
+                max_size=s.REQUEST_LOG_QUEUE_MAX_SIZE,
+                put_timeout_sec=s.REQUEST_LOG_QUEUE_PUT_TIMEOUT_MS / 1000,
+                batch_max_records=s.REQUEST_LOG_BATCH_MAX_RECORDS,
+                batch_max_wait_sec=s.REQUEST_LOG_BATCH_MAX_WAIT_MS / 1000,
+            )
+            atexit.register(_shutdown_request_log_ingest_queue)
+        return _REQUEST_LOG_INGEST_QUEUE
+
+
+def _shutdown_request_log_ingest_queue(timeout_sec: float = 5.0) -> None:
+    global _REQUEST_LOG_INGEST_QUEUE
+    with _REQUEST_LOG_INGEST_QUEUE_LOCK:
+        ingest_queue, _REQUEST_LOG_INGEST_QUEUE = _REQUEST_LOG_INGEST_QUEUE, None
+    if ingest_queue is not None:
+        ingest_queue.close(timeout_sec)
+
+
+def _persist_request_log(
+    payload: MentionPayload | MessagePayload,
+    *,
+    event_type: str,
+    client: Any,
+    logger: logging.Logger,
+) -> None:
+    if not s.REQUEST_LOG_SQLITE_ENABLED:
+        return
+
+    snapshot = _snapshot_request_log_event(payload, event_type=event_type)
+    if snapshot is None:
+        return
+
+    if s.REQUEST_LOG_ASYNC_ENABLED:
+        if _get_request_log_ingest_queue().submit(snapshot, client=client, logger=logger):
+            return
+        logger.warning(
+            "Request log queue is full, dropping event channel=%s ts=%s",
+            snapshot["channel_id"],
+            snapshot["current_ts"],
+        )
+        return
+    _write_request_log_snapshot(snapshot, client=client, logger=logger)
+
+
 def _should_persist_request_log_event(
     payload: MentionPayload | MessagePayload,
     *,
@@ -353,6 +586,80 @@ def _should_persist_request_log_event(
     return status == "error"
 
 
+class _SlackStreamInterrupted(Exception):
+    # 답변 일부를 이미 보여준 뒤 스트림이 끊긴 경우. 메시지에는 중단 표시를 남겼으니 호출한 쪽은 답을 또 올리지 않는다.
+    pass
+
+
+def _stream_slack_reply(
+    payload: MentionPayload,
+    client: Any,
+    snapshots: Iterable[str],
+    *,
+    sanitize: Callable[[str], str] | None = None,
+    finalize: Callable[[str], str] | None = None,
+    placeholder: str = "답변 작성 중...",
+    interrupted_suffix: str = "(중단됨)",
+    update_interval_sec: float | None = None,
+) -> str:
+    # placeholder를 먼저 올리고 누적 답변(snapshots)으로 같은 메시지를 고친다.
+    # 첫 조각은 바로 보여주고, 그 뒤로는 update_interval_sec 간격으로만 chat_update 해서 rate limit을 피한다.
+    # 중간 답변에도 sanitize를 거쳐서 최종 답변에서 지울 내용이 잠깐이라도 보이지 않게 한다.
+    channel_id = payload["channel_id"]
+    user_id = payload["user_id"]
+    interval = ss.SLACK_STREAM_UPDATE_INTERVAL_SEC if update_interval_sec is None else update_interval_sec
+    response = client.chat_postMessage(
+        channel=channel_id,
+        thread_ts=payload["thread_ts"],
+        text=_format_reply_text(user_id, placeholder),
+        unfurl_links=False,
+        unfurl_media=False,
+    )
+    message_ts = str(response["ts"])
+    _mark_request_log_reply(payload)
+
+    latest_text = ""
+    shown_text = ""
+    last_updated_at: float | None = None
+    try:
+        for latest_text in snapshots:
+            if last_updated_at is not None and time.monotonic() - last_updated_at < interval:
+                continue
+            text = sanitize(latest_text) if sanitize is not None else latest_text
+            if not text.strip() or text == shown_text:
+                continue
+            client.chat_update(channel=channel_id, ts=message_ts, text=_format_reply_text(user_id, text))
+            shown_text = text
+            last_updated_at = time.monotonic()
+    except Exception as exc:
+        if shown_text:
+            # 잘린 답변이 완성된 답처럼 남지 않게 중단 표시를 붙인다.
+            _set_request_log_status(payload, "error", error_type=type(exc).__name__)
+            try:
+                client.chat_update(
+                    channel=channel_id,
+                    ts=message_ts,
+                    text=_format_reply_text(user_id, f"{shown_text}\n\n{interrupted_suffix}"),
+                )
+            except Exception:
+                logging.getLogger(__name__).warning("Failed to mark interrupted streaming reply", exc_info=True)
+            raise _SlackStreamInterrupted(str(exc) or type(exc).__name__) from exc
+        # 아무것도 못 보여줬으면 placeholder만 남지 않게 지우고, 호출한 쪽이 오류 답변을 올리게 한다.
+        try:
+            client.chat_delete(channel=channel_id, ts=message_ts)
+        except Exception:
+            logging.getLogger(__name__).warning("Failed to delete streaming placeholder", exc_info=True)
+        raise
+
+    if finalize is not None:
+        final_text = finalize(latest_text)
+    else:
+        final_text = (sanitize(latest_text) if sanitize is not None else latest_text).strip()
+    if final_text != shown_text:
+        client.chat_update(channel=channel_id, ts=message_ts, text=_format_reply_text(user_id, final_text))
+    return final_text
+
+
 def create_slack_app(
     mention_handler: MentionHandler,
     message_handler: MessageHandler | None = None,
@@ -430,6 +737,7 @@ def create_slack_app(
 
     @app.event("message")
     def handle_message_events(event: dict[str, Any], say, client) -> None:
+        _record_thread_message_event(event)
         subtype = str(event.get("subtype") or "").strip()
         if subtype and subtype != "bot_message":
             logger.debug("Ignored message event subtype=%s", subtype)
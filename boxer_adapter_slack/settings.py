@@ -9,6 +9,7 @@ SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN", "")
 SLACK_APP_TOKEN = os.getenv("SLACK_APP_TOKEN", "")
 SLACK_SIGNING_SECRET = os.getenv("SLACK_SIGNING_SECRET", "")
 ADAPTER_ENTRYPOINT = os.getenv("ADAPTER_ENTRYPOINT", "boxer_adapter_slack.sample:create_app")
+SLACK_STREAM_UPDATE_INTERVAL_SEC = float(os.getenv("SLACK_STREAM_UPDATE_INTERVAL_SEC", "1.0"))
 
 
 def validate_slack_tokens() -> None:
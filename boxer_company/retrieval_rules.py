@@ -1,5 +1,7 @@
 from typing import Any
 
+from boxer.core.retrieval_synthesis import _register_masking_key_rule
+
 _COMPANY_NAME_KEYWORDS = (
     "userrealname",
     "mothername",
@@ -19,41 +21,25 @@ def _mask_company_name(text: str) -> str:
     return clean[0] + "*" * (len(clean) - 2) + clean[-1]
 
 
-def _mask_company_fields_by_key(key: str, value: Any) -> Any:
-    lowered = (key or "").lower()
-    if isinstance(value, str):
-        if any(token in lowered for token in _COMPANY_NAME_KEYWORDS):
-            return _mask_company_name(value)
-        return value
-    if isinstance(value, dict):
-        return {
-            nested_key: _mask_company_fields_by_key(str(nested_key), nested_value)
-            for nested_key, nested_value in value.items()
-        }
-    if isinstance(value, list):
-        return [_mask_company_fields_by_key(key, item) for item in value]
-    return value
+# 회사 이름 필드 마스킹은 공통 마스킹 엔진에 등록해서 증거 마스킹과 같은 순회에서 처리한다.
+_register_masking_key_rule(_COMPANY_NAME_KEYWORDS, _mask_company_name, required=True)
 
 
 def _transform_company_retrieval_payload(payload: Any) -> Any:
+    # 이름 마스킹은 _mask_evidence_payload에서 이미 끝났으므로 여기서는 라우트별 압축만 한다.
     if not isinstance(payload, dict):
         return payload
 
-    masked_payload = {
-        key: _mask_company_fields_by_key(str(key), value)
-        for key, value in payload.items()
-    }
-
-    route = str(masked_payload.get("route") or "").strip().lower()
+    route = str(payload.get("route") or "").strip().lower()
     if route != "barcode_log_error_summary":
-        return masked_payload
+        return payload
 
-    summary = masked_payload.get("summary") if isinstance(masked_payload.get("summary"), dict) else {}
-    request = masked_payload.get("request") if isinstance(masked_payload.get("request"), dict) else {}
-    records = masked_payload.get("records") if isinstance(masked_payload.get("records"), list) else []
+    summary = payload.get("summary") if isinstance(payload.get("summary"), dict) else {}
+    request = payload.get("request") if isinstance(payload.get("request"), dict) else {}
+    records = payload.get("records") if isinstance(payload.get("records"), list) else []
     error_groups = (
-        masked_payload.get("errorGroups")
-        if isinstance(masked_payload.get("errorGroups"), list)
+        payload.get("errorGroups")
+        if isinstance(payload.get("errorGroups"), list)
         else []
     )
 
@@ -153,8 +139,8 @@ def _transform_company_retrieval_payload(payload: Any) -> Any:
         )
 
     return {
-        "route": masked_payload.get("route"),
-        "source": masked_payload.get("source"),
+        "route": payload.get("route"),
+        "source": payload.get("source"),
         "request": request,
         "summary": summary,
         "records": compact_records,
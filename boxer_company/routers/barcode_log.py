@@ -1,5 +1,8 @@
 import os
 import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, partial
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -9,11 +12,12 @@ from boxer.core import settings as s
 from boxer.core.utils import _display_value, _format_size, _truncate_text
 from boxer_company.routers.box_db import (
     _format_video_length,
-    _load_recordings_rows_on_date_by_barcode,
+    _load_recordings_rows_index_by_barcode,
     _lookup_device_contexts_by_barcode,
     _lookup_device_contexts_by_hospital_seqs,
+    _recordings_rows_from_index,
 )
-from boxer_company.routers.s3_domain import _fetch_s3_device_log_lines
+from boxer_company.routers.s3_domain import _iter_s3_device_log_lines, _stream_s3_device_log_lines
 
 _NUMERIC_YMD_PATTERN = re.compile(r"(?<!\d)(\d{2,4})\s*[-./]\s*(\d{1,2})\s*[-./]\s*(\d{1,2})(?!\d)")
 _KOREAN_YMD_PATTERN = re.compile(
@@ -915,12 +919,17 @@ def _is_ultrasound_capture_count_request(question: str, barcode: str | None) ->
     )
 
 
-def _find_error_lines(lines: list[str]) -> list[tuple[int, str]]:
-    matches: list[tuple[int, str]] = []
-    for line_no, line in enumerate(lines, start=1):
-        if _is_actual_error_line(line):
-            matches.append((line_no, line))
-    return matches
+def _resolve_log_events(lines: list[str], log_events: dict[str, Any] | None) -> dict[str, Any]:
+    # 아래 _find/_extract 래퍼들은 이미 뽑아 둔 log_events가 있으면 그 결과만 잘라서 돌려준다.
+    # 없을 때만 한 번 순회하므로, 여러 래퍼를 부를 때는 _extract_log_events 결과를 넘겨야 한다.
+    return log_events if log_events is not None else _extract_log_events(lines)
+
+
+def _find_error_lines(
+    lines: list[str],
+    log_events: dict[str, Any] | None = None,
+) -> list[tuple[int, str]]:
+    return _resolve_log_events(lines, log_events)["error_lines"]
 
 
 def _extract_explicit_log_level(line: str) -> str:
@@ -931,8 +940,9 @@ def _extract_explicit_log_level(line: str) -> str:
     return ""
 
 
-def _is_actual_error_line(line: str) -> bool:
-    lowered = (line or "").lower()
+def _is_actual_error_line(line: str, lowered: str | None = None) -> bool:
+    if lowered is None:
+        lowered = (line or "").lower()
     if "low growth rate detected:" in lowered:
         return False
 
@@ -974,141 +984,232 @@ def _parse_scanned_event(line: str) -> str | None:
     return matched.group(1).strip().strip("`'\",;:()[]{}")
 
 
-def _extract_scan_events_with_line_no(lines: list[str]) -> list[dict[str, Any]]:
-    events: list[dict[str, Any]] = []
-    latest_time_label: str | None = None
-    for line_no, line in enumerate(lines, start=1):
-        line_time_label = _extract_time_label_from_line(line)
-        if line_time_label != "시간미상":
-            latest_time_label = line_time_label
+def _extract_scan_events_with_line_no(
+    lines: list[str],
+    log_events: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    return _resolve_log_events(lines, log_events)["scan_events"]
+
+
+def _classify_motion_line(
+    line: str,
+    lowered: str,
+    motion_counter_active: bool,
+) -> tuple[dict[str, Any] | None, bool]:
+    motion_detected: bool | None = None
+    error_flag: bool | None = None
+
+    if "motion detection process initiated successfully" in lowered:
+        event_type = "motion_start"
+        label = "모션 감지 시작(정상)"
+        motion_counter_active = False
+    elif "motion detection :" in lowered:
+        if motion_counter_active:
+            return None, motion_counter_active
+        event_type = "motion_start"
+        label = "모션 감지 시작"
+        motion_counter_active = True
+    elif "motion detection passed" in lowered:
+        event_type = "motion_trigger"
+        label = "모션 감지 성공(녹화 전환)"
+        motion_counter_active = False
+    elif (
+        "motion detected for" in lowered
+        and "stopping detection to start recording" in lowered
+    ):
+        event_type = "motion_trigger"
+        label = "모션 감지 성공(녹화 전환)"
+        motion_counter_active = False
+    elif "stopping motion detection." in lowered:
+        event_type = "motion_stop"
+        label = "모션 감지 종료"
+        matched = _MOTION_STOP_STATUS_PATTERN.search(line)
+        if matched:
+            motion_detected = matched.group(1).lower() == "true"
+            error_flag = matched.group(2).lower() == "true"
+        motion_counter_active = False
+    else:
+        if "motion detection" not in lowered:
+            motion_counter_active = False
+        return None, motion_counter_active
+
+    return (
+        {
+            "event_type": event_type,
+            "label": label,
+            "motion_detected": motion_detected,
+            "error": error_flag,
+        },
+        motion_counter_active,
+    )
 
-        parsed = _parse_scanned_event(line)
-        if not parsed:
-            continue
-        token = parsed
-        time_label = line_time_label
-        if time_label == "시간미상" and latest_time_label:
-            time_label = latest_time_label
-        events.append(
-            {
-                "line_no": line_no,
-                "time_label": time_label,
-                "token": token,
-                "raw_line": _strip_leading_log_timestamp(line),
-            }
-        )
-    return events
 
+def _extract_motion_events_with_line_no(
+    lines: list[str],
+    log_events: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    return _resolve_log_events(lines, log_events)["motion_events"]
 
-def _extract_motion_events_with_line_no(lines: list[str]) -> list[dict[str, Any]]:
-    events: list[dict[str, Any]] = []
-    latest_time_label: str | None = None
-    motion_counter_active = False
 
-    for line_no, line in enumerate(lines, start=1):
-        line_time_label = _extract_time_label_from_line(line)
-        if line_time_label != "시간미상":
-            latest_time_label = line_time_label
+_RESTART_DETAIL_LOOKAHEAD_LINES = 8
+_RESTART_DETAIL_PATTERNS = (
+    ("appVersion", _RESTART_APP_VERSION_PATTERN),
+    ("nodeVersion", _RESTART_NODE_VERSION_PATTERN),
+    ("platform", _RESTART_PLATFORM_PATTERN),
+    ("startTime", _RESTART_START_TIME_PATTERN),
+)
 
-        lowered = line.lower()
-        event_type = ""
-        label = ""
-        motion_detected: bool | None = None
-        error_flag: bool | None = None
-
-        if "motion detection process initiated successfully" in lowered:
-            event_type = "motion_start"
-            label = "모션 감지 시작(정상)"
-            motion_counter_active = False
-        elif "motion detection :" in lowered:
-            if motion_counter_active:
-                continue
-            event_type = "motion_start"
-            label = "모션 감지 시작"
-            motion_counter_active = True
-        elif "motion detection passed" in lowered:
-            event_type = "motion_trigger"
-            label = "모션 감지 성공(녹화 전환)"
-            motion_counter_active = False
-        elif (
-            "motion detected for" in lowered
-            and "stopping detection to start recording" in lowered
-        ):
-            event_type = "motion_trigger"
-            label = "모션 감지 성공(녹화 전환)"
-            motion_counter_active = False
-        elif "stopping motion detection." in lowered:
-            event_type = "motion_stop"
-            label = "모션 감지 종료"
-            matched = _MOTION_STOP_STATUS_PATTERN.search(line)
-            if matched:
-                motion_detected = matched.group(1).lower() == "true"
-                error_flag = matched.group(2).lower() == "true"
-            motion_counter_active = False
-        else:
-            if "motion detection" not in lowered:
-                motion_counter_active = False
-            continue
 
-        time_label = line_time_label
-        if time_label == "시간미상" and latest_time_label:
-            time_label = latest_time_label
+def _apply_restart_detail_line(details: dict[str, str], follow_line: str) -> None:
+    follow_stripped = _strip_leading_log_timestamp(follow_line)
+    for key, pattern in _RESTART_DETAIL_PATTERNS:
+        matched = pattern.search(follow_stripped)
+        if matched and key not in details:
+            details[key] = matched.group(1).strip()
 
-        events.append(
-            {
-                "line_no": line_no,
-                "time_label": time_label,
-                "event_type": event_type,
-                "label": label,
-                "motion_detected": motion_detected,
-                "error": error_flag,
-            }
-        )
-    return events
+
+def _extract_restart_events_with_line_no(
+    lines: list[str],
+    log_events: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    return _resolve_log_events(lines, log_events)["restart_events"]
 
 
-def _extract_restart_events_with_line_no(lines: list[str]) -> list[dict[str, Any]]:
-    events: list[dict[str, Any]] = []
+def _extract_log_events(
+    lines: Iterable[str],
+    session_barcode: str | None = None,
+) -> dict[str, Any]:
+    # scan/motion/restart/error를 한 번의 순회로 뽑는다. 줄마다 시간 라벨과 lower()는 한 번만 계산한다.
+    # lines는 리스트뿐 아니라 스트리밍 iterator여도 되고, 재시작 상세는 뒤따르는 줄을 받으면서 채운다.
+    # session_barcode를 주면 그 바코드 세션 주변 줄만 남긴 "lines"(나머지는 빈 문자열)를 같이 돌려준다.
+    scan_events: list[dict[str, Any]] = []
+    motion_events: list[dict[str, Any]] = []
+    restart_events: list[dict[str, Any]] = []
+    error_lines: list[tuple[int, str]] = []
+    pending_restart_details: list[list[Any]] = []
     latest_time_label: str | None = None
+    motion_counter_active = False
+
+    retain_lines = session_barcode is not None
+    normalized_barcode = (session_barcode or "").strip()
+    retained_lines: list[str] = []
+    retaining = False
+    retain_until: int | None = None
+    # 다른 바코드 스캔 이후에도 종료 후 safety 구간, 재스캔 무시 확인 범위까지는 줄을 남겨둔다.
+    retain_margin = max(0, min(500, cs.LOG_SESSION_SAFETY_LINES)) + _RESTART_DETAIL_LOOKAHEAD_LINES + 1
 
+    line_no = 0
     for line_no, line in enumerate(lines, start=1):
         line_time_label = _extract_time_label_from_line(line)
         if line_time_label != "시간미상":
             latest_time_label = line_time_label
-
-        stripped = _strip_leading_log_timestamp(line)
-        if not _RESTART_START_PATTERN.search(stripped):
-            continue
-
         time_label = line_time_label
         if time_label == "시간미상" and latest_time_label:
             time_label = latest_time_label
+        lowered = line.lower()
 
-        details: dict[str, str] = {}
-        for follow_index in range(line_no + 1, min(len(lines), line_no + 8) + 1):
-            follow_line = lines[follow_index - 1]
-            follow_stripped = _strip_leading_log_timestamp(follow_line)
-            for key, pattern in (
-                ("appVersion", _RESTART_APP_VERSION_PATTERN),
-                ("nodeVersion", _RESTART_NODE_VERSION_PATTERN),
-                ("platform", _RESTART_PLATFORM_PATTERN),
-                ("startTime", _RESTART_START_TIME_PATTERN),
-            ):
-                matched = pattern.search(follow_stripped)
-                if matched and key not in details:
-                    details[key] = matched.group(1).strip()
-
-        events.append(
-            {
-                "line_no": line_no,
-                "time_label": time_label,
-                "label": "장비 재시작 감지",
-                "raw_line": stripped,
-                "details": details,
-            }
-        )
+        if pending_restart_details:
+            for pending in pending_restart_details:
+                _apply_restart_detail_line(pending[0], line)
+                pending[1] -= 1
+            pending_restart_details = [pending for pending in pending_restart_details if pending[1] > 0]
+
+        if "scanned" in lowered:
+            token = _parse_scanned_event(line)
+            if token:
+                scan_events.append(
+                    {
+                        "line_no": line_no,
+                        "time_label": time_label,
+                        "token": token,
+                        "raw_line": _strip_leading_log_timestamp(line),
+                    }
+                )
+                if retain_lines and token == normalized_barcode:
+                    retaining = True
+                    retain_until = None
+                elif retain_lines and retaining and retain_until is None and re.fullmatch(r"\d{11}", token):
+                    retain_until = line_no + retain_margin
+
+        if retain_lines:
+            if retaining and retain_until is not None and line_no > retain_until:
+                retaining = False
+                retain_until = None
+            retained_lines.append(line if retaining else "")
+
+        if "motion detection" in lowered or "motion detected for" in lowered:
+            motion_event, motion_counter_active = _classify_motion_line(
+                line,
+                lowered,
+                motion_counter_active,
+            )
+            if motion_event is not None:
+                motion_events.append(
+                    {
+                        "line_no": line_no,
+                        "time_label": time_label,
+                        **motion_event,
+                    }
+                )
+        else:
+            motion_counter_active = False
+
+        if "mommybox starting" in lowered:
+            stripped = _strip_leading_log_timestamp(line)
+            if _RESTART_START_PATTERN.search(stripped):
+                details: dict[str, str] = {}
+                restart_events.append(
+                    {
+                        "line_no": line_no,
+                        "time_label": time_label,
+                        "label": "장비 재시작 감지",
+                        "raw_line": stripped,
+                        "details": details,
+                    }
+                )
+                pending_restart_details.append([details, _RESTART_DETAIL_LOOKAHEAD_LINES])
 
-    return events
+        if (not retain_lines or retaining) and _is_actual_error_line(line, lowered):
+            error_lines.append((line_no, line))
+
+    log_events: dict[str, Any] = {
+        "scan_events": scan_events,
+        "motion_events": motion_events,
+        "restart_events": restart_events,
+        "error_lines": error_lines,
+        "line_count": line_no,
+    }
+    if retain_lines:
+        log_events["lines"] = retained_lines
+    return log_events
+
+
+def _load_barcode_device_log(
+    s3_client: Any,
+    device_name: str,
+    log_date: str,
+    barcode: str,
+) -> dict[str, Any]:
+    # S3 본문을 스트리밍으로 읽으면서 바로 이벤트를 뽑아, 바코드 세션 주변 줄만 메모리에 남긴다.
+    # 바코드 바이트가 본문에 없으면 세션이 생길 수 없으니 줄 파싱 자체를 건너뛴다.
+    log_data = _stream_s3_device_log_lines(
+        s3_client,
+        device_name,
+        log_date,
+        required_text=barcode.strip() or None,
+    )
+    if not log_data["found"]:
+        return {**log_data, "lines": [], "log_events": None}
+    if not log_data["matched"]:
+        log_events = _extract_log_events([], session_barcode=barcode)
+        return {**log_data, "lines": log_events.pop("lines"), "log_events": log_events}
+
+    log_events = _extract_log_events(log_data["lines"], session_barcode=barcode)
+    return {
+        **log_data,
+        "lines": log_events.pop("lines"),
+        "log_events": log_events,
+    }
 
 
 def _summarize_motion_session(
@@ -1445,17 +1546,81 @@ def _append_session_state_summary(
         lines.append(f"• *녹화 결과:* {', '.join(outcome_parts)}")
 
 
+def _build_session_index(sessions: list[dict[str, Any]]) -> dict[str, Any]:
+    # _extract_recording_sessions 결과는 시작 줄 순서라서 정렬 없이 bisect 인덱스를 만든다.
+    # 종료 후 safety 구간 때문에 세션끼리 겹칠 수 있어, 포함 여부는 병합 구간으로 판단한다.
+    starts: list[int] = []
+    max_ends: list[int] = []
+    merged_starts: list[int] = []
+    merged_ends: list[int] = []
+    running_max_end = -1
+    for session in sessions:
+        start_line_no = int(session["start_line_no"])
+        end_line_no = int(session["end_line_no"])
+        starts.append(start_line_no)
+        running_max_end = max(running_max_end, end_line_no)
+        max_ends.append(running_max_end)
+        if merged_ends and start_line_no <= merged_ends[-1] + 1:
+            merged_ends[-1] = max(merged_ends[-1], end_line_no)
+        else:
+            merged_starts.append(start_line_no)
+            merged_ends.append(end_line_no)
+    return {
+        "sessions": sessions,
+        "starts": starts,
+        "maxEnds": max_ends,
+        "mergedStarts": merged_starts,
+        "mergedEnds": merged_ends,
+    }
+
+
+def _session_index_contains(session_index: dict[str, Any], line_no: int) -> bool:
+    position = bisect_right(session_index["mergedStarts"], int(line_no)) - 1
+    return position >= 0 and int(line_no) <= session_index["mergedEnds"][position]
+
+
+def _session_index_find(session_index: dict[str, Any], line_no: int) -> dict[str, Any] | None:
+    # 여러 세션에 걸친 줄은 기존처럼 목록에서 가장 앞선 세션을 돌려준다.
+    start_limit = bisect_right(session_index["starts"], int(line_no))
+    position = bisect_left(session_index["maxEnds"], int(line_no), 0, start_limit)
+    if position >= start_limit:
+        return None
+    return session_index["sessions"][position]
+
+
+def _line_range_bounds(items: list[Any], start_line_no: int, end_line_no: int, key: Any) -> tuple[int, int]:
+    # 이벤트/에러 목록은 추출 순서 그대로라 line_no 오름차순이다.
+    return (
+        bisect_left(items, start_line_no, key=key),
+        bisect_right(items, end_line_no, key=key),
+    )
+
+
+def _event_line_no(event: dict[str, Any]) -> int:
+    return int(event["line_no"])
+
+
+def _error_line_no(item: tuple[int, str]) -> int:
+    return int(item[0])
+
+
 def _events_in_session(events: list[dict[str, Any]], session: dict[str, Any]) -> list[dict[str, Any]]:
-    start_line_no = int(session["start_line_no"])
-    end_line_no = int(session["end_line_no"])
-    return [
-        event
-        for event in events
-        if start_line_no <= int(event["line_no"]) <= end_line_no
-    ]
+    lower, upper = _line_range_bounds(
+        events,
+        int(session["start_line_no"]),
+        int(session["end_line_no"]),
+        _event_line_no,
+    )
+    return events[lower:upper]
 
 
-def _find_session_for_line(line_no: int, sessions: list[dict[str, Any]]) -> dict[str, Any] | None:
+def _find_session_for_line(
+    line_no: int,
+    sessions: list[dict[str, Any]],
+    session_index: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    if session_index is not None:
+        return _session_index_find(session_index, line_no)
     for session in sessions:
         if int(session["start_line_no"]) <= int(line_no) <= int(session["end_line_no"]):
             return session
@@ -1848,40 +2013,47 @@ def _build_session_recording_result_text(
     return "정상 녹화로 판단", recovery_context, post_stop_context
 
 
-def _events_in_sessions(events: list[dict[str, Any]], sessions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def _events_in_sessions(
+    events: list[dict[str, Any]],
+    sessions: list[dict[str, Any]],
+    session_index: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
     if not sessions:
         return []
-    return [
-        event
-        for event in events
-        if _line_in_any_session(int(event["line_no"]), sessions)
-    ]
+    index = session_index if session_index is not None else _build_session_index(sessions)
+    matched: list[dict[str, Any]] = []
+    for start_line_no, end_line_no in zip(index["mergedStarts"], index["mergedEnds"]):
+        lower, upper = _line_range_bounds(events, start_line_no, end_line_no, _event_line_no)
+        matched.extend(events[lower:upper])
+    return matched
 
 
 def _error_lines_in_session(
     error_lines: list[tuple[int, str]],
     session: dict[str, Any],
 ) -> list[tuple[int, str]]:
-    start_line_no = int(session["start_line_no"])
-    end_line_no = int(session["end_line_no"])
-    return [
-        (line_no, content)
-        for (line_no, content) in error_lines
-        if start_line_no <= int(line_no) <= end_line_no
-    ]
+    lower, upper = _line_range_bounds(
+        error_lines,
+        int(session["start_line_no"]),
+        int(session["end_line_no"]),
+        _error_line_no,
+    )
+    return error_lines[lower:upper]
 
 
 def _error_lines_in_sessions(
     error_lines: list[tuple[int, str]],
     sessions: list[dict[str, Any]],
+    session_index: dict[str, Any] | None = None,
 ) -> list[tuple[int, str]]:
     if not sessions:
         return []
-    return [
-        (line_no, content)
-        for (line_no, content) in error_lines
-        if _line_in_any_session(line_no, sessions)
-    ]
+    index = session_index if session_index is not None else _build_session_index(sessions)
+    matched: list[tuple[int, str]] = []
+    for start_line_no, end_line_no in zip(index["mergedStarts"], index["mergedEnds"]):
+        lower, upper = _line_range_bounds(error_lines, start_line_no, end_line_no, _error_line_no)
+        matched.extend(error_lines[lower:upper])
+    return matched
 
 
 def _session_closure_counts(sessions: list[dict[str, Any]]) -> dict[str, int | bool]:
@@ -1895,31 +2067,42 @@ def _session_closure_counts(sessions: list[dict[str, Any]]) -> dict[str, int | b
     }
 
 
-def _parse_structured_log_line(line: str) -> dict[str, str]:
+_STRUCTURED_RAW_LINE_PATTERN = re.compile(r"^\[\s*([^\]]+?)\s*\]\s+\[\s*([^\]]+?)\s*\]\s*(.*)$")
+_STRUCTURED_NORMALIZED_LINE_PATTERN = re.compile(r"^\[([^\]]+)\]\s+([A-Za-z]+):\s*(.*)$")
+
+
+@lru_cache(maxsize=4096)
+def _parse_structured_log_line_fields(line: str) -> tuple[str, str, str, str]:
     stripped = _strip_leading_log_timestamp(line)
-    raw_match = re.match(r"^\[\s*([^\]]+?)\s*\]\s+\[\s*([^\]]+?)\s*\]\s*(.*)$", stripped)
+    raw_match = _STRUCTURED_RAW_LINE_PATTERN.match(stripped)
     if raw_match:
-        return {
-            "component": raw_match.group(1).strip(),
-            "level": raw_match.group(2).strip().lower(),
-            "message": raw_match.group(3).strip(),
-            "raw": stripped,
-        }
+        return (
+            raw_match.group(1).strip(),
+            raw_match.group(2).strip().lower(),
+            raw_match.group(3).strip(),
+            stripped,
+        )
 
-    normalized_match = re.match(r"^\[([^\]]+)\]\s+([A-Za-z]+):\s*(.*)$", stripped)
+    normalized_match = _STRUCTURED_NORMALIZED_LINE_PATTERN.match(stripped)
     if normalized_match:
-        return {
-            "component": normalized_match.group(1).strip(),
-            "level": normalized_match.group(2).strip().lower(),
-            "message": normalized_match.group(3).strip(),
-            "raw": stripped,
-        }
+        return (
+            normalized_match.group(1).strip(),
+            normalized_match.group(2).strip().lower(),
+            normalized_match.group(3).strip(),
+            stripped,
+        )
 
+    return "", "", stripped, stripped
+
+
+def _parse_structured_log_line(line: str) -> dict[str, str]:
+    # 같은 error 라인이 분류/요약/직렬화에서 반복 파싱되므로 파싱 결과는 캐시하고 dict만 새로 만든다.
+    component, level, message, raw = _parse_structured_log_line_fields(line)
     return {
-        "component": "",
-        "level": "",
-        "message": stripped,
-        "raw": stripped,
+        "component": component,
+        "level": level,
+        "message": message,
+        "raw": raw,
     }
 
 
@@ -2222,8 +2405,9 @@ def _append_session_timing_summary(
         if start_time != "미확인":
             lines.append(f"• 세션 시작: `{start_time}`")
 
+    session_index = _build_session_index(sessions)
     has_restart = any(
-        _find_session_for_line(int(event.get("line_no") or 0), sessions) is not None
+        _session_index_contains(session_index, int(event.get("line_no") or 0))
         for event in restart_events
     )
     if has_restart:
@@ -2529,7 +2713,13 @@ def _append_session_summaries(
             lines.append(f"  모션 종료 상태: `{motion_summary['stop_status']}`")
 
 
-def _line_in_any_session(line_no: int, sessions: list[dict[str, Any]]) -> bool:
+def _line_in_any_session(
+    line_no: int,
+    sessions: list[dict[str, Any]],
+    session_index: dict[str, Any] | None = None,
+) -> bool:
+    if session_index is not None:
+        return _session_index_contains(session_index, line_no)
     for session in sessions:
         if int(session["start_line_no"]) <= line_no <= int(session["end_line_no"]):
             return True
@@ -3004,120 +3194,112 @@ def _analyze_barcode_log_phase1_window(
         lines.append(f"• 참고: 장비가 많아서 상위 `{len(target_device_contexts)}개`만 분석했어")
     header_line_count = len(lines)
 
-    for date_label in target_date_labels:
-        for device_context in target_device_contexts:
-            device_name = str(device_context.get("deviceName") or "")
-            if not device_name:
-                continue
-            device_seq = device_context.get("deviceSeq")
-            recordings_on_date_rows = (
-                _load_recordings_rows_on_date_by_barcode(
-                    barcode,
-                    date_label,
-                    device_seq=int(device_seq) if device_seq is not None else None,
-                )
-                if barcode and use_db_upload_cross_check
-                else []
-            )
-            recordings_on_date_statuses = sorted(
-                {
-                    _display_value(row.get("streamingStatus"), default="미확인")
-                    for row in recordings_on_date_rows
-                }
-            )
+    fetch_targets = [
+        (date_label, device_context, str(device_context.get("deviceName") or ""))
+        for date_label in target_date_labels
+        for device_context in target_device_contexts
+        if str(device_context.get("deviceName") or "")
+    ]
+    recordings_rows_index = (
+        _load_recordings_rows_index_by_barcode(barcode, target_date_labels)
+        if barcode and use_db_upload_cross_check and fetch_targets
+        else {}
+    )
+    fetched_logs = _iter_s3_device_log_lines(
+        s3_client,
+        [(device_name, date_label) for date_label, _, device_name in fetch_targets],
+        loader=partial(_load_barcode_device_log, barcode=barcode),
+    )
 
-            log_data = _fetch_s3_device_log_lines(
-                s3_client,
-                device_name,
+    for (date_label, device_context, device_name), log_data in zip(fetch_targets, fetched_logs):
+        device_seq = device_context.get("deviceSeq")
+        recordings_on_date_rows = (
+            _recordings_rows_from_index(
+                recordings_rows_index,
                 date_label,
-                tail_only=False,
+                device_seq=int(device_seq) if device_seq is not None else None,
             )
-            if not log_data["found"]:
-                continue
-
-            found_log_files += 1
-            source_lines = log_data["lines"]
-            events = _extract_scan_events_with_line_no(source_lines)
-            motion_events = _extract_motion_events_with_line_no(source_lines)
-            restart_events = _extract_restart_events_with_line_no(source_lines)
-            sessions = _extract_recording_sessions(
-                source_lines,
-                barcode,
-                cs.LOG_SESSION_SAFETY_LINES,
-                scan_events=events,
-            )
-            if not sessions:
-                continue
+            if barcode and use_db_upload_cross_check
+            else []
+        )
+        recordings_on_date_statuses = sorted(
+            {
+                _display_value(row.get("streamingStatus"), default="미확인")
+                for row in recordings_on_date_rows
+            }
+        )
 
-            matched_scope_count += 1
-            total_sessions += len(sessions)
-            devices_with_session += 1
-            displayed_device_index += 1
-            error_lines = _find_error_lines(source_lines)
-            session_events = [
-                event
-                for event in events
-                if _line_in_any_session(int(event["line_no"]), sessions)
-            ]
-            session_motion_events = [
-                event
-                for event in motion_events
-                if _line_in_any_session(int(event["line_no"]), sessions)
-            ]
-            session_restart_events = [
-                event
-                for event in restart_events
-                if _line_in_any_session(int(event["line_no"]), sessions)
-            ]
-            raw_session_error_lines = [
-                (line_no, content)
-                for (line_no, content) in error_lines
-                if _line_in_any_session(line_no, sessions)
-            ]
-            session_error_lines = raw_session_error_lines
+        if not log_data["found"]:
+            continue
 
-            hospital_name = _display_value(device_context.get("hospitalName"), default="미확인")
-            room_name = _display_value(device_context.get("roomName"), default="미확인")
-            analysis_records.append(
-                _build_log_analysis_record(
-                    source_lines=source_lines,
-                    device_name=device_name,
-                    hospital_name=hospital_name,
-                    room_name=room_name,
-                    log_key=str(log_data["key"]),
-                    log_date=date_label,
-                    line_count=len(source_lines),
-                    sessions=sessions,
-                    session_scans=session_events,
-                    all_scan_events=events,
-                    session_motions=session_motion_events,
-                    session_restarts=session_restart_events,
-                    session_error_lines=session_error_lines,
-                    recordings_on_date_count=len(recordings_on_date_rows),
-                    recordings_on_date_statuses=recordings_on_date_statuses,
-                )
-            )
+        found_log_files += 1
+        source_lines = log_data["lines"]
+        log_events = log_data["log_events"]
+        events = log_events["scan_events"]
+        motion_events = log_events["motion_events"]
+        restart_events = log_events["restart_events"]
+        sessions = _extract_recording_sessions(
+            source_lines,
+            barcode,
+            cs.LOG_SESSION_SAFETY_LINES,
+            scan_events=events,
+        )
+        if not sessions:
+            continue
 
-            lines.append("")
-            lines.append(f"*장비 {displayed_device_index}*")
-            lines.append(f"• 장비: `{device_name}`")
-            lines.append(f"• 병원: `{hospital_name}`")
-            lines.append(f"• 병실: `{room_name}`")
-            lines.append(f"• 세션 수: `{len(sessions)}건`")
-            lines.append(f"• 날짜: `{date_label}`")
-            lines.append(f"• DB 영상 기록(날짜 기준): `{len(recordings_on_date_rows)}개`")
-            _append_session_sections(
-                lines,
-                source_lines,
-                sessions,
-                session_events,
-                session_motion_events,
-                session_restart_events,
-                session_error_lines,
-                diagnostic_scan_events=events,
+        matched_scope_count += 1
+        total_sessions += len(sessions)
+        devices_with_session += 1
+        displayed_device_index += 1
+        error_lines = log_events["error_lines"]
+        session_index = _build_session_index(sessions)
+        session_events = _events_in_sessions(events, sessions, session_index)
+        session_motion_events = _events_in_sessions(motion_events, sessions, session_index)
+        session_restart_events = _events_in_sessions(restart_events, sessions, session_index)
+        session_error_lines = _error_lines_in_sessions(error_lines, sessions, session_index)
+
+        hospital_name = _display_value(device_context.get("hospitalName"), default="미확인")
+        room_name = _display_value(device_context.get("roomName"), default="미확인")
+        analysis_records.append(
+            _build_log_analysis_record(
+                source_lines=source_lines,
+                device_name=device_name,
+                hospital_name=hospital_name,
+                room_name=room_name,
+                log_key=str(log_data["key"]),
+                log_date=date_label,
+                line_count=len(source_lines),
+                sessions=sessions,
+                session_scans=session_events,
+                all_scan_events=events,
+                session_motions=session_motion_events,
+                session_restarts=session_restart_events,
+                session_error_lines=session_error_lines,
                 recordings_on_date_count=len(recordings_on_date_rows),
-                recordings_on_date_rows=recordings_on_date_rows,
+                recordings_on_date_statuses=recordings_on_date_statuses,
             )
+        )
+
+        lines.append("")
+        lines.append(f"*장비 {displayed_device_index}*")
+        lines.append(f"• 장비: `{device_name}`")
+        lines.append(f"• 병원: `{hospital_name}`")
+        lines.append(f"• 병실: `{room_name}`")
+        lines.append(f"• 세션 수: `{len(sessions)}건`")
+        lines.append(f"• 날짜: `{date_label}`")
+        lines.append(f"• DB 영상 기록(날짜 기준): `{len(recordings_on_date_rows)}개`")
+        _append_session_sections(
+            lines,
+            source_lines,
+            sessions,
+            session_events,
+            session_motion_events,
+            session_restart_events,
+            session_error_lines,
+            diagnostic_scan_events=events,
+            recordings_on_date_count=len(recordings_on_date_rows),
+            recordings_on_date_rows=recordings_on_date_rows,
+        )
 
     if found_log_files == 0:
         result_lines = [
@@ -3209,18 +3391,31 @@ def _analyze_barcode_log_scan_events(
     if omitted_device_count > 0:
         lines.append(f"• 참고: 장비가 많아서 상위 `{len(target_device_contexts)}개`만 분석했어")
     header_line_count = len(lines)
+    recordings_rows_index = (
+        _load_recordings_rows_index_by_barcode(barcode, [log_date])
+        if barcode and recordings_context is not None and target_device_contexts
+        else {}
+    )
 
     def _analyze_device_context_batch(device_context_batch: list[dict[str, Any]]) -> None:
         nonlocal total_session_count, logs_found_any, logs_with_session, devices_with_session, displayed_device_index
 
-        for device_context in device_context_batch:
-            device_name = str(device_context.get("deviceName") or "")
-            if not device_name:
-                continue
+        batch_targets = [
+            (device_context, str(device_context.get("deviceName") or ""))
+            for device_context in device_context_batch
+            if str(device_context.get("deviceName") or "")
+        ]
+        fetched_logs = _iter_s3_device_log_lines(
+            s3_client,
+            [(device_name, log_date) for _, device_name in batch_targets],
+            loader=partial(_load_barcode_device_log, barcode=barcode),
+        )
+
+        for (device_context, device_name), log_data in zip(batch_targets, fetched_logs):
             device_seq = device_context.get("deviceSeq")
             recordings_on_date_rows = (
-                _load_recordings_rows_on_date_by_barcode(
-                    barcode,
+                _recordings_rows_from_index(
+                    recordings_rows_index,
                     log_date,
                     device_seq=int(device_seq) if device_seq is not None else None,
                 )
@@ -3234,22 +3429,16 @@ def _analyze_barcode_log_scan_events(
                 }
             )
 
-            log_data = _fetch_s3_device_log_lines(
-                s3_client,
-                device_name,
-                log_date,
-                tail_only=False,
-            )
-
             if not log_data["found"]:
                 continue
 
             source_lines = log_data["lines"]
             logs_found_any += 1
-            events = _extract_scan_events_with_line_no(source_lines)
-            motion_events = _extract_motion_events_with_line_no(source_lines)
-            restart_events = _extract_restart_events_with_line_no(source_lines)
-            error_lines = _find_error_lines(source_lines)
+            log_events = log_data["log_events"]
+            events = log_events["scan_events"]
+            motion_events = log_events["motion_events"]
+            restart_events = log_events["restart_events"]
+            error_lines = log_events["error_lines"]
             sessions = _extract_recording_sessions(
                 source_lines,
                 barcode,
@@ -3258,10 +3447,11 @@ def _analyze_barcode_log_scan_events(
             )
             session_count = len(sessions)
             total_session_count += session_count
-            session_scoped_events = _events_in_sessions(events, sessions)
-            session_motion_events = _events_in_sessions(motion_events, sessions)
-            session_restart_events = _events_in_sessions(restart_events, sessions)
-            session_error_lines = _error_lines_in_sessions(error_lines, sessions)
+            session_index = _build_session_index(sessions)
+            session_scoped_events = _events_in_sessions(events, sessions, session_index)
+            session_motion_events = _events_in_sessions(motion_events, sessions, session_index)
+            session_restart_events = _events_in_sessions(restart_events, sessions, session_index)
+            session_error_lines = _error_lines_in_sessions(error_lines, sessions, session_index)
 
             if session_count == 0:
                 continue
@@ -3407,18 +3597,31 @@ def _analyze_barcode_log_errors(
     if omitted_device_count > 0:
         lines.append(f"• 참고: 장비가 많아서 상위 `{len(target_device_contexts)}개`만 분석했어")
     header_line_count = len(lines)
+    recordings_rows_index = (
+        _load_recordings_rows_index_by_barcode(barcode, [log_date])
+        if barcode and recordings_context is not None and target_device_contexts
+        else {}
+    )
 
     def _analyze_device_context_batch(device_context_batch: list[dict[str, Any]]) -> None:
         nonlocal total_session_error_lines, logs_found_any, logs_with_session, total_session_count, devices_with_session, displayed_device_index
 
-        for device_context in device_context_batch:
-            device_name = str(device_context.get("deviceName") or "")
-            if not device_name:
-                continue
+        batch_targets = [
+            (device_context, str(device_context.get("deviceName") or ""))
+            for device_context in device_context_batch
+            if str(device_context.get("deviceName") or "")
+        ]
+        fetched_logs = _iter_s3_device_log_lines(
+            s3_client,
+            [(device_name, log_date) for _, device_name in batch_targets],
+            loader=partial(_load_barcode_device_log, barcode=barcode),
+        )
+
+        for (device_context, device_name), log_data in zip(batch_targets, fetched_logs):
             device_seq = device_context.get("deviceSeq")
             recordings_on_date_rows = (
-                _load_recordings_rows_on_date_by_barcode(
-                    barcode,
+                _recordings_rows_from_index(
+                    recordings_rows_index,
                     log_date,
                     device_seq=int(device_seq) if device_seq is not None else None,
                 )
@@ -3432,21 +3635,15 @@ def _analyze_barcode_log_errors(
                 }
             )
 
-            log_data = _fetch_s3_device_log_lines(
-                s3_client,
-                device_name,
-                log_date,
-                tail_only=False,
-            )
-
             if not log_data["found"]:
                 continue
 
             source_lines = log_data["lines"]
             logs_found_any += 1
-            events = _extract_scan_events_with_line_no(source_lines)
-            motion_events = _extract_motion_events_with_line_no(source_lines)
-            restart_events = _extract_restart_events_with_line_no(source_lines)
+            log_events = log_data["log_events"]
+            events = log_events["scan_events"]
+            motion_events = log_events["motion_events"]
+            restart_events = log_events["restart_events"]
             sessions = _extract_recording_sessions(
                 source_lines,
                 barcode,
@@ -3455,11 +3652,12 @@ def _analyze_barcode_log_errors(
             )
             session_count = len(sessions)
             total_session_count += session_count
-            error_lines = _find_error_lines(source_lines)
-            session_scoped_events = _events_in_sessions(events, sessions)
-            session_motion_events = _events_in_sessions(motion_events, sessions)
-            session_restart_events = _events_in_sessions(restart_events, sessions)
-            session_error_lines = _error_lines_in_sessions(error_lines, sessions)
+            error_lines = log_events["error_lines"]
+            session_index = _build_session_index(sessions)
+            session_scoped_events = _events_in_sessions(events, sessions, session_index)
+            session_motion_events = _events_in_sessions(motion_events, sessions, session_index)
+            session_restart_events = _events_in_sessions(restart_events, sessions, session_index)
+            session_error_lines = _error_lines_in_sessions(error_lines, sessions, session_index)
             total_session_error_lines += len(session_error_lines)
 
             if session_count == 0:
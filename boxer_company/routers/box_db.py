@@ -813,6 +813,67 @@ def _load_recordings_rows_on_date_by_barcode(
         connection.close()
 
 
+def _load_recordings_rows_index_by_barcode(
+    barcode: str,
+    target_dates: list[str] | tuple[str, ...],
+) -> dict[tuple[str, int | None], list[dict[str, Any]]]:
+    if not s.DB_HOST or not s.DB_USERNAME or not s.DB_PASSWORD or not s.DB_DATABASE:
+        raise RuntimeError("DB 접속 정보(DB_*)가 비어 있어")
+
+    date_labels = sorted({str(target_date) for target_date in target_dates if target_date})
+    if not date_labels:
+        return {}
+
+    # 날짜 x 장비마다 조회하지 않고 창 전체를 한 번에 읽어 (KST 날짜, deviceSeq)로 묶는다.
+    utc_start, _ = _local_date_to_utc_range(date_labels[0])
+    _, utc_end = _local_date_to_utc_range(date_labels[-1])
+    connection = _create_db_connection(s.DB_QUERY_TIMEOUT_SEC)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT "
+                "r.seq, "
+                "r.deviceSeq, "
+                "r.videoLength, "
+                "r.streamingStatus, "
+                "r.recordedAt, "
+                "r.createdAt "
+                "FROM recordings r "
+                "WHERE r.fullBarcode = %s "
+                "AND r.recordedAt >= %s "
+                "AND r.recordedAt < %s "
+                "ORDER BY COALESCE(r.recordedAt, r.createdAt) DESC, r.seq DESC",
+                (barcode, utc_start, utc_end),
+            )
+            rows = cursor.fetchall() or []
+    finally:
+        connection.close()
+
+    wanted_dates = set(date_labels)
+    index: dict[tuple[str, int | None], list[dict[str, Any]]] = {}
+    for row in rows:
+        local_dt = _to_local_datetime(row.get("recordedAt"))
+        if local_dt is None:
+            continue
+        date_label = f"{local_dt:%Y-%m-%d}"
+        if date_label not in wanted_dates:
+            continue
+        device_seq = row.get("deviceSeq")
+        index.setdefault((date_label, None), []).append(row)
+        if device_seq is not None:
+            index.setdefault((date_label, int(device_seq)), []).append(row)
+    return index
+
+
+def _recordings_rows_from_index(
+    index: dict[tuple[str, int | None], list[dict[str, Any]]],
+    target_date: str,
+    *,
+    device_seq: int | None = None,
+) -> list[dict[str, Any]]:
+    return list(index.get((target_date, int(device_seq) if device_seq is not None else None)) or [])
+
+
 def _query_recordings_length_on_date_by_barcode(
     barcode: str,
     target_date: str,
@@ -947,6 +1008,38 @@ def _format_barcode_label(value: object) -> str:
         return _display_value(value, default="미확인")
 
 
+def _barcode_int_value(barcode: str) -> int | None:
+    # 정수 컬럼을 CAST(... AS CHAR)로 비교할 때와 같은 결과가 나오도록 정규 표기 숫자만 정수로 바꾼다.
+    if not barcode.isascii() or not barcode.isdigit() or str(int(barcode)) != barcode:
+        return None
+    return int(barcode)
+
+
+def _barcode_match_clause(
+    alias: str,
+    barcode: str,
+    *,
+    text_columns: tuple[str, ...] = (),
+    int_columns: tuple[str, ...] = (),
+) -> tuple[str, list[object]]:
+    # 컬럼을 CAST로 감싸지 않고 컬럼 타입에 맞는 값을 바인딩해서 인덱스를 탈 수 있게 한다.
+    lookups: list[tuple[str, object]] = [(column, barcode) for column in text_columns]
+    int_value = _barcode_int_value(barcode)
+    if int_value is not None:
+        lookups.extend((column, int_value) for column in int_columns)
+
+    if not lookups:
+        return "1 = 0", []
+    if len(lookups) == 1:
+        column, value = lookups[0]
+        return f"{alias}.{column} = %s", [value]
+
+    # 컬럼마다 인덱스를 탈 수 있는 등호 조건만 OR로 묶으면 MySQL은 index_merge(union)로 합친다.
+    # `seq IN (SELECT ... UNION SELECT ...)`는 semijoin이 안 돼서 바깥 행마다 도는 DEPENDENT UNION이 된다.
+    or_sql = " OR ".join(f"{alias}.{column} = %s" for column, _ in lookups)
+    return f"({or_sql})", [value for _, value in lookups]
+
+
 def _query_ultrasound_captures(
     *,
     barcode: str | None = None,
@@ -1120,8 +1213,14 @@ def _query_recordings_by_filters(
     where_clauses: list[str] = []
     params: list[object] = []
     if normalized_barcode:
-        where_clauses.append("(CAST(r.fullBarcode AS CHAR) = %s OR CAST(r.barcode AS CHAR) = %s)")
-        params.extend([normalized_barcode, normalized_barcode])
+        barcode_clause, barcode_params = _barcode_match_clause(
+            "r",
+            normalized_barcode,
+            text_columns=("fullBarcode",),
+            int_columns=("barcode",),
+        )
+        where_clauses.append(barcode_clause)
+        params.extend(barcode_params)
     if target_date:
         utc_start, utc_end = _local_date_to_utc_range(target_date)
         where_clauses.append("r.recordedAt >= %s")
@@ -1293,8 +1392,13 @@ def _query_ultrasound_captures_by_filters(
     where_clauses: list[str] = []
     params: list[object] = []
     if normalized_barcode:
-        where_clauses.append("CAST(uc.barcode AS CHAR) = %s")
-        params.append(normalized_barcode)
+        barcode_clause, barcode_params = _barcode_match_clause(
+            "uc",
+            normalized_barcode,
+            int_columns=("barcode",),
+        )
+        where_clauses.append(barcode_clause)
+        params.extend(barcode_params)
     if target_date:
         utc_start, utc_end = _local_date_to_utc_range(target_date)
         where_clauses.append("uc.capturedAt >= %s")
@@ -1914,66 +2018,69 @@ def _lookup_device_contexts_by_barcode(
     if not pair_meta_map:
         return []
 
-    items: list[dict[str, Any]] = []
-    seen_device_keys: set[tuple[str, str, str]] = set()
-    limit = max(1, min(50, cs.LOG_ANALYSIS_MAX_DEVICES * 2))
+    device_seqs = list(dict.fromkeys(device_seq for device_seq, _ in pair_meta_map))
+    placeholders = ", ".join(["%s"] * len(device_seqs))
     connection = _create_db_connection(s.DB_QUERY_TIMEOUT_SEC)
     try:
         with connection.cursor() as cursor:
-            for pair, meta in pair_meta_map.items():
-                if len(items) >= limit:
-                    break
-                device_seq, hospital_seq = pair
-
-                selected_name = ""
-                if hospital_seq is not None:
-                    cursor.execute(
-                        "SELECT deviceName AS deviceName "
-                        "FROM devices "
-                        "WHERE seq = %s "
-                        "AND hospitalSeq = %s "
-                        "AND COALESCE(deviceName, '') <> '' "
-                        "LIMIT 1",
-                        (device_seq, hospital_seq),
-                    )
-                    row = cursor.fetchone() or {}
-                    selected_name = _display_value(row.get("deviceName"), default="")
-
-                if not selected_name:
-                    cursor.execute(
-                        "SELECT deviceName AS deviceName "
-                        "FROM devices "
-                        "WHERE seq = %s "
-                        "AND COALESCE(deviceName, '') <> '' "
-                        "LIMIT 1",
-                        (device_seq,),
-                    )
-                    row = cursor.fetchone() or {}
-                    selected_name = _display_value(row.get("deviceName"), default="")
-
-                if not selected_name:
-                    continue
-
-                hospital_name = _display_value(meta.get("hospitalName"), default="")
-                room_name = _display_value(meta.get("roomName"), default="")
-                dedupe_key = (selected_name, hospital_name, room_name)
-                if dedupe_key in seen_device_keys:
-                    continue
-                seen_device_keys.add(dedupe_key)
-
-                items.append(
-                    {
-                        "deviceName": selected_name,
-                        "deviceSeq": device_seq,
-                        "hospitalSeq": hospital_seq,
-                        "hospitalRoomSeq": meta.get("hospitalRoomSeq"),
-                        "hospitalName": meta.get("hospitalName"),
-                        "roomName": meta.get("roomName"),
-                    }
-                )
+            # (deviceSeq, hospitalSeq) 쌍마다 조회하지 않고 장비명을 한 번에 가져와 메모리에서 맞춘다.
+            cursor.execute(
+                "SELECT "
+                "seq AS deviceSeq, "
+                "hospitalSeq AS hospitalSeq, "
+                "deviceName AS deviceName "
+                "FROM devices "
+                f"WHERE seq IN ({placeholders}) "
+                "AND COALESCE(deviceName, '') <> ''",
+                tuple(device_seqs),
+            )
+            device_rows = cursor.fetchall() or []
     finally:
         connection.close()
 
+    name_by_seq: dict[Any, str] = {}
+    name_by_seq_and_hospital: dict[tuple[Any, Any], str] = {}
+    for row in device_rows:
+        device_name = _display_value(row.get("deviceName"), default="")
+        if not device_name:
+            continue
+        name_by_seq.setdefault(row.get("deviceSeq"), device_name)
+        name_by_seq_and_hospital.setdefault((row.get("deviceSeq"), row.get("hospitalSeq")), device_name)
+
+    items: list[dict[str, Any]] = []
+    seen_device_keys: set[tuple[str, str, str]] = set()
+    limit = max(1, min(50, cs.LOG_ANALYSIS_MAX_DEVICES * 2))
+    for pair, meta in pair_meta_map.items():
+        if len(items) >= limit:
+            break
+        device_seq, hospital_seq = pair
+
+        selected_name = ""
+        if hospital_seq is not None:
+            selected_name = name_by_seq_and_hospital.get(pair, "")
+        if not selected_name:
+            selected_name = name_by_seq.get(device_seq, "")
+        if not selected_name:
+            continue
+
+        hospital_name = _display_value(meta.get("hospitalName"), default="")
+        room_name = _display_value(meta.get("roomName"), default="")
+        dedupe_key = (selected_name, hospital_name, room_name)
+        if dedupe_key in seen_device_keys:
+            continue
+        seen_device_keys.add(dedupe_key)
+
+        items.append(
+            {
+                "deviceName": selected_name,
+                "deviceSeq": device_seq,
+                "hospitalSeq": hospital_seq,
+                "hospitalRoomSeq": meta.get("hospitalRoomSeq"),
+                "hospitalName": meta.get("hospitalName"),
+                "roomName": meta.get("roomName"),
+            }
+        )
+
     return items
 
 
@@ -8,6 +8,7 @@ import shlex
 import socket
 import tempfile
 from datetime import datetime
+from functools import partial
 from pathlib import PurePosixPath
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -29,8 +30,7 @@ from boxer_company.routers.barcode_log import (
     _error_lines_in_session,
     _device_analysis_limit,
     _extract_recording_sessions,
-    _extract_scan_events_with_line_no,
-    _find_error_lines,
+    _load_barcode_device_log,
     _find_first_ffmpeg_error_context,
     _find_recording_recovery_context,
     _merge_device_contexts_with_recordings_hospital_scope,
@@ -45,7 +45,7 @@ from boxer_company.routers.mda_graphql import (
     _is_mda_graphql_configured,
     _wait_for_mda_device_agent_ssh,
 )
-from boxer_company.routers.s3_domain import _fetch_s3_device_log_lines
+from boxer_company.routers.s3_domain import _iter_s3_device_log_lines
 
 _DEVICE_FILE_ID_HINTS = (
     "fileid",
@@ -1257,23 +1257,25 @@ def _locate_barcode_file_candidates(
 
     def _analyze_batch(device_context_batch: list[dict[str, Any]]) -> None:
         nonlocal logs_found_any
-        for device_context in device_context_batch:
-            device_name = str(device_context.get("deviceName") or "").strip()
-            if not device_name:
-                continue
+        batch_targets = [
+            (device_context, str(device_context.get("deviceName") or "").strip())
+            for device_context in device_context_batch
+            if str(device_context.get("deviceName") or "").strip()
+        ]
+        fetched_logs = _iter_s3_device_log_lines(
+            s3_client,
+            [(device_name, log_date) for _, device_name in batch_targets],
+            loader=partial(_load_barcode_device_log, barcode=barcode),
+        )
 
-            log_data = _fetch_s3_device_log_lines(
-                s3_client,
-                device_name,
-                log_date,
-                tail_only=False,
-            )
+        for (device_context, device_name), log_data in zip(batch_targets, fetched_logs):
             if not log_data["found"]:
                 continue
 
             logs_found_any += 1
             source_lines = log_data["lines"]
-            events = _extract_scan_events_with_line_no(source_lines)
+            log_events = log_data["log_events"]
+            events = log_events["scan_events"]
             sessions = _extract_recording_sessions(
                 source_lines,
                 barcode,
@@ -1283,7 +1285,7 @@ def _locate_barcode_file_candidates(
             if not sessions:
                 continue
 
-            error_lines = _find_error_lines(source_lines)
+            error_lines = log_events["error_lines"]
             session_entries: list[dict[str, Any]] = []
             for session in sessions:
                 session_entries.append(
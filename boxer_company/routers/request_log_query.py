@@ -9,6 +9,7 @@ from zoneinfo import ZoneInfo
 from boxer.core import settings as s
 from boxer.routers.common.request_log import (
     _list_request_log_recent,
+    _search_request_log,
     _summarize_request_log_by_route,
     _summarize_request_log_by_user,
     _summarize_request_log_overview,
@@ -26,6 +27,14 @@ _REQUEST_LOG_OVERVIEW_PREFIXES = (
 )
 _REQUEST_LOG_DATE_PATTERN = re.compile(r"\b(20\d{2}-\d{2}-\d{2})\b")
 _REQUEST_LOG_LIMIT_PATTERN = re.compile(r"(?<![-\d])([1-9]\d?)(?![-\d])")
+_REQUEST_LOG_SEARCH_KEYWORD_PATTERN = re.compile(r"^(검색|search)\b\s*", re.IGNORECASE)
+_REQUEST_LOG_SEARCH_SCOPE_PATTERNS = (
+    ("last_month", re.compile(r"(지난\s*달|last\s+month)", re.IGNORECASE)),
+    ("this_month", re.compile(r"(이번\s*달|this\s+month)", re.IGNORECASE)),
+    ("yesterday", re.compile(r"(?<!\S)(어제|yesterday)(?!\S)", re.IGNORECASE)),
+    ("today", re.compile(r"(?<!\S)(오늘|today)(?!\S)", re.IGNORECASE)),
+    ("all", re.compile(r"(?<!\S)(전체|누적|all)(?!\S)", re.IGNORECASE)),
+)
 
 
 @dataclass(frozen=True)
@@ -35,6 +44,9 @@ class RequestLogQuerySpec:
     scope_label: str
     limit: int
     user_query: str | None = None
+    search_text: str | None = None
+    date_from: str | None = None
+    date_to: str | None = None
 
 
 def _request_log_timezone() -> ZoneInfo:
@@ -65,6 +77,9 @@ def _extract_request_log_query(question: str) -> RequestLogQuerySpec | None:
         return None
 
     lowered_remainder = remainder.lower()
+    if _REQUEST_LOG_SEARCH_KEYWORD_PATTERN.match(remainder):
+        return _extract_request_log_search_query(remainder)
+
     if remainder.startswith("최근") or lowered_remainder.startswith("recent"):
         target_date, scope_label = _extract_request_log_scope(
             remainder,
@@ -135,6 +150,58 @@ def _extract_request_log_query(question: str) -> RequestLogQuerySpec | None:
     )
 
 
+def _extract_request_log_search_query(text: str) -> RequestLogQuerySpec:
+    # 검색은 과거 질문을 찾는 용도라 기본 범위를 전체 누적으로 둔다.
+    working = _REQUEST_LOG_SEARCH_KEYWORD_PATTERN.sub("", str(text or "").strip(), count=1)
+    target_date: str | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+    scope_label = "전체 누적"
+
+    date_match = _REQUEST_LOG_DATE_PATTERN.search(working)
+    if date_match:
+        target_date = date_match.group(1)
+        scope_label = f"`{target_date}`"
+        working = working[:date_match.start()] + " " + working[date_match.end():]
+    for scope, pattern in _REQUEST_LOG_SEARCH_SCOPE_PATTERNS:
+        scope_match = pattern.search(working)
+        if not scope_match:
+            continue
+        working = working[:scope_match.start()] + " " + working[scope_match.end():]
+        if target_date or date_from:
+            continue
+        if scope == "yesterday":
+            target_date = _request_log_yesterday()
+            scope_label = f"어제 (`{target_date}`)"
+        elif scope == "today":
+            target_date = _request_log_today()
+            scope_label = f"오늘 (`{target_date}`)"
+        elif scope in {"this_month", "last_month"}:
+            date_from, date_to = _request_log_month_range(previous=scope == "last_month")
+            month_label = "지난달" if scope == "last_month" else "이번 달"
+            scope_label = f"{month_label} (`{date_from}` ~ `{date_to}`)"
+
+    search_text = " ".join(working.split()).strip(" ,")
+    return RequestLogQuerySpec(
+        mode="search",
+        target_date=target_date,
+        scope_label=scope_label,
+        limit=20,
+        search_text=search_text or None,
+        date_from=target_date or date_from,
+        date_to=target_date or date_to,
+    )
+
+
+def _request_log_month_range(*, previous: bool) -> tuple[str, str]:
+    first_of_month = datetime.now(_request_log_timezone()).date().replace(day=1)
+    if not previous:
+        next_month = (first_of_month + timedelta(days=32)).replace(day=1)
+        return first_of_month.isoformat(), (next_month - timedelta(days=1)).isoformat()
+    last_of_previous = first_of_month - timedelta(days=1)
+    return last_of_previous.replace(day=1).isoformat(), last_of_previous.isoformat()
+
+
 def _extract_request_log_user_query(text: str) -> str | None:
     normalized = str(text or "").strip()
     if not normalized:
@@ -221,6 +288,17 @@ def _query_request_log_text(
             db_path=db_path,
         )
         return _format_request_log_recent(result, spec)
+    if spec.mode == "search":
+        if not spec.search_text:
+            return _format_request_log_search({}, spec)
+        result = _search_request_log(
+            spec.search_text,
+            date_from=spec.date_from,
+            date_to=spec.date_to,
+            limit=spec.limit,
+            db_path=db_path,
+        )
+        return _format_request_log_search(result, spec)
     if spec.mode == "users":
         result = _summarize_request_log_by_user(
             target_date=spec.target_date,
@@ -321,6 +399,43 @@ def _format_request_log_recent(result: dict[str, Any], spec: RequestLogQuerySpec
     return "\n".join(lines)
 
 
+def _format_request_log_search(result: dict[str, Any], spec: RequestLogQuerySpec) -> str:
+    lines = [
+        "*요청 로그 검색 결과*",
+        f"• 기준: {spec.scope_label}",
+    ]
+    if not spec.search_text:
+        lines.append("• 결과: 검색어가 필요해")
+        lines.append("• 예시: `요청 로그 검색 12345678901`, `요청 로그 검색 지난달 영상 누락`")
+        return "\n".join(lines)
+
+    rows = [row for row in (result.get("rows") or []) if isinstance(row, dict)]
+    lines.extend(
+        [
+            f"• 검색어: `{spec.search_text}`",
+            f"• 표시 건수: 최근 `{spec.limit}건`",
+            f"• 일치 요청: `{int(result.get('totalCount') or 0)}건`",
+        ]
+    )
+    if not rows:
+        lines.append("• 결과: 검색어가 포함된 요청 로그가 없어")
+        return "\n".join(lines)
+
+    for index, row in enumerate(rows, start=1):
+        permalink = str(row.get("permalink") or row.get("threadPermalink") or "").strip()
+        line = (
+            f"{index}. `{_time_label(row.get('createdAtLocal'))}`"
+            f" | `{_user_label(row)}`"
+            f" | `{_route_label(row)}`"
+            f" | `{_status_label(row.get('status'))}`"
+        )
+        if permalink:
+            line += f" | <{permalink}|링크>"
+        lines.append(line)
+        lines.append(f"   {_compact_request_text(row)}")
+    return "\n".join(lines)
+
+
 def _format_request_log_users(result: dict[str, Any], spec: RequestLogQuerySpec) -> str:
     rows = [row for row in (result.get("rows") or []) if isinstance(row, dict)]
     lines = [
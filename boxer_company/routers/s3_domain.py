@@ -1,6 +1,17 @@
+import codecs
+import hashlib
+import mmap
+import os
 import re
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
+from zoneinfo import ZoneInfo
 
 from botocore.exceptions import ClientError
 
@@ -16,6 +27,305 @@ from boxer.core.utils import (
 )
 
 
+_S3_LOG_CACHE_SUFFIX = ".log"
+_S3_LOG_CACHE_EVICTION_LOCK = threading.Lock()
+_S3_LOG_STREAM_CHUNK_BYTES = 1024 * 1024
+_S3_LOG_PREFILTER_SPOOL_BYTES = 4 * _S3_LOG_STREAM_CHUNK_BYTES
+
+
+def _is_past_log_date(log_date: str) -> bool:
+    tz_name = os.getenv("TZ", "Asia/Seoul")
+    try:
+        today = datetime.now(ZoneInfo(tz_name)).date()
+    except Exception:
+        today = datetime.now(ZoneInfo("Asia/Seoul")).date()
+    try:
+        return datetime.strptime(log_date, "%Y-%m-%d").date() < today
+    except ValueError:
+        return False
+
+
+def _s3_log_cache_path(bucket: str, key: str, etag: object) -> str | None:
+    cache_dir = (cs.S3_LOG_CACHE_DIR or "").strip()
+    normalized_etag = str(etag or "").strip().strip('"')
+    if not cs.S3_LOG_CACHE_ENABLED or not cache_dir or not normalized_etag:
+        return None
+    digest = hashlib.sha256(f"{bucket}\0{key}\0{normalized_etag}".encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}{_S3_LOG_CACHE_SUFFIX}")
+
+
+def _read_s3_log_cache(cache_path: str, content_length: int, range_start: int = 0) -> str | None:
+    try:
+        with open(cache_path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size != content_length:
+                return None
+            if size == 0:
+                text = ""
+            else:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    text = str(mapped[range_start:] if range_start else mapped, "utf-8", "replace")
+    except (OSError, ValueError):
+        return None
+
+    try:
+        # mtime을 LRU 기준으로 쓰기 때문에 hit 시점으로 갱신
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return text
+
+
+def _evict_s3_log_cache(cache_dir: str) -> None:
+    max_bytes = max(0, cs.S3_LOG_CACHE_MAX_BYTES)
+    with _S3_LOG_CACHE_EVICTION_LOCK:
+        entries: list[tuple[float, int, str]] = []
+        total_bytes = 0
+        try:
+            for entry in os.scandir(cache_dir):
+                if not entry.is_file() or not entry.name.endswith(_S3_LOG_CACHE_SUFFIX):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+        except OSError:
+            return
+
+        if total_bytes <= max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            if total_bytes <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_bytes -= size
+
+
+def _write_s3_log_cache(cache_path: str, body: bytes) -> None:
+    cache_dir = os.path.dirname(cache_path)
+    temp_path = ""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix="s3-log-", suffix=".tmp", dir=cache_dir)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(body)
+        os.replace(temp_path, cache_path)
+        temp_path = ""
+    except OSError:
+        return
+    finally:
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    _evict_s3_log_cache(cache_dir)
+
+
+def _iter_s3_log_cache_chunks(cache_path: str, content_length: int) -> Iterator[bytes] | None:
+    # 크기만 먼저 확인하고 파일은 실제로 읽기 시작할 때 연다. 바코드 사전 검사에서 걸러지면 열 일이 없다.
+    try:
+        if os.stat(cache_path).st_size != content_length:
+            return None
+        os.utime(cache_path)
+    except OSError:
+        return None
+
+    def _chunks() -> Iterator[bytes]:
+        if content_length <= 0:
+            return
+        with open(cache_path, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, content_length, _S3_LOG_STREAM_CHUNK_BYTES):
+                    yield mapped[offset : offset + _S3_LOG_STREAM_CHUNK_BYTES]
+
+    return _chunks()
+
+
+def _tee_s3_log_chunks_to_cache(
+    chunks: Iterable[bytes],
+    cache_path: str,
+    content_length: int,
+) -> Iterator[bytes]:
+    # 스트리밍으로 읽는 동안 캐시 파일도 같이 써두고, 끝까지 다 받은 경우에만 캐시로 확정한다.
+    cache_dir = os.path.dirname(cache_path)
+    handle = None
+    temp_path = ""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix="s3-log-", suffix=".tmp", dir=cache_dir)
+        handle = os.fdopen(fd, "wb")
+    except OSError:
+        handle = None
+
+    written = 0
+    completed = False
+    try:
+        for chunk in chunks:
+            if handle is not None:
+                try:
+                    handle.write(chunk)
+                    written += len(chunk)
+                except OSError:
+                    handle.close()
+                    handle = None
+            yield chunk
+        completed = True
+    finally:
+        if handle is not None:
+            handle.close()
+        if handle is not None and completed and written == content_length:
+            try:
+                os.replace(temp_path, cache_path)
+                temp_path = ""
+            except OSError:
+                pass
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    if handle is not None and not temp_path:
+        _evict_s3_log_cache(cache_dir)
+
+
+def _s3_log_cache_contains(cache_path: str, needle: bytes) -> bool:
+    try:
+        with open(cache_path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size <= 0:
+                return False
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped.find(needle) >= 0
+    except (OSError, ValueError):
+        # 판단할 수 없으면 걸러내지 않고 정상 경로로 읽게 둔다.
+        return True
+
+
+def _buffer_chunks_until_found(chunks: Iterable[bytes], needle: bytes) -> Iterator[bytes] | None:
+    # needle이 나올 때까지는 디코딩하지 않고 원본 청크를 임시 파일에 흘려둔다. 끝까지 없으면 None.
+    # 바코드 앞쪽 줄도 재시작/스캔 이벤트와 줄 번호에 필요해서 버리지 않고, 메모리에는 작은 버퍼만 남긴다.
+    spool = tempfile.SpooledTemporaryFile(max_size=_S3_LOG_PREFILTER_SPOOL_BYTES)
+    chunk_iter = iter(chunks)
+    carry = b""
+    found = False
+    try:
+        for chunk in chunk_iter:
+            spool.write(chunk)
+            window = carry + chunk
+            if window.find(needle) >= 0:
+                found = True
+                break
+            carry = window[-(len(needle) - 1) :] if len(needle) > 1 else b""
+    except BaseException:
+        spool.close()
+        raise
+    if not found:
+        spool.close()
+        return None
+
+    def _chunks() -> Iterator[bytes]:
+        try:
+            spool.seek(0)
+            while True:
+                block = spool.read(_S3_LOG_STREAM_CHUNK_BYTES)
+                if not block:
+                    break
+                yield block
+        finally:
+            spool.close()
+        yield from chunk_iter
+
+    return _chunks()
+
+
+def _iter_decoded_log_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    # body.decode("utf-8", errors="replace").splitlines()와 같은 줄을 돌려주되 전체 본문을 메모리에 올리지 않는다.
+    # 마지막 조각은 줄바꿈으로 끝나도 다음 청크의 "\n"과 합쳐질 수 있어서 항상 다음 청크까지 보류한다.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        text = pending + decoder.decode(chunk)
+        if not text:
+            continue
+        parts = text.splitlines(keepends=True)
+        pending = parts.pop()
+        for part in parts:
+            yield part.splitlines()[0]
+    yield from (pending + decoder.decode(b"", final=True)).splitlines()
+
+
+def _head_s3_device_log(s3_client: Any, key: str) -> dict[str, Any] | None:
+    try:
+        return s3_client.head_object(Bucket=s.S3_LOG_BUCKET, Key=key)
+    except ClientError as exc:
+        code = str(exc.response.get("Error", {}).get("Code", ""))
+        if code in {"404", "NotFound", "NoSuchKey"}:
+            return None
+        raise
+
+
+def _device_log_cache_path(key: str, log_date: str, head_response: dict[str, Any]) -> str | None:
+    # 지난 날짜 로그는 더 이상 바뀌지 않아서 ETag 기준으로 로컬 캐시를 재사용한다.
+    if not _is_past_log_date(log_date):
+        return None
+    return _s3_log_cache_path(s.S3_LOG_BUCKET, key, head_response.get("ETag"))
+
+
+def _stream_s3_device_log_lines(
+    s3_client: Any,
+    device_name: str,
+    log_date: str,
+    required_text: str | None = None,
+) -> dict[str, Any]:
+    key = f"{device_name}/log-{log_date}.log"
+    head_response = _head_s3_device_log(s3_client, key)
+    if head_response is None:
+        return {
+            "found": False,
+            "device_name": device_name,
+            "key": key,
+            "content_length": 0,
+            "lines": iter(()),
+            "matched": False,
+        }
+
+    content_length = int(head_response.get("ContentLength") or 0)
+    unmatched_result = {
+        "found": True,
+        "device_name": device_name,
+        "key": key,
+        "content_length": content_length,
+        "lines": iter(()),
+        "matched": False,
+    }
+    # required_text(예: 바코드)가 원본 바이트에 아예 없으면 디코딩/정규식 추출 없이 건너뛴다.
+    needle = (required_text or "").encode("utf-8")
+    cache_path = _device_log_cache_path(key, log_date, head_response)
+    chunks = _iter_s3_log_cache_chunks(cache_path, content_length) if cache_path else None
+    if chunks is not None and needle and not _s3_log_cache_contains(cache_path, needle):
+        return unmatched_result
+    if chunks is None:
+        get_response = s3_client.get_object(Bucket=s.S3_LOG_BUCKET, Key=key)
+        chunks = get_response["Body"].iter_chunks(_S3_LOG_STREAM_CHUNK_BYTES)
+        if cache_path:
+            chunks = _tee_s3_log_chunks_to_cache(chunks, cache_path, content_length)
+    if needle:
+        chunks = _buffer_chunks_until_found(chunks, needle)
+        if chunks is None:
+            return unmatched_result
+
+    return {
+        "found": True,
+        "device_name": device_name,
+        "key": key,
+        "content_length": content_length,
+        "lines": _iter_decoded_log_lines(chunks),
+        "matched": True,
+    }
+
+
 def _fetch_s3_device_log_lines(
     s3_client: Any,
     device_name: str,
@@ -23,34 +333,36 @@ def _fetch_s3_device_log_lines(
     tail_only: bool = True,
 ) -> dict[str, Any]:
     key = f"{device_name}/log-{log_date}.log"
-    try:
-        head_response = s3_client.head_object(Bucket=s.S3_LOG_BUCKET, Key=key)
-    except ClientError as exc:
-        code = str(exc.response.get("Error", {}).get("Code", ""))
-        if code in {"404", "NotFound", "NoSuchKey"}:
-            return {
-                "found": False,
-                "device_name": device_name,
-                "key": key,
-                "content_length": 0,
-                "lines": [],
-            }
-        raise
+    head_response = _head_s3_device_log(s3_client, key)
+    if head_response is None:
+        return {
+            "found": False,
+            "device_name": device_name,
+            "key": key,
+            "content_length": 0,
+            "lines": [],
+        }
 
     content_length = int(head_response.get("ContentLength") or 0)
     tail_bytes = max(1024, s.S3_LOG_TAIL_BYTES)
     use_range = tail_only and content_length > tail_bytes
-    get_params: dict[str, Any] = {
-        "Bucket": s.S3_LOG_BUCKET,
-        "Key": key,
-    }
-    if use_range:
-        range_start = max(0, content_length - tail_bytes)
-        get_params["Range"] = f"bytes={range_start}-{content_length - 1}"
+    range_start = max(0, content_length - tail_bytes) if use_range else 0
+    cache_path = _device_log_cache_path(key, log_date, head_response)
+    text = _read_s3_log_cache(cache_path, content_length, range_start) if cache_path else None
+    if text is None:
+        get_params: dict[str, Any] = {
+            "Bucket": s.S3_LOG_BUCKET,
+            "Key": key,
+        }
+        if use_range:
+            get_params["Range"] = f"bytes={range_start}-{content_length - 1}"
+
+        get_response = s3_client.get_object(**get_params)
+        body = get_response["Body"].read()
+        if cache_path and not use_range:
+            _write_s3_log_cache(cache_path, body)
+        text = body.decode("utf-8", errors="replace")
 
-    get_response = s3_client.get_object(**get_params)
-    body = get_response["Body"].read()
-    text = body.decode("utf-8", errors="replace")
     lines = text.splitlines()
     if use_range and lines:
         lines = lines[1:]
@@ -64,6 +376,81 @@ def _fetch_s3_device_log_lines(
     }
 
 
+def _iter_s3_device_log_lines(
+    s3_client: Any,
+    targets: list[tuple[str, str]],
+    tail_only: bool = True,
+    loader: Callable[[Any, str, str], dict[str, Any]] | None = None,
+) -> Iterator[dict[str, Any]]:
+    # (device_name, log_date) 순서를 그대로 유지하면서, 앞쪽 객체를 기다리는 동안 뒤쪽 객체를 미리 받아둔다.
+    # loader를 넘기면 객체별 조회+가공을 worker 안에서 끝내고 그 결과만 돌려준다.
+    if loader is None:
+        def loader(client: Any, device_name: str, log_date: str) -> dict[str, Any]:
+            return _fetch_s3_device_log_lines(client, device_name, log_date, tail_only=tail_only)
+
+    max_workers = max(1, min(len(targets), cs.LOG_FETCH_MAX_WORKERS))
+    if max_workers <= 1:
+        for device_name, log_date in targets:
+            yield loader(s3_client, device_name, log_date)
+        return
+
+    # 제한 시간은 객체마다 worker가 조회를 시작한 시점부터 잰다. executor 큐에서 기다린 시간은 넣지 않는다.
+    # 시간이 넘으면 아직 시작 안 한 조회만 취소되고, 이미 돌고 있는 조회는 끝날 때까지 버려 둔다.
+    timeout_sec = max(1, cs.LOG_FETCH_OBJECT_TIMEOUT_SEC)
+    # 결과를 들고 있는 future 수를 제한해서 긴 날짜 범위에서도 메모리가 쌓이지 않게 한다.
+    prefetch_limit = max_workers * 2
+    pending: deque[tuple[str, str, list[float], threading.Event, Future]] = deque()
+    target_iter = iter(targets)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-log-fetch")
+
+    def _load_from_start(
+        started_at: list[float],
+        started: threading.Event,
+        device_name: str,
+        log_date: str,
+    ) -> dict[str, Any]:
+        started_at.append(time.monotonic())
+        started.set()
+        return loader(s3_client, device_name, log_date)
+
+    def _submit_next() -> bool:
+        next_target = next(target_iter, None)
+        if next_target is None:
+            return False
+        device_name, log_date = next_target
+        started_at: list[float] = []
+        started = threading.Event()
+        pending.append(
+            (
+                device_name,
+                log_date,
+                started_at,
+                started,
+                executor.submit(_load_from_start, started_at, started, device_name, log_date),
+            )
+        )
+        return True
+
+    try:
+        while len(pending) < prefetch_limit and _submit_next():
+            pass
+        while pending:
+            device_name, log_date, started_at, started, future = pending.popleft()
+            try:
+                # 큐는 FIFO라 맨 앞 객체보다 먼저 넣은 조회는 이미 끝났고, 이 객체도 곧 worker를 잡는다.
+                if not started.wait(timeout_sec):
+                    raise TimeoutError
+                log_data = future.result(timeout=max(0.0, started_at[0] + timeout_sec - time.monotonic()))
+            except TimeoutError as exc:
+                raise RuntimeError(
+                    f"S3 로그 조회 시간이 초과됐어: {device_name}/log-{log_date}.log ({timeout_sec}s)"
+                ) from exc
+            _submit_next()
+            yield log_data
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _extract_s3_log_request(normalized_question: str) -> dict[str, str]:
     path_match = cs.S3_LOG_PATH_PATTERN.search(normalized_question)
     if path_match:
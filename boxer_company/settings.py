@@ -190,6 +190,11 @@ LOG_SCAN_MAX_EVENTS = int(os.getenv("LOG_SCAN_MAX_EVENTS", "50"))
 LOG_SESSION_SAFETY_LINES = int(os.getenv("LOG_SESSION_SAFETY_LINES", "20"))
 LOG_POST_STOP_MAX_LINES = int(os.getenv("LOG_POST_STOP_MAX_LINES", "50"))
 LOG_PHASE1_MAX_DAYS = int(os.getenv("LOG_PHASE1_MAX_DAYS", "30"))
+LOG_FETCH_MAX_WORKERS = int(os.getenv("LOG_FETCH_MAX_WORKERS", "6"))
+LOG_FETCH_OBJECT_TIMEOUT_SEC = int(os.getenv("LOG_FETCH_OBJECT_TIMEOUT_SEC", "60"))
+S3_LOG_CACHE_ENABLED = os.getenv("S3_LOG_CACHE_ENABLED", "true").strip().lower() == "true"
+S3_LOG_CACHE_DIR = os.getenv("S3_LOG_CACHE_DIR", "/tmp/boxer-s3-log-cache").strip()
+S3_LOG_CACHE_MAX_BYTES = int(os.getenv("S3_LOG_CACHE_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
 RECORDINGS_CONTEXT_LIMIT = int(os.getenv("RECORDINGS_CONTEXT_LIMIT", "30"))
 BARCODE_LOG_ERROR_SUMMARY_MAX_TOKENS = int(
     os.getenv("BARCODE_LOG_ERROR_SUMMARY_MAX_TOKENS", "1200")
@@ -1,6 +1,7 @@
 import json
 import logging
 import re
+from itertools import accumulate
 from typing import Any
 
 import pymysql
@@ -12,7 +13,9 @@ from boxer_adapter_slack.common import (
     MentionPayload,
     SlackReplyFn,
     _merge_request_log_metadata,
+    _SlackStreamInterrupted,
     _set_request_log_route,
+    _stream_slack_reply,
     create_slack_app,
 )
 from boxer_company_adapter_slack.fun import handle_fun_message
@@ -30,9 +33,17 @@ from boxer_company.retrieval_rules import (
 from boxer_company import settings as cs
 from boxer_company.utils import _extract_barcode
 from boxer.core import settings as s
-from boxer.core.llm import _ask_claude, _ask_ollama_chat, _check_claude_health, _check_ollama_health
+from boxer.core.llm import (
+    _ask_claude,
+    _ask_ollama_chat,
+    _check_claude_health,
+    _check_ollama_health,
+    _sanitize_ollama_stream,
+    _stream_claude,
+    _stream_ollama_chat,
+)
 from boxer.core.retrieval_synthesis import _synthesize_retrieval_answer
-from boxer.core.thread_context import _build_model_input, _load_thread_context
+from boxer.core.thread_context import _ThreadContextLoader, _build_model_input
 from boxer.core.utils import _validate_tokens
 from boxer_company.routers.app_user import _lookup_app_user_by_barcode, _should_lookup_barcode
 from boxer_company.routers.barcode_log import (
@@ -657,6 +668,10 @@ def _sanitize_freeform_reply(text: str) -> str:
     return cleaned or normalized
 
 
+def _finalize_freeform_reply(text: str) -> str:
+    return _sanitize_freeform_reply(text) or "답변을 생성하지 못했어. 다시 질문해줘"
+
+
 def _get_freeform_system_prompt(
     question: str = "",
     thread_context: str = "",
@@ -1420,6 +1435,7 @@ def create_app() -> App:
         channel_id = payload["channel_id"]
         current_ts = payload["current_ts"]
         thread_ts = payload["thread_ts"]
+        thread_context_loader = _ThreadContextLoader(client, logger, channel_id, thread_ts, current_ts)
 
         if "ping" in text:
             _set_request_log_route(payload, "ping")
@@ -1680,13 +1696,7 @@ def create_app() -> App:
             try:
                 thread_context = ""
                 if evidence_route == "notion_playbook_qa" or s.LLM_SYNTHESIS_INCLUDE_THREAD_CONTEXT:
-                    thread_context = _load_thread_context(
-                        client,
-                        logger,
-                        channel_id,
-                        thread_ts,
-                        current_ts,
-                    )
+                    thread_context = thread_context_loader.load()
                 synthesized_text = _synthesize_retrieval_answer(
                     question=question,
                     thread_context=thread_context,
@@ -2190,13 +2200,7 @@ def create_app() -> App:
             try:
                 thread_context = ""
                 if s.LLM_SYNTHESIS_INCLUDE_THREAD_CONTEXT:
-                    thread_context = _load_thread_context(
-                        client,
-                        logger,
-                        channel_id,
-                        thread_ts,
-                        current_ts,
-                    )
+                    thread_context = thread_context_loader.load()
                 rendered_sections: list[str] = []
                 for session_entry in interesting_entries:
                     session_payload = _build_barcode_log_error_summary_session_payload(summary_payload, session_entry)
@@ -2392,13 +2396,7 @@ def create_app() -> App:
                 phase2_has_requested_date = True
 
         if has_phase2_scope and phase2_has_requested_date:
-            thread_context_for_scope = _load_thread_context(
-                client,
-                logger,
-                channel_id,
-                thread_ts,
-                current_ts,
-            )
+            thread_context_for_scope = thread_context_loader.load()
 
         if not barcode and has_phase2_scope and phase2_has_requested_date:
             recovered_barcode = _extract_latest_barcode_from_thread_context(thread_context_for_scope)
@@ -2755,13 +2753,7 @@ def create_app() -> App:
                     question=question,
                     summary_payload=log_analysis_payload,
                 )
-                failure_thread_context = thread_context_for_scope or _load_thread_context(
-                    client,
-                    logger,
-                    channel_id,
-                    thread_ts,
-                    current_ts,
-                )
+                failure_thread_context = thread_context_loader.load()
                 failure_user_thread_text = _extract_user_only_thread_text(failure_thread_context, user_id)
                 selector_text = "\n".join(
                     part for part in (failure_user_thread_text, question) if (part or "").strip()
@@ -3432,13 +3424,7 @@ def create_app() -> App:
         notion_thread_context = ""
         is_notion_doc_question = _looks_like_notion_doc_question(question)
         if not is_notion_doc_question and thread_ts:
-            notion_thread_context = _load_thread_context(
-                client,
-                logger,
-                channel_id,
-                thread_ts,
-                current_ts,
-            )
+            notion_thread_context = thread_context_loader.load()
             is_notion_doc_question = _looks_like_notion_doc_followup(question, notion_thread_context)
 
         if is_notion_doc_question:
@@ -3464,13 +3450,7 @@ def create_app() -> App:
                     },
                 }
                 if not notion_thread_context and thread_ts:
-                    notion_thread_context = _load_thread_context(
-                        client,
-                        logger,
-                        channel_id,
-                        thread_ts,
-                        current_ts,
-                    )
+                    notion_thread_context = thread_context_loader.load()
                 notion_query_text = _build_notion_doc_query_text(question, notion_thread_context)
                 if notion_query_text and notion_query_text != question:
                     evidence_payload["request"]["contextualQuestion"] = notion_query_text
@@ -3522,13 +3502,7 @@ def create_app() -> App:
                 logger.info("Rejected claude call for user=%s", user_id)
                 return
             try:
-                thread_context = _load_thread_context(
-                    client,
-                    logger,
-                    channel_id,
-                    thread_ts,
-                    current_ts,
-                )
+                thread_context = thread_context_loader.load()
                 if is_prompt_exfiltration_attempt(question, thread_context):
                     logger.warning(
                         "Blocked freeform prompt exfiltration attempt in thread_ts=%s question=%s",
@@ -3541,13 +3515,7 @@ def create_app() -> App:
                 if fallback_evidence is not None:
                     synthesis_thread_context = ""
                     if s.LLM_SYNTHESIS_INCLUDE_THREAD_CONTEXT:
-                        synthesis_thread_context = _load_thread_context(
-                            client,
-                            logger,
-                            channel_id,
-                            thread_ts,
-                            current_ts,
-                        )
+                        synthesis_thread_context = thread_context_loader.load()
                     answer = _synthesize_retrieval_answer(
                         question=question,
                         thread_context=synthesis_thread_context,
@@ -3572,20 +3540,36 @@ def create_app() -> App:
                         barcode,
                     )
                 model_input = _build_model_input(question, thread_context)
+                freeform_system_prompt = _build_freeform_chat_system_prompt(
+                    question,
+                    thread_context,
+                    speaker_user_id=user_id,
+                )
+                if s.LLM_STREAMING_ENABLED:
+                    _stream_slack_reply(
+                        payload,
+                        client,
+                        accumulate(
+                            _stream_claude(
+                                claude_client,
+                                model_input,
+                                system_prompt=freeform_system_prompt,
+                            )
+                        ),
+                        sanitize=_sanitize_freeform_reply,
+                        finalize=_finalize_freeform_reply,
+                    )
+                    logger.info("Responded with streamed claude answer in thread_ts=%s", thread_ts)
+                    return
                 answer = _ask_claude(
                     claude_client,
                     model_input,
-                    system_prompt=_build_freeform_chat_system_prompt(
-                        question,
-                        thread_context,
-                        speaker_user_id=user_id,
-                    ),
+                    system_prompt=freeform_system_prompt,
                 )
-                answer = _sanitize_freeform_reply(answer)
-                if not answer:
-                    answer = "답변을 생성하지 못했어. 다시 질문해줘"
-                reply(answer)
+                reply(_finalize_freeform_reply(answer))
                 logger.info("Responded with claude answer in thread_ts=%s", thread_ts)
+            except _SlackStreamInterrupted:
+                logger.warning("Claude streamed answer interrupted in thread_ts=%s", thread_ts, exc_info=True)
             except TimeoutError:
                 logger.warning("Claude API timeout")
                 reply(_timeout_reply_text())
@@ -3605,13 +3589,7 @@ def create_app() -> App:
                 reply("질문 내용을 같이 보내줘. 지원 기능이 궁금하면 `사용법`이라고 보내줘")
                 return
             try:
-                thread_context = _load_thread_context(
-                    client,
-                    logger,
-                    channel_id,
-                    thread_ts,
-                    current_ts,
-                )
+                thread_context = thread_context_loader.load()
                 if is_prompt_exfiltration_attempt(question, thread_context):
                     logger.warning(
                         "Blocked freeform prompt exfiltration attempt in thread_ts=%s question=%s",
@@ -3629,13 +3607,7 @@ def create_app() -> App:
                 if fallback_evidence is not None:
                     synthesis_thread_context = ""
                     if s.LLM_SYNTHESIS_INCLUDE_THREAD_CONTEXT:
-                        synthesis_thread_context = _load_thread_context(
-                            client,
-                            logger,
-                            channel_id,
-                            thread_ts,
-                            current_ts,
-                        )
+                        synthesis_thread_context = thread_context_loader.load()
                     answer = _synthesize_retrieval_answer(
                         question=question,
                         thread_context=synthesis_thread_context,
@@ -3660,20 +3632,36 @@ def create_app() -> App:
                         barcode,
                     )
                 model_input = _build_model_input(question, thread_context)
+                freeform_system_prompt = _build_freeform_chat_system_prompt(
+                    question,
+                    thread_context,
+                    speaker_user_id=user_id,
+                )
+                if s.LLM_STREAMING_ENABLED:
+                    _stream_slack_reply(
+                        payload,
+                        client,
+                        _sanitize_ollama_stream(
+                            _stream_ollama_chat(
+                                model_input,
+                                system_prompt=freeform_system_prompt,
+                                think=False,
+                            )
+                        ),
+                        sanitize=_sanitize_freeform_reply,
+                        finalize=_finalize_freeform_reply,
+                    )
+                    logger.info("Responded with streamed ollama answer in thread_ts=%s", thread_ts)
+                    return
                 answer = _ask_ollama_chat(
                     model_input,
-                    system_prompt=_build_freeform_chat_system_prompt(
-                        question,
-                        thread_context,
-                        speaker_user_id=user_id,
-                    ),
+                    system_prompt=freeform_system_prompt,
                     think=False,
                 )
-                answer = _sanitize_freeform_reply(answer)
-                if not answer:
-                    answer = "답변을 생성하지 못했어. 다시 질문해줘"
-                reply(answer)
+                reply(_finalize_freeform_reply(answer))
                 logger.info("Responded with ollama answer in thread_ts=%s", thread_ts)
+            except _SlackStreamInterrupted:
+                logger.warning("Ollama streamed answer interrupted in thread_ts=%s", thread_ts, exc_info=True)
             except TimeoutError:
                 logger.warning("Ollama API timeout")
                 reply(_timeout_reply_text())
@@ -0,0 +1,154 @@
+import unittest
+from unittest import mock
+
+from boxer_company import settings as cs
+from boxer_company.routers import barcode_log
+
+from boxer_company.routers.barcode_log import (
+    _build_session_index,
+    _events_in_sessions,
+    _extract_log_events,
+    _extract_motion_events_with_line_no,
+    _extract_recording_sessions,
+    _extract_restart_events_with_line_no,
+    _extract_scan_events_with_line_no,
+    _find_error_lines,
+    _find_session_for_line,
+    _line_in_any_session,
+    _parse_structured_log_line,
+)
+
+
+_SAMPLE_LOG_LINES = [
+    "[10:00:00] mommybox starting",
+    "[10:00:00] app version: 2.11.300",
+    "[10:00:01] [Scanner] [info] Scanned : 12345678901",
+    "[10:00:02] motion detection : 1",
+    "[10:00:03] motion detection : 2",
+    "[10:00:04] Motion detection passed",
+    "[10:00:05] [Recorder] [error] ffmpeg exited with code 1",
+    "[10:00:06] [Scanner] [info] Scanned : C_STOPSESS",
+    "[10:00:07] Stopping motion detection. motionDetected: true, error: false",
+]
+
+
+class ExtractLogEventsTests(unittest.TestCase):
+    def test_extracts_all_event_streams_in_one_pass(self) -> None:
+        log_events = _extract_log_events(_SAMPLE_LOG_LINES)
+
+        self.assertEqual(
+            [(event["line_no"], event["token"]) for event in log_events["scan_events"]],
+            [(3, "12345678901"), (8, "C_STOPSESS")],
+        )
+        self.assertEqual(
+            [(event["line_no"], event["event_type"]) for event in log_events["motion_events"]],
+            [(4, "motion_start"), (6, "motion_trigger"), (9, "motion_stop")],
+        )
+        self.assertEqual(len(log_events["restart_events"]), 1)
+        self.assertEqual(log_events["restart_events"][0]["details"], {"appVersion": "2.11.300"})
+        self.assertEqual([line_no for line_no, _ in log_events["error_lines"]], [7])
+
+    def test_sessions_use_fused_scan_events(self) -> None:
+        log_events = _extract_log_events(_SAMPLE_LOG_LINES)
+        sessions = _extract_recording_sessions(
+            _SAMPLE_LOG_LINES,
+            "12345678901",
+            0,
+            scan_events=log_events["scan_events"],
+        )
+
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(sessions[0]["start_line_no"], 3)
+        self.assertEqual(sessions[0]["stop_token"], "C_STOPSESS")
+
+
+    def test_wrappers_project_precomputed_events_without_rescanning(self) -> None:
+        log_events = _extract_log_events(_SAMPLE_LOG_LINES)
+
+        with mock.patch.object(barcode_log, "_extract_log_events") as extract:
+            self.assertIs(_find_error_lines(_SAMPLE_LOG_LINES, log_events), log_events["error_lines"])
+            self.assertIs(
+                _extract_scan_events_with_line_no(_SAMPLE_LOG_LINES, log_events),
+                log_events["scan_events"],
+            )
+            self.assertIs(
+                _extract_motion_events_with_line_no(_SAMPLE_LOG_LINES, log_events),
+                log_events["motion_events"],
+            )
+            self.assertIs(
+                _extract_restart_events_with_line_no(_SAMPLE_LOG_LINES, log_events),
+                log_events["restart_events"],
+            )
+
+        extract.assert_not_called()
+
+class SessionWindowRetentionTests(unittest.TestCase):
+    def test_keeps_only_lines_around_requested_barcode_sessions(self) -> None:
+        lines = [f"[09:00:{index % 60:02d}] filler {index}" for index in range(1, 301)]
+        lines[99] = "[09:01:40] Scanned : 12345678901"
+        lines[109] = "[09:01:50] [Recorder] [error] ffmpeg exited"
+        lines[149] = "[09:02:30] Scanned : 10987654321"
+        lines[199] = "[09:03:20] [Recorder] [error] unrelated"
+
+        with mock.patch.object(cs, "LOG_SESSION_SAFETY_LINES", 20):
+            log_events = _extract_log_events(iter(lines), session_barcode="12345678901")
+
+        retained = log_events["lines"]
+        self.assertEqual(len(retained), len(lines))
+        self.assertEqual(log_events["line_count"], len(lines))
+        self.assertEqual(retained[98], "")
+        self.assertEqual(retained[99:151], lines[99:151])
+        self.assertEqual(retained[250], "")
+        self.assertEqual([line_no for line_no, _ in log_events["error_lines"]], [110])
+        self.assertEqual(
+            [event["token"] for event in log_events["scan_events"]],
+            ["12345678901", "10987654321"],
+        )
+
+
+class SessionIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # 두 번째 세션은 첫 세션의 종료 후 safety 구간과 겹친다.
+        self.sessions = [
+            {"start_line_no": 10, "end_line_no": 30},
+            {"start_line_no": 25, "end_line_no": 40},
+            {"start_line_no": 60, "end_line_no": 70},
+        ]
+        self.session_index = _build_session_index(self.sessions)
+
+    def test_membership_matches_linear_scan(self) -> None:
+        for line_no in range(0, 80):
+            self.assertEqual(
+                _line_in_any_session(line_no, self.sessions, self.session_index),
+                _line_in_any_session(line_no, self.sessions),
+                line_no,
+            )
+
+    def test_find_returns_earliest_matching_session(self) -> None:
+        self.assertIs(_find_session_for_line(28, self.sessions, self.session_index), self.sessions[0])
+        self.assertIs(_find_session_for_line(35, self.sessions, self.session_index), self.sessions[1])
+        self.assertIsNone(_find_session_for_line(50, self.sessions, self.session_index))
+
+    def test_events_in_sessions_keeps_event_order(self) -> None:
+        events = [{"line_no": line_no} for line_no in (5, 10, 26, 41, 65, 71)]
+
+        matched = _events_in_sessions(events, self.sessions, self.session_index)
+
+        self.assertEqual([event["line_no"] for event in matched], [10, 26, 65])
+
+
+class ParseStructuredLogLineTests(unittest.TestCase):
+    def test_cached_parse_returns_independent_dicts(self) -> None:
+        line = "[10:00:05] [Recorder] [error] ffmpeg exited"
+
+        first = _parse_structured_log_line(line)
+        first["component"] = "mutated"
+        second = _parse_structured_log_line(line)
+
+        self.assertEqual(second["component"], "Recorder")
+        self.assertEqual(second["level"], "error")
+        self.assertEqual(second["message"], "ffmpeg exited")
+
+
+if __name__ == "__main__":
+    unittest.main()
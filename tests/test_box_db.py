@@ -0,0 +1,207 @@
+import sqlite3
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from boxer_company.routers import box_db
+
+
+class _FakeCursor:
+    def __init__(self, connection: "_FakeConnection") -> None:
+        self._connection = connection
+        self._rows: list[dict[str, object]] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: tuple[object, ...] = ()) -> None:
+        self._connection.queries.append((sql, params))
+        self._rows = self._connection.responder(sql, params)
+
+    def fetchall(self) -> list[dict[str, object]]:
+        return self._rows
+
+    def fetchone(self) -> dict[str, object] | None:
+        return self._rows[0] if self._rows else None
+
+
+class _FakeConnection:
+    def __init__(self, responder) -> None:
+        self.responder = responder
+        self.queries: list[tuple[str, tuple[object, ...]]] = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def close(self) -> None:
+        return None
+
+
+class _BoxDbTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        for name, value in (
+            ("DB_HOST", "db"),
+            ("DB_USERNAME", "user"),
+            ("DB_PASSWORD", "pw"),
+            ("DB_DATABASE", "box"),
+        ):
+            patcher = mock.patch.object(box_db.s, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _use_connection(self, responder) -> _FakeConnection:
+        connection = _FakeConnection(responder)
+        patcher = mock.patch.object(box_db, "_create_db_connection", return_value=connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return connection
+
+
+class LookupDeviceContextsByBarcodeTests(_BoxDbTestCase):
+    def test_resolves_all_device_names_in_one_query(self) -> None:
+        connection = self._use_connection(
+            lambda sql, params: [
+                {"deviceSeq": 1, "hospitalSeq": 10, "deviceName": "MB2-A"},
+                {"deviceSeq": 2, "hospitalSeq": 99, "deviceName": "MB2-B"},
+            ]
+        )
+        context = {
+            "rows": [
+                {"deviceSeq": 1, "hospitalSeq": 10, "hospitalName": "H1", "roomName": "R1"},
+                {"deviceSeq": 2, "hospitalSeq": 20, "hospitalName": "H2", "roomName": "R2"},
+                {"deviceSeq": 1, "hospitalSeq": 10, "hospitalName": "H1", "roomName": "R1"},
+                {"deviceSeq": 3, "hospitalSeq": 30, "hospitalName": "H3", "roomName": "R3"},
+            ]
+        }
+
+        items = box_db._lookup_device_contexts_by_barcode("12345678901", recordings_context=context)
+
+        self.assertEqual(len(connection.queries), 1)
+        self.assertIn("WHERE seq IN (%s, %s, %s)", connection.queries[0][0])
+        self.assertEqual(connection.queries[0][1], (1, 2, 3))
+        self.assertEqual(
+            [(item["deviceName"], item["hospitalSeq"]) for item in items],
+            [("MB2-A", 10), ("MB2-B", 20)],
+        )
+
+
+class LoadRecordingsRowsIndexByBarcodeTests(_BoxDbTestCase):
+    def test_groups_window_rows_by_local_date_and_device_in_one_query(self) -> None:
+        rows = [
+            {"seq": 3, "deviceSeq": 2, "recordedAt": datetime(2026, 3, 1, 16, 0)},
+            {"seq": 2, "deviceSeq": 1, "recordedAt": datetime(2026, 3, 1, 1, 0)},
+            {"seq": 1, "deviceSeq": 1, "recordedAt": datetime(2026, 2, 28, 14, 59)},
+        ]
+        connection = self._use_connection(lambda sql, params: rows)
+
+        with mock.patch.dict("os.environ", {"TZ": "Asia/Seoul"}):
+            index = box_db._load_recordings_rows_index_by_barcode(
+                "12345678901",
+                ["2026-03-01", "2026-03-02"],
+            )
+
+        self.assertEqual(len(connection.queries), 1)
+        self.assertEqual(
+            connection.queries[0][1],
+            ("12345678901", datetime(2026, 2, 28, 15, 0), datetime(2026, 3, 2, 15, 0)),
+        )
+        self.assertEqual(
+            [row["seq"] for row in box_db._recordings_rows_from_index(index, "2026-03-01", device_seq=1)],
+            [2],
+        )
+        self.assertEqual(
+            [row["seq"] for row in box_db._recordings_rows_from_index(index, "2026-03-02", device_seq=2)],
+            [3],
+        )
+        self.assertEqual(
+            [row["seq"] for row in box_db._recordings_rows_from_index(index, "2026-03-01")],
+            [2],
+        )
+        self.assertEqual(box_db._recordings_rows_from_index(index, "2026-03-01", device_seq=9), [])
+
+
+def _sqlite_explain_details(sql: str, params: tuple[object, ...]) -> list[str]:
+    # MySQL 대신 같은 인덱스 구성을 가진 SQLite에서 EXPLAIN QUERY PLAN으로 인덱스 사용 여부를 확인한다.
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.executescript(
+            """
+            CREATE TABLE hospitals (seq INTEGER PRIMARY KEY, hospitalName TEXT);
+            CREATE TABLE hospital_rooms (seq INTEGER PRIMARY KEY, roomName TEXT);
+            CREATE TABLE recordings (
+                seq INTEGER PRIMARY KEY, fullBarcode TEXT, barcode INTEGER, fileId TEXT,
+                hospitalSeq INTEGER, hospitalRoomSeq INTEGER, deviceSeq INTEGER, videoLength INTEGER,
+                streamingStatus TEXT, s3FileKey TEXT, recordedAt TEXT, createdAt TEXT
+            );
+            CREATE INDEX idx_recordings_full_barcode ON recordings (fullBarcode);
+            CREATE INDEX idx_recordings_barcode ON recordings (barcode);
+            CREATE TABLE ultrasound_captures (
+                seq INTEGER PRIMARY KEY, barcode INTEGER, fileId TEXT, hospitalSeq INTEGER,
+                hospitalRoomSeq INTEGER, deviceSeq INTEGER, s3Bucket TEXT, s3FileKey TEXT, capturedAt TEXT
+            );
+            CREATE INDEX idx_ultrasound_captures_barcode ON ultrasound_captures (barcode);
+            """
+        )
+        rows = connection.execute("EXPLAIN QUERY PLAN " + sql.replace("%s", "?"), params).fetchall()
+        return [str(row[-1]) for row in rows]
+    finally:
+        connection.close()
+
+
+class BarcodeFilterQueryPlanTests(_BoxDbTestCase):
+    # SQLite EXPLAIN으로 CAST 같은 인덱스 불가 조건이 다시 들어오지 않는지만 보는 스모크 테스트다.
+    # MySQL 실행 계획(index_merge 여부)을 보장하지는 않는다.
+    def _capture_filter_queries(self, query_func, count_key: str, barcode: str) -> list[tuple[str, tuple[object, ...]]]:
+        connection = self._use_connection(
+            lambda sql, params: [{count_key: 1}] if "COUNT(*)" in sql else []
+        )
+        query_func(barcode=barcode)
+        return connection.queries
+
+    def _assert_index_bound(self, queries: list[tuple[str, tuple[object, ...]]], table: str) -> None:
+        self.assertTrue(queries)
+        for sql, params in queries:
+            self.assertNotIn("CAST(", sql)
+            details = _sqlite_explain_details(sql, params)
+            scans = [detail for detail in details if detail.startswith("SCAN") and table in detail]
+            self.assertEqual(scans, [], details)
+
+    def test_recordings_barcode_filter_ors_sargable_predicates(self) -> None:
+        queries = self._capture_filter_queries(box_db._query_recordings_by_filters, "recordingCount", "12345678901")
+
+        self._assert_index_bound(queries, "recordings")
+        self.assertIn("(r.fullBarcode = %s OR r.barcode = %s)", queries[0][0])
+        self.assertNotIn("UNION", queries[0][0])
+        self.assertEqual(queries[0][1], ("12345678901", 12345678901))
+
+    def test_recordings_barcode_filter_skips_int_column_for_non_canonical_number(self) -> None:
+        queries = self._capture_filter_queries(box_db._query_recordings_by_filters, "recordingCount", "01234567890")
+
+        self._assert_index_bound(queries, "recordings")
+        self.assertNotIn(" OR ", queries[0][0])
+        self.assertEqual(queries[0][1], ("01234567890",))
+
+    def test_ultrasound_capture_barcode_filter_binds_integer(self) -> None:
+        queries = self._capture_filter_queries(
+            box_db._query_ultrasound_captures_by_filters,
+            "captureCount",
+            "12345678901",
+        )
+
+        self._assert_index_bound(queries, "ultrasound_captures")
+        self.assertEqual(queries[0][1], (12345678901,))
+
+    def test_plan_checker_flags_cast_predicate_as_full_scan(self) -> None:
+        details = _sqlite_explain_details(
+            "SELECT COUNT(*) FROM recordings r WHERE (CAST(r.fullBarcode AS CHAR) = %s OR CAST(r.barcode AS CHAR) = %s)",
+            ("12345678901", "12345678901"),
+        )
+
+        self.assertTrue(any(detail.startswith("SCAN") for detail in details), details)
+
+
+if __name__ == "__main__":
+    unittest.main()
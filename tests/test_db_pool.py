@@ -0,0 +1,162 @@
+import threading
+import unittest
+from unittest import mock
+
+import pymysql
+
+from boxer.routers.common import db
+
+
+class _FakeCursor:
+    def __init__(self, connection: "_FakeConnection") -> None:
+        self._connection = connection
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: object = None) -> None:
+        self._connection.executed.append(sql)
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.open = True
+        self.executed: list[str] = []
+        self.ping_calls = 0
+        self.ping_error: Exception | None = None
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def ping(self, reconnect: bool = True) -> None:
+        self.ping_calls += 1
+        if self.ping_error is not None:
+            raise self.ping_error
+
+    def close(self) -> None:
+        self.open = False
+
+
+class DbConnectionPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.connections: list[_FakeConnection] = []
+        self.now = [1000.0]
+
+        def _connect(**_: object) -> _FakeConnection:
+            connection = _FakeConnection()
+            self.connections.append(connection)
+            return connection
+
+        patches = [
+            mock.patch.object(db.pymysql, "connect", side_effect=_connect),
+            mock.patch.object(db.time, "monotonic", side_effect=lambda: self.now[0]),
+            mock.patch.object(db.s, "DB_POOL_MAX_SIZE", 2),
+            mock.patch.object(db.s, "DB_POOL_MAX_IDLE_SEC", 300),
+            mock.patch.object(db.s, "DB_POOL_PING_INTERVAL_SEC", 30),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        db._close_db_connection_pools()
+        self.addCleanup(db._close_db_connection_pools)
+
+    def test_reuses_connection_and_sets_read_only_once(self) -> None:
+        first = db._create_db_connection(5)
+        first.close()
+        second = db._create_db_connection(5)
+        second.close()
+
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(self.connections[0].executed, ["SET SESSION TRANSACTION READ ONLY"])
+        self.assertEqual(self.connections[0].ping_calls, 0)
+
+    def test_pings_after_interval_and_replaces_dead_connection(self) -> None:
+        db._create_db_connection(5).close()
+        self.connections[0].ping_error = pymysql.err.OperationalError(2006, "gone away")
+        self.now[0] += 31
+
+        connection = db._create_db_connection(5)
+        connection.close()
+
+        self.assertEqual(self.connections[0].ping_calls, 1)
+        self.assertFalse(self.connections[0].open)
+        self.assertEqual(len(self.connections), 2)
+
+    def test_recycles_connection_idle_longer_than_max(self) -> None:
+        db._create_db_connection(5).close()
+        self.now[0] += 301
+
+        db._create_db_connection(5).close()
+
+        self.assertEqual(self.connections[0].ping_calls, 0)
+        self.assertFalse(self.connections[0].open)
+        self.assertEqual(len(self.connections), 2)
+
+    def test_drops_closed_connection_on_release(self) -> None:
+        connection = db._create_db_connection(5)
+        self.connections[0].open = False
+        connection.close()
+
+        db._create_db_connection(5).close()
+
+        self.assertEqual(len(self.connections), 2)
+
+    def test_blocks_beyond_max_size_until_released(self) -> None:
+        first = db._create_db_connection(1)
+        second = db._create_db_connection(1)
+        acquired = threading.Event()
+
+        def _acquire_third() -> None:
+            db._create_db_connection(1).close()
+            acquired.set()
+
+        worker = threading.Thread(target=_acquire_third)
+        worker.start()
+        self.assertFalse(acquired.wait(0.1))
+        first.close()
+        worker.join(2)
+        second.close()
+
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(len(self.connections), 2)
+
+    def test_raises_when_pool_stays_exhausted(self) -> None:
+        held = [db._create_db_connection(1), db._create_db_connection(1)]
+        try:
+            with self.assertRaises(RuntimeError):
+                db._create_db_connection(1)
+        finally:
+            for connection in held:
+                connection.close()
+
+    def test_closed_proxy_rejects_further_use(self) -> None:
+        connection = db._create_db_connection(5)
+        connection.close()
+        connection.close()
+
+        with self.assertRaises(pymysql.err.InterfaceError):
+            connection.cursor()
+
+
+    def test_registers_pool_shutdown_at_exit_once(self) -> None:
+        with (
+            mock.patch.object(db, "_DB_POOLS_ATEXIT_REGISTERED", False),
+            mock.patch.object(db.atexit, "register") as register,
+        ):
+            db._create_db_connection(5).close()
+            db._create_db_connection(7).close()
+
+        register.assert_called_once_with(db._close_db_connection_pools)
+
+    def test_close_pools_closes_idle_connections(self) -> None:
+        db._create_db_connection(5).close()
+
+        db._close_db_connection_pools()
+
+        self.assertFalse(self.connections[0].open)
+
+if __name__ == "__main__":
+    unittest.main()
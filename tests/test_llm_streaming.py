@@ -0,0 +1,177 @@
+import io
+import json
+import unittest
+from itertools import accumulate
+from typing import Any
+from unittest import mock
+
+from boxer.core import llm
+from boxer.core.llm import _sanitize_ollama_output, _sanitize_ollama_stream, _stream_claude, _stream_ollama_chat
+from boxer_adapter_slack.common import _SlackStreamInterrupted, _stream_slack_reply
+
+
+class _FakeStream:
+    def __init__(self, chunks: list[str]) -> None:
+        self.text_stream = iter(chunks)
+
+    def __enter__(self) -> "_FakeStream":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+
+class _FakeMessages:
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+        self.calls: list[dict[str, Any]] = []
+
+    def stream(self, **kwargs: Any) -> _FakeStream:
+        self.calls.append(kwargs)
+        return _FakeStream(self.chunks)
+
+
+class _FakeClaudeClient:
+    def __init__(self, chunks: list[str]) -> None:
+        self.messages = _FakeMessages(chunks)
+
+
+class _FakeSlackClient:
+    def __init__(self) -> None:
+        self.posts: list[dict[str, Any]] = []
+        self.updates: list[str] = []
+        self.deletes: list[str] = []
+
+    def chat_postMessage(self, **kwargs: Any) -> dict[str, Any]:
+        self.posts.append(kwargs)
+        return {"ok": True, "ts": "200.0"}
+
+    def chat_update(self, **kwargs: Any) -> dict[str, Any]:
+        self.updates.append(kwargs["text"])
+        return {"ok": True}
+
+    def chat_delete(self, **kwargs: Any) -> dict[str, Any]:
+        self.deletes.append(kwargs["ts"])
+        return {"ok": True}
+
+
+def _mention_payload() -> dict[str, Any]:
+    return {
+        "raw_text": "",
+        "text": "",
+        "question": "질문",
+        "user_id": "U1",
+        "workspace_id": "T1",
+        "channel_id": "C1",
+        "current_ts": "100.0",
+        "thread_ts": "100.0",
+        "request_log": {},
+    }
+
+
+class LlmStreamTests(unittest.TestCase):
+    def test_claude_stream_yields_text_deltas(self) -> None:
+        client = _FakeClaudeClient(["안녕", "하세요"])
+
+        chunks = list(_stream_claude(client, "질문", system_prompt="규칙"))
+
+        self.assertEqual(chunks, ["안녕", "하세요"])
+        self.assertEqual(client.messages.calls[0]["system"], "규칙")
+
+    def test_ollama_stream_reads_ndjson_until_done(self) -> None:
+        lines = [
+            {"message": {"content": "첫 줄\n"}, "done": False},
+            {"message": {"content": "둘째 줄"}, "done": False},
+            {"message": {"content": ""}, "done": True},
+        ]
+        body = io.BytesIO("".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode("utf-8"))
+
+        with mock.patch.object(llm.request, "urlopen", return_value=body) as urlopen:
+            chunks = list(_stream_ollama_chat("질문", think=False))
+
+        self.assertEqual(chunks, ["첫 줄\n", "둘째 줄"])
+        sent = json.loads(urlopen.call_args.args[0].data.decode("utf-8"))
+        self.assertTrue(sent["stream"])
+        self.assertFalse(sent["think"])
+
+    def test_ollama_stream_raises_server_errors(self) -> None:
+        body = io.BytesIO(b'{"error":"model not found"}\n')
+
+        with mock.patch.object(llm.request, "urlopen", return_value=body):
+            with self.assertRaisesRegex(RuntimeError, "model not found"):
+                list(_stream_ollama_chat("질문"))
+
+    def test_sanitized_stream_hides_open_think_block_and_ends_with_full_sanitize(self) -> None:
+        chunks = ["<think>", "고민 중\n", "아직\n", "</think>", "Okay let me answer\n", "*에러 분석*\n", "• 핵심 원인: 캡처보드"]
+
+        snapshots = list(_sanitize_ollama_stream(chunks))
+
+        self.assertTrue(all("고민" not in snapshot for snapshot in snapshots))
+        self.assertEqual(snapshots[0], "*에러 분석*")
+        self.assertEqual(snapshots[-1], _sanitize_ollama_output("".join(chunks)))
+
+
+class SlackStreamingReplyTests(unittest.TestCase):
+    def test_updates_placeholder_at_throttled_intervals(self) -> None:
+        client = _FakeSlackClient()
+        payload = _mention_payload()
+        clock = iter([0.0, 0.3, 0.6, 1.2, 1.2, 1.5])
+
+        with mock.patch("boxer_adapter_slack.common.time.monotonic", side_effect=lambda: next(clock)):
+            final_text = _stream_slack_reply(
+                payload,
+                client,
+                accumulate(["가", "나", "다", "라", "마"]),
+                finalize=lambda text: text + "!",
+                update_interval_sec=1.0,
+            )
+
+        self.assertEqual(final_text, "가나다라마!")
+        self.assertEqual(client.posts[0]["thread_ts"], "100.0")
+        self.assertEqual(client.updates, ["<@U1> 가", "<@U1> 가나다라", "<@U1> 가나다라마!"])
+        self.assertEqual(payload["request_log"]["reply_count"], 1)
+
+    def test_sanitizes_every_intermediate_snapshot(self) -> None:
+        client = _FakeSlackClient()
+
+        _stream_slack_reply(
+            _mention_payload(),
+            client,
+            ["현재 요청 적용: 비교", "현재 요청 적용: 비교\n결론은 A야"],
+            sanitize=lambda text: "\n".join(line for line in text.splitlines() if not line.startswith("현재 요청")),
+            update_interval_sec=0,
+        )
+
+        self.assertEqual(client.updates, ["<@U1> 결론은 A야"])
+
+    def test_marks_shown_answer_as_interrupted_when_stream_fails(self) -> None:
+        client = _FakeSlackClient()
+        payload = _mention_payload()
+
+        def _broken_stream() -> Any:
+            yield "첫 문장"
+            raise TimeoutError("slow")
+
+        with self.assertRaises(_SlackStreamInterrupted):
+            _stream_slack_reply(payload, client, _broken_stream(), update_interval_sec=0)
+
+        self.assertEqual(client.updates, ["<@U1> 첫 문장", "<@U1> 첫 문장\n\n(중단됨)"])
+        self.assertEqual(client.deletes, [])
+        self.assertEqual(payload["request_log"]["status"], "error")
+
+    def test_deletes_placeholder_when_stream_fails_before_first_token(self) -> None:
+        client = _FakeSlackClient()
+
+        def _failing_stream() -> Any:
+            raise TimeoutError("slow")
+            yield ""
+
+        with self.assertRaises(TimeoutError):
+            _stream_slack_reply(_mention_payload(), client, _failing_stream())
+
+        self.assertEqual(client.deletes, ["200.0"])
+        self.assertEqual(client.updates, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,16 @@
+import logging
+import os
+import sqlite3
 import tempfile
+import threading
 import unittest
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest import mock
 
+from boxer_adapter_slack import common as slack_common
 from boxer_adapter_slack.common import _set_request_log_route
+from boxer.routers.common import request_log
 from boxer.routers.common.request_log import _list_request_log_recent, _save_request_log_record
 
 
@@ -54,5 +62,523 @@ class RequestLogHandlerTypePersistenceTests(unittest.TestCase):
             self.assertEqual(row["handlerType"], "llm_freeform")
 
 
+def _request_log_record(**overrides: object) -> dict[str, object]:
+    record: dict[str, object] = {
+        "sourcePlatform": "slack",
+        "eventType": "app_mention",
+        "routeName": "unknown",
+        "status": "received",
+        "userId": "U123",
+        "channelId": "C123",
+        "messageId": "1730000000.000100",
+        "requestText": "@Boxer 로그 분석",
+    }
+    record.update(overrides)
+    return record
+
+
+class RequestLogStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(request_log._close_request_log_stores)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "request_log.db"
+
+    def test_runs_schema_setup_once_per_process(self) -> None:
+        with mock.patch.object(
+            request_log,
+            "_migrate_legacy_request_audit_table",
+            wraps=request_log._migrate_legacy_request_audit_table,
+        ) as migrate:
+            for index in range(3):
+                _save_request_log_record(
+                    _request_log_record(messageId=f"1730000000.00010{index}"),
+                    db_path=self.db_path,
+                )
+            _list_request_log_recent(db_path=self.db_path)
+
+        self.assertEqual(migrate.call_count, 1)
+
+    def test_upsert_returns_merged_row(self) -> None:
+        first = _save_request_log_record(_request_log_record(replyCount=2), db_path=self.db_path)
+        second = _save_request_log_record(
+            _request_log_record(routeName="barcode_log", status="handled", replyCount=1, userName="kim"),
+            db_path=self.db_path,
+        )
+
+        self.assertEqual(first["rowcount"], 1)
+        self.assertEqual(second["seq"], first["seq"])
+        self.assertEqual(second["createdAtUtc"], first["createdAtUtc"])
+        self.assertEqual(second["routeName"], "barcode_log")
+        self.assertEqual(second["status"], "handled")
+        self.assertEqual(second["replyCount"], 2)
+        self.assertEqual(second["userName"], "kim")
+
+    def test_reopens_and_migrates_when_db_file_is_replaced(self) -> None:
+        _save_request_log_record(_request_log_record(), db_path=self.db_path)
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+
+        saved = _save_request_log_record(_request_log_record(), db_path=self.db_path)
+
+        self.assertTrue(os.path.exists(self.db_path))
+        self.assertEqual(saved["seq"], 1)
+        self.assertEqual(_list_request_log_recent(db_path=self.db_path)["totalCount"], 1)
+
+    def test_reuses_pooled_reader_connection_across_queries(self) -> None:
+        _save_request_log_record(_request_log_record(), db_path=self.db_path)
+
+        with mock.patch.object(request_log, "_connect_sqlite", wraps=request_log._connect_sqlite) as connect:
+            for _ in range(3):
+                request_log._summarize_request_log_overview(db_path=self.db_path)
+                _list_request_log_recent(db_path=self.db_path)
+
+        self.assertEqual(connect.call_count, 1)
+
+    def test_overview_matches_per_dimension_summaries(self) -> None:
+        records = [
+            _request_log_record(messageId="1.1", userId="U1", userName="kim", routeName="barcode_log"),
+            _request_log_record(messageId="1.2", userId="U1", userName="kim", routeName="barcode_log", status="error"),
+            _request_log_record(messageId="1.3", userId="U2", routeName="db_query", routeMode="sql"),
+            _request_log_record(messageId="1.4", userId="U3", routeName="barcode_log"),
+        ]
+        request_log._save_request_log_records(records, db_path=self.db_path)
+
+        overview = request_log._summarize_request_log_overview(db_path=self.db_path, top_limit=2)
+        by_user = request_log._summarize_request_log_by_user(db_path=self.db_path, limit=2)
+        by_route = request_log._summarize_request_log_by_route(db_path=self.db_path, limit=2)
+
+        self.assertEqual(overview["totalCount"], 4)
+        self.assertEqual(overview["errorCount"], 1)
+        self.assertEqual(overview["uniqueUserCount"], 3)
+        self.assertEqual(overview["topUsers"], by_user["rows"])
+        self.assertEqual(overview["topRoutes"], by_route["rows"])
+        self.assertEqual(overview["topUsers"][0]["userLabel"], "kim")
+        self.assertEqual(overview["topRoutes"][0]["routeName"], "barcode_log")
+
+
+class RequestLogDailyRollupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(request_log._close_request_log_stores)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "request_log.db"
+        patcher = mock.patch.object(request_log, "_request_log_today_local", return_value="2026-03-03")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _delete_raw_rows(self, request_date: str) -> None:
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("DELETE FROM request_log WHERE requestDateLocal = ?", (request_date,))
+
+    def test_closed_days_are_served_from_rollup_and_today_from_raw_rows(self) -> None:
+        request_log._save_request_log_records(
+            [
+                _request_log_record(messageId="1.1", createdAtUtc="2026-03-01T01:00:00+00:00"),
+                _request_log_record(messageId="1.2", createdAtUtc="2026-03-01T02:00:00+00:00", status="error"),
+                _request_log_record(messageId="1.3", createdAtUtc="2026-03-03T01:00:00+00:00"),
+            ],
+            db_path=self.db_path,
+        )
+        self.assertEqual(request_log._compact_request_log_daily_rollup(db_path=self.db_path), ["2026-03-01"])
+        self._delete_raw_rows("2026-03-01")
+
+        by_user = request_log._summarize_request_log_by_user(db_path=self.db_path)
+        overview = request_log._summarize_request_log_overview(db_path=self.db_path)
+
+        self.assertEqual(by_user["totalCount"], 3)
+        self.assertEqual(by_user["rows"][0]["errorCount"], 1)
+        self.assertEqual(overview["totalCount"], 3)
+        self.assertEqual(overview["firstRequestedAtLocal"], "2026-03-01T01:00:00+00:00")
+        self.assertEqual(overview["lastRequestedAtLocal"], "2026-03-03T01:00:00+00:00")
+
+    def test_late_update_to_closed_day_rebuilds_that_day(self) -> None:
+        record = _request_log_record(createdAtUtc="2026-03-01T01:00:00+00:00", routeName="unknown")
+        request_log._save_request_log_record(record, db_path=self.db_path)
+        request_log._compact_request_log_daily_rollup(db_path=self.db_path)
+
+        request_log._save_request_log_record(
+            {**record, "routeName": "barcode_log", "status": "error"},
+            db_path=self.db_path,
+        )
+        by_route = request_log._summarize_request_log_by_route(target_date="2026-03-01", db_path=self.db_path)
+
+        self.assertEqual(
+            [(row["routeName"], row["errorCount"]) for row in by_route["rows"]],
+            [("barcode_log", 1)],
+        )
+
+    def test_backfills_rollup_for_databases_created_before_it_existed(self) -> None:
+        request_log._save_request_log_record(
+            _request_log_record(createdAtUtc="2026-03-01T01:00:00+00:00"),
+            db_path=self.db_path,
+        )
+        request_log._close_request_log_stores()
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("DROP TABLE request_log_daily_rollup")
+            connection.execute("DROP TABLE request_log_daily_rollup_state")
+
+        by_user = request_log._summarize_request_log_by_user(db_path=self.db_path)
+
+        self.assertEqual(by_user["totalCount"], 1)
+
+    def test_summary_reads_compact_only_when_closed_days_are_dirty(self) -> None:
+        request_log._save_request_log_records(
+            [
+                _request_log_record(messageId="1.1", createdAtUtc="2026-03-01T01:00:00+00:00"),
+                _request_log_record(messageId="1.2", createdAtUtc="2026-03-03T01:00:00+00:00"),
+            ],
+            db_path=self.db_path,
+        )
+
+        with mock.patch.object(
+            request_log._RequestLogStore,
+            "compact_daily_rollup",
+            autospec=True,
+            side_effect=request_log._RequestLogStore.compact_daily_rollup,
+        ) as compact:
+            first = request_log._summarize_request_log_by_user(db_path=self.db_path)
+            second = request_log._summarize_request_log_by_user(db_path=self.db_path)
+
+        self.assertEqual((first["totalCount"], second["totalCount"]), (2, 2))
+        self.assertEqual(compact.call_count, 1)
+
+
+class RequestLogSearchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(request_log._close_request_log_stores)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "request_log.db"
+        request_log._save_request_log_records(
+            [
+                _request_log_record(
+                    messageId="1.1",
+                    userName="kim",
+                    createdAtUtc="2026-02-10T01:00:00+00:00",
+                    requestText="@Boxer 로그 분석 12345678901",
+                ),
+                _request_log_record(
+                    messageId="1.2",
+                    userName="lee",
+                    createdAtUtc="2026-03-02T01:00:00+00:00",
+                    requestText="@Boxer 12345678901 영상 누락 확인",
+                ),
+                _request_log_record(
+                    messageId="1.3",
+                    createdAtUtc="2026-03-02T02:00:00+00:00",
+                    requestText="@Boxer 장비 상태 알려줘",
+                ),
+            ],
+            db_path=self.db_path,
+        )
+
+    def test_matches_substrings_through_trigram_index(self) -> None:
+        result = request_log._search_request_log("2345678", db_path=self.db_path)
+
+        self.assertTrue(result["fullTextSearch"])
+        self.assertEqual(result["totalCount"], 2)
+        self.assertEqual([row["userName"] for row in result["rows"]], ["lee", "kim"])
+
+    def test_combines_terms_and_short_terms_fall_back_to_like(self) -> None:
+        result = request_log._search_request_log(
+            "12345678901 영상",
+            date_from="2026-03-01",
+            date_to="2026-03-31",
+            db_path=self.db_path,
+        )
+
+        self.assertEqual([row["userName"] for row in result["rows"]], ["lee"])
+
+    def test_index_follows_row_updates_and_deletes(self) -> None:
+        request_log._close_request_log_stores()
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("UPDATE request_log SET requestText = '@Boxer 장비 재부팅 요청' WHERE messageId = '1.3'")
+            connection.execute("DELETE FROM request_log WHERE messageId = '1.1'")
+
+        self.assertEqual(request_log._search_request_log("상태 알려", db_path=self.db_path)["totalCount"], 0)
+        self.assertEqual(request_log._search_request_log("재부팅", db_path=self.db_path)["totalCount"], 1)
+        self.assertEqual(request_log._search_request_log("로그 분석", db_path=self.db_path)["totalCount"], 0)
+
+    def test_rebuilds_index_for_databases_created_before_it_existed(self) -> None:
+        request_log._close_request_log_stores()
+        with sqlite3.connect(self.db_path) as connection:
+            for suffix in ("after_insert", "after_delete", "after_update"):
+                connection.execute(f"DROP TRIGGER request_log_fts_{suffix}")
+            connection.execute("DROP TABLE request_log_fts")
+
+        result = request_log._search_request_log("영상 누락", db_path=self.db_path)
+
+        self.assertEqual(result["totalCount"], 1)
+
+
+class RequestLogArchiveTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(request_log._close_request_log_stores)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "request_log.db"
+        for name, value in {
+            "REQUEST_LOG_ARCHIVE_DIR": "",
+            "REQUEST_LOG_SQLITE_S3_BACKUP_ENABLED": False,
+        }.items():
+            patcher = mock.patch.object(request_log.s, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(request_log, "_request_log_today_local", return_value="2026-03-03")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        request_log._save_request_log_records(
+            [
+                _request_log_record(
+                    messageId="1.1",
+                    userName="kim",
+                    createdAtUtc="2026-01-10T01:00:00+00:00",
+                    requestText="@Boxer 12345678901 영상 누락 확인",
+                ),
+                _request_log_record(messageId="1.2", userName="lee", createdAtUtc="2026-02-10T01:00:00+00:00"),
+                _request_log_record(messageId="1.3", userName="kim", createdAtUtc="2026-03-02T01:00:00+00:00"),
+            ],
+            db_path=self.db_path,
+        )
+
+    def _archive(self) -> dict[str, object]:
+        return request_log._archive_request_log_cold_months(db_path=self.db_path, hot_months=1)
+
+    def test_moves_closed_months_out_of_hot_file(self) -> None:
+        result = self._archive()
+
+        self.assertEqual(result["cutoffDate"], "2026-03-01")
+        self.assertEqual([item["month"] for item in result["archived"]], ["2026-01", "2026-02"])
+        with sqlite3.connect(self.db_path) as connection:
+            self.assertEqual(connection.execute("SELECT messageId FROM request_log").fetchall(), [("1.3",)])
+        archive_path = self.db_path.with_name("request_log-archive") / "request_log-2026-01.db"
+        with sqlite3.connect(archive_path) as connection:
+            self.assertEqual(connection.execute("SELECT messageId FROM request_log").fetchall(), [("1.1",)])
+
+    def test_queries_read_only_the_partitions_in_the_date_range(self) -> None:
+        self._archive()
+
+        with mock.patch.object(request_log, "_connect_sqlite", wraps=request_log._connect_sqlite) as connect:
+            hot_only = _list_request_log_recent(target_date="2026-03-02", db_path=self.db_path)
+            self.assertEqual(connect.call_count, 0)
+            january = _list_request_log_recent(target_date="2026-01-10", db_path=self.db_path)
+            # COUNT와 목록이 같은 아카이브 커넥션을 쓴다.
+            self.assertEqual(connect.call_count, 1)
+            _list_request_log_recent(db_path=self.db_path)
+            self.assertEqual(connect.call_count, 3)
+
+        self.assertEqual(hot_only["totalCount"], 1)
+        self.assertEqual([row["userName"] for row in january["rows"]], ["kim"])
+        everything = _list_request_log_recent(db_path=self.db_path)
+        self.assertEqual(everything["totalCount"], 3)
+        self.assertEqual([row["userName"] for row in everything["rows"]], ["kim", "lee", "kim"])
+        self.assertEqual(request_log._search_request_log("2345678", db_path=self.db_path)["totalCount"], 1)
+
+    def test_compaction_resolves_archive_files_outside_the_writer_lock(self) -> None:
+        self._archive()
+        request_log._save_request_log_record(
+            _request_log_record(messageId="1.2", userName="lee", createdAtUtc="2026-02-10T01:00:00+00:00"),
+            db_path=self.db_path,
+        )
+        store = request_log._get_request_log_store(self.db_path)
+        lock_held: list[bool] = []
+
+        def _ensure(*args: object) -> object:
+            lock_held.append(store._lock.locked())
+            return original_ensure(*args)
+
+        original_ensure = request_log._ensure_request_log_archive_file
+        with mock.patch.object(request_log, "_ensure_request_log_archive_file", side_effect=_ensure):
+            self.assertEqual(request_log._compact_request_log_daily_rollup(db_path=self.db_path), ["2026-02-10"])
+
+        self.assertEqual(lock_held, [False])
+
+    def test_backup_job_compacts_once_when_archiving(self) -> None:
+        with (
+            mock.patch.object(request_log.s, "REQUEST_LOG_SQLITE_S3_BACKUP_ENABLED", True),
+            mock.patch.object(request_log.s, "REQUEST_LOG_HOT_MONTHS", 1),
+            mock.patch.object(request_log.s, "REQUEST_LOG_SQLITE_S3_RETENTION_COUNT", 0),
+            mock.patch.object(request_log, "_backup_request_log_to_s3", return_value={}),
+            mock.patch.object(
+                request_log._RequestLogStore,
+                "compact_daily_rollup",
+                autospec=True,
+                side_effect=request_log._RequestLogStore.compact_daily_rollup,
+            ) as compact,
+        ):
+            result = request_log._run_request_log_backup_job(db_path=self.db_path)
+
+        self.assertEqual(compact.call_count, 1)
+        self.assertEqual(result["compactedDates"], ["2026-01-10", "2026-02-10", "2026-03-02"])
+
+    def test_late_updates_to_archived_month_are_folded_back_on_compaction(self) -> None:
+        self._archive()
+        request_log._save_request_log_record(
+            _request_log_record(
+                messageId="1.2",
+                userName="lee",
+                createdAtUtc="2026-02-10T01:00:00+00:00",
+                routeName="barcode_log",
+                status="error",
+            ),
+            db_path=self.db_path,
+        )
+
+        by_route = request_log._summarize_request_log_by_route(target_date="2026-02-10", db_path=self.db_path)
+        self.assertEqual([(row["routeName"], row["requestCount"]) for row in by_route["rows"]], [("barcode_log", 1)])
+        self.assertEqual(request_log._summarize_request_log_by_user(db_path=self.db_path)["totalCount"], 3)
+
+        with sqlite3.connect(self.db_path) as connection:
+            self.assertEqual(
+                connection.execute("SELECT COUNT(*) FROM request_log WHERE requestDateLocal < '2026-03-01'").fetchone(),
+                (0,),
+            )
+        february = _list_request_log_recent(target_date="2026-02-10", db_path=self.db_path)
+        self.assertEqual(february["totalCount"], 1)
+        self.assertEqual(february["rows"][0]["routeName"], "barcode_log")
+
+
+class _RecordingSlackClient:
+    def __init__(self) -> None:
+        self.calling_threads: list[str] = []
+
+    def chat_getPermalink(self, *, channel: str, message_ts: str) -> dict[str, str]:
+        self.calling_threads.append(threading.current_thread().name)
+        return {"permalink": f"https://slack.example/{channel}/{message_ts}"}
+
+    def users_info(self, *, user: str) -> dict[str, object]:
+        self.calling_threads.append(threading.current_thread().name)
+        return {"user": {"profile": {"display_name": f"name-{user}"}}}
+
+
+def _mention_payload(message_ts: str) -> dict[str, object]:
+    return {
+        "raw_text": "<@B1> 로그 분석 12345678901",
+        "text": "<@b1> 로그 분석 12345678901",
+        "question": "로그 분석 12345678901",
+        "user_id": "U123",
+        "workspace_id": "T123",
+        "channel_id": "C123",
+        "current_ts": message_ts,
+        "thread_ts": message_ts,
+        "request_log": {"route_name": "barcode_log", "handler_type": "router", "status": "handled"},
+    }
+
+
+class RequestLogIngestQueueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "request_log.db"
+        for name, value in (
+            ("REQUEST_LOG_SQLITE_ENABLED", True),
+            ("REQUEST_LOG_SQLITE_PATH", str(self.db_path)),
+            ("REQUEST_LOG_ASYNC_ENABLED", True),
+            ("REQUEST_LOG_BATCH_MAX_RECORDS", 3),
+            ("REQUEST_LOG_BATCH_MAX_WAIT_MS", 5000),
+        ):
+            patcher = mock.patch.object(slack_common.s, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        slack_common._SLACK_USER_NAME_CACHE.clear()
+        self.addCleanup(slack_common._SLACK_USER_NAME_CACHE.clear)
+        self.addCleanup(request_log._close_request_log_stores)
+        self.addCleanup(slack_common._shutdown_request_log_ingest_queue)
+        self.logger = logging.getLogger("test.request_log_queue")
+
+    def test_resolves_slack_lookups_and_saves_off_the_handler_thread(self) -> None:
+        client = _RecordingSlackClient()
+
+        slack_common._persist_request_log(
+            _mention_payload("1730000000.000100"),
+            event_type="app_mention",
+            client=client,
+            logger=self.logger,
+        )
+        self.assertTrue(slack_common._get_request_log_ingest_queue().flush())
+
+        rows = _list_request_log_recent(db_path=self.db_path)["rows"]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["userName"], "name-U123")
+        self.assertEqual(rows[0]["permalink"], "https://slack.example/C123/1730000000.000100")
+        self.assertEqual(set(client.calling_threads), {"request-log-writer"})
+
+    def test_batches_records_into_one_transaction_per_batch_size(self) -> None:
+        client = _RecordingSlackClient()
+
+        with mock.patch.object(
+            slack_common,
+            "_save_request_log_records",
+            wraps=slack_common._save_request_log_records,
+        ) as save_records:
+            for index in range(3):
+                slack_common._persist_request_log(
+                    _mention_payload(f"1730000000.00010{index}"),
+                    event_type="app_mention",
+                    client=client,
+                    logger=self.logger,
+                )
+            self.assertTrue(slack_common._get_request_log_ingest_queue().flush())
+
+        self.assertEqual([len(call.args[0]) for call in save_records.call_args_list], [3])
+        self.assertEqual(_list_request_log_recent(db_path=self.db_path)["totalCount"], 3)
+
+    def test_shutdown_flushes_pending_records(self) -> None:
+        client = _RecordingSlackClient()
+        for index in range(2):
+            slack_common._persist_request_log(
+                _mention_payload(f"1730000000.00020{index}"),
+                event_type="app_mention",
+                client=client,
+                logger=self.logger,
+            )
+
+        slack_common._shutdown_request_log_ingest_queue()
+
+        self.assertEqual(_list_request_log_recent(db_path=self.db_path)["totalCount"], 2)
+
+    def test_drops_event_instead_of_writing_ahead_when_queue_stays_full(self) -> None:
+        client = _RecordingSlackClient()
+
+        with mock.patch.object(slack_common._RequestLogIngestQueue, "submit", return_value=False):
+            slack_common._persist_request_log(
+                _mention_payload("1730000000.000300"),
+                event_type="app_mention",
+                client=client,
+                logger=self.logger,
+            )
+
+        self.assertEqual(_list_request_log_recent(db_path=self.db_path)["totalCount"], 0)
+        self.assertEqual(client.calling_threads, [])
+
+    def test_submit_waits_briefly_for_room_in_full_queue(self) -> None:
+        ingest_queue = slack_common._RequestLogIngestQueue(
+            max_size=1,
+            put_timeout_sec=0.01,
+            batch_max_records=1,
+            batch_max_wait_sec=0,
+        )
+        ingest_queue._ensure_started = lambda: None  # writer 없이 큐만 채운다.
+        snapshot = slack_common._snapshot_request_log_event(
+            _mention_payload("1730000000.000400"), event_type="app_mention"
+        )
+
+        self.assertTrue(ingest_queue.submit(snapshot, client=None, logger=self.logger))
+        self.assertFalse(ingest_queue.submit(snapshot, client=None, logger=self.logger))
+
+    def test_created_at_is_stamped_when_event_is_enqueued(self) -> None:
+        snapshot = slack_common._snapshot_request_log_event(
+            _mention_payload("1730000000.000500"), event_type="app_mention"
+        )
+        snapshot["created_at_utc"] = datetime(2026, 3, 1, 0, 0, 5, tzinfo=timezone.utc)
+
+        ingest_queue = slack_common._get_request_log_ingest_queue()
+        self.assertTrue(ingest_queue.submit(snapshot, client=_RecordingSlackClient(), logger=self.logger))
+        self.assertTrue(slack_common._get_request_log_ingest_queue().flush())
+
+        rows = _list_request_log_recent(db_path=self.db_path)["rows"]
+        self.assertEqual(rows[0]["createdAtUtc"], "2026-03-01T00:00:05+00:00")
+
 if __name__ == "__main__":
     unittest.main()
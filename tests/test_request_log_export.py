@@ -0,0 +1,127 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from boxer.routers.common import request_log, request_log_export
+
+
+def _request_log_record(**overrides: object) -> dict[str, object]:
+    record: dict[str, object] = {
+        "sourcePlatform": "slack",
+        "eventType": "app_mention",
+        "routeName": "unknown",
+        "status": "received",
+        "userId": "U123",
+        "channelId": "C123",
+        "messageId": "1730000000.000100",
+        "requestText": "@Boxer 로그 분석",
+    }
+    record.update(overrides)
+    return record
+
+
+class RequestLogExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(request_log._close_request_log_stores)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "request_log.db"
+        self.export_dir = Path(tmpdir.name) / "export"
+        patcher = mock.patch.object(request_log.s, "REQUEST_LOG_ARCHIVE_DIR", "")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        request_log._save_request_log_records(
+            [
+                _request_log_record(messageId="1.1", createdAtUtc="2026-01-10T01:00:00+00:00"),
+                _request_log_record(messageId="1.2", createdAtUtc="2026-03-02T01:00:00+00:00"),
+                _request_log_record(messageId="1.3", createdAtUtc="2026-03-02T02:00:00+00:00"),
+            ],
+            db_path=self.db_path,
+        )
+
+    def test_batches_follow_seq_across_archived_months(self) -> None:
+        request_log._archive_request_log_cold_months(
+            db_path=self.db_path,
+            hot_months=1,
+            today_local="2026-03-03",
+        )
+
+        batches = list(
+            request_log_export._iter_request_log_export_batches(
+                after_seq=0,
+                batch_rows=2,
+                db_path=self.db_path,
+            )
+        )
+        resumed = list(
+            request_log_export._iter_request_log_export_batches(
+                after_seq=2,
+                batch_rows=2,
+                db_path=self.db_path,
+            )
+        )
+
+        self.assertEqual([[row["messageId"] for row in batch] for batch in batches], [["1.1", "1.2"], ["1.3"]])
+        self.assertEqual([[row["seq"] for row in batch] for batch in resumed], [[3]])
+
+    def test_each_archive_is_queried_once_per_run(self) -> None:
+        request_log._archive_request_log_cold_months(
+            db_path=self.db_path,
+            hot_months=1,
+            today_local="2026-03-03",
+        )
+
+        with mock.patch.object(
+            request_log,
+            "_connect_request_log_archive",
+            wraps=request_log._connect_request_log_archive,
+        ) as connect_archive:
+            batches = list(
+                request_log_export._iter_request_log_export_batches(
+                    after_seq=0,
+                    batch_rows=1,
+                    db_path=self.db_path,
+                )
+            )
+
+        self.assertEqual([[row["seq"] for row in batch] for batch in batches], [[1], [2], [3]])
+        self.assertEqual(connect_archive.call_count, 1)
+
+    def test_requires_pyarrow(self) -> None:
+        with mock.patch.object(request_log_export, "pq", None):
+            with self.assertRaises(RuntimeError):
+                request_log_export._export_request_log_to_parquet(
+                    db_path=self.db_path,
+                    export_dir=self.export_dir,
+                )
+
+    @unittest.skipIf(request_log_export.pq is None, "pyarrow가 없으면 Parquet export를 건너뛴다")
+    def test_exports_new_rows_into_date_partitions(self) -> None:
+        first = request_log_export._export_request_log_to_parquet(
+            db_path=self.db_path,
+            export_dir=self.export_dir,
+            batch_rows=2,
+        )
+        request_log._save_request_log_record(
+            _request_log_record(messageId="1.4", createdAtUtc="2026-03-03T01:00:00+00:00"),
+            db_path=self.db_path,
+        )
+        second = request_log_export._export_request_log_to_parquet(
+            db_path=self.db_path,
+            export_dir=self.export_dir,
+        )
+
+        self.assertEqual((first["rowCount"], first["lastSeq"]), (3, 3))
+        self.assertEqual(len(first["files"]), 2)
+        self.assertEqual((second["afterSeq"], second["rowCount"]), (3, 1))
+        table = request_log_export.pq.read_table(self.export_dir, partitioning="hive").sort_by("seq")
+        self.assertEqual(table.column("messageId").to_pylist(), ["1.1", "1.2", "1.3", "1.4"])
+        self.assertEqual(
+            [str(value) for value in table.column("requestDateLocal").to_pylist()],
+            ["2026-01-10", "2026-03-02", "2026-03-02", "2026-03-03"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
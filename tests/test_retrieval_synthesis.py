@@ -0,0 +1,148 @@
+import json
+import unittest
+
+from boxer.core.retrieval_synthesis import _MaskingEngine, _mask_evidence_payload, _pack_evidence_payload
+from boxer_company.retrieval_rules import _transform_company_retrieval_payload
+
+
+def _barcode_log_payload(record_count: int) -> dict[str, object]:
+    return {
+        "route": "barcode_log_error_summary",
+        "request": {"barcode": "12345678901"},
+        "summary": {"errorCount": 300, "sessionCount": record_count},
+        "records": [
+            {
+                "sessionId": index,
+                "errorGroups": [
+                    {"component": "recorder", "signature": f"sig-{group}", "count": group, "sampleMessage": "x" * 200}
+                    for group in range(10)
+                ],
+                "restartEvents": [{"time": "10:00:00", "label": "restart", "rawLine": "r" * 300}],
+            }
+            for index in range(record_count)
+        ],
+    }
+
+
+class EvidencePackerTests(unittest.TestCase):
+    def test_small_payload_is_serialized_unchanged(self) -> None:
+        payload = _barcode_log_payload(1)
+
+        packed = _pack_evidence_payload(payload, 100000)
+
+        self.assertEqual(packed, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+    def test_large_payload_stays_valid_json_within_budget(self) -> None:
+        packed = _pack_evidence_payload(_barcode_log_payload(20), 7000)
+        evidence = json.loads(packed)
+
+        self.assertLessEqual(len(packed), 7000)
+        self.assertTrue(evidence["_truncated"])
+        self.assertEqual(evidence["summary"]["errorCount"], 300)
+        self.assertGreater(len(evidence["records"]), 1)
+        self.assertNotIn("sampleMessage", packed)
+        self.assertNotIn("rawLine", packed)
+
+    def test_low_priority_keys_only_use_leftover_budget(self) -> None:
+        payload = _barcode_log_payload(20)
+        without_samples = json.dumps(
+            {
+                **payload,
+                "records": [
+                    {
+                        "sessionId": record["sessionId"],
+                        "errorGroups": [
+                            {key: value for key, value in group.items() if key != "sampleMessage"}
+                            for group in record["errorGroups"]
+                        ],
+                        "restartEvents": [{"time": "10:00:00", "label": "restart"}],
+                    }
+                    for record in payload["records"]
+                ],
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+        evidence = json.loads(_pack_evidence_payload(payload, len(without_samples) + 1000))
+
+        self.assertEqual(len(evidence["records"]), 20)
+        self.assertIn("sampleMessage", evidence["records"][0]["errorGroups"][0])
+        self.assertTrue(evidence["_truncated"])
+
+    def test_document_preview_lines_outrank_raw_samples(self) -> None:
+        payload = {
+            "route": "notion_playbook_qa",
+            "references": [
+                {
+                    "title": f"문서 {index}",
+                    "previewLines": [f"{index}번 문서 본문 {line}" for line in range(5)],
+                    "errorLines": [f"E{index}"],
+                    "sampleTime": "10:00:00",
+                    "rawLine": "r" * 400,
+                }
+                for index in range(5)
+            ],
+        }
+
+        evidence = json.loads(_pack_evidence_payload(payload, 1200))
+
+        self.assertTrue(evidence["_truncated"])
+        self.assertEqual(len(evidence["references"]), 5)
+        for index, reference in enumerate(evidence["references"]):
+            self.assertEqual(reference["previewLines"], payload["references"][index]["previewLines"])
+            self.assertEqual(reference["errorLines"], [f"E{index}"])
+            self.assertEqual(reference["sampleTime"], "10:00:00")
+        self.assertNotIn("rawLine", evidence["references"][-1])
+
+    def test_long_strings_are_cut_to_fit(self) -> None:
+        packed = _pack_evidence_payload({"answer": "가" * 5000}, 600)
+
+        self.assertLessEqual(len(packed), 600)
+        self.assertTrue(json.loads(packed)["answer"].endswith("...(truncated)"))
+
+
+class MaskingEngineTests(unittest.TestCase):
+    def test_masks_keys_and_text_in_one_pass(self) -> None:
+        masked = _mask_evidence_payload(
+            {
+                "userPhone": "010-1234-5678",
+                "contactEmail": "someone@example.com",
+                "userName": "홍길동",
+                "records": [{"note": "문의 01012345678 / a.b@example.co.kr", "motherName": "김영희"}],
+            }
+        )
+
+        self.assertEqual(masked["userPhone"], "010****5678")
+        self.assertEqual(masked["contactEmail"], "***@***")
+        self.assertEqual(masked["userName"], "홍*동")
+        self.assertEqual(masked["records"][0]["note"], "문의 010****5678 / ***@***")
+        self.assertEqual(masked["records"][0]["motherName"], "김*희")
+
+    def test_required_rules_apply_when_masking_is_disabled(self) -> None:
+        payload = {
+            "route": "barcode_log_error_summary",
+            "request": {"babyName": "김아기", "phone": "010-1234-5678"},
+            "records": [{"deviceName": "MB2-C00001", "restartEvents": [], "errorGroups": []}],
+        }
+
+        evidence = _transform_company_retrieval_payload(_mask_evidence_payload(payload, enabled=False))
+
+        self.assertEqual(evidence["request"], {"babyName": "김*기", "phone": "010-1234-5678"})
+        self.assertEqual(evidence["records"][0]["deviceName"], "MB2-C00001")
+
+    def test_registered_rules_extend_the_fused_pattern_and_key_cache(self) -> None:
+        engine = _MaskingEngine(key_cache_size=2)
+        engine.register_key_rule(("serial",), lambda text: "SERIAL")
+        engine.register_text_rule("barcode", r"\b\d{11}\b", lambda text: "#" * len(text))
+        engine.register_text_rule("device", r"MB2-C\d{5}", lambda text: "MB2-*")
+
+        masked = engine.mask({"serialNo": "A-1", "log": "12345678901 on MB2-C00001", "count": 3})
+
+        self.assertEqual(masked, {"serialNo": "SERIAL", "log": "########### on MB2-*", "count": 3})
+        self.assertLessEqual(len(engine._key_cache), 2)
+        self.assertIs(engine.mask({"log": "x"}, enabled=False)["log"], "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+import gc
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+import warnings
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+
+from boxer_company.routers import s3_domain
+
+
+class _FakeS3Client:
+    def __init__(
+        self,
+        objects: dict[str, bytes],
+        *,
+        delays: dict[str, float] | None = None,
+        with_etag: bool = False,
+    ) -> None:
+        self._objects = objects
+        self._delays = delays or {}
+        self._with_etag = with_etag
+        self._lock = threading.Lock()
+        self.get_calls: list[str] = []
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, object]:
+        if Key not in self._objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        response: dict[str, object] = {"ContentLength": len(self._objects[Key])}
+        if self._with_etag:
+            response["ETag"] = f'"{hashlib.md5(self._objects[Key]).hexdigest()}"'
+        return response
+
+    def get_object(self, *, Bucket: str, Key: str, **_: object) -> dict[str, object]:
+        time.sleep(self._delays.get(Key, 0.0))
+        with self._lock:
+            self.get_calls.append(Key)
+        body = self._objects[Key]
+        return {"Body": StreamingBody(io.BytesIO(body), len(body))}
+
+
+class IterS3DeviceLogLinesTests(unittest.TestCase):
+    def test_keeps_target_order_when_later_objects_finish_first(self) -> None:
+        client = _FakeS3Client(
+            {
+                "dev-a/log-2026-03-01.log": b"a1\na2\n",
+                "dev-b/log-2026-03-01.log": b"b1\n",
+                "dev-a/log-2026-03-02.log": b"a3\n",
+            },
+            delays={"dev-a/log-2026-03-01.log": 0.05},
+        )
+        targets = [
+            ("dev-a", "2026-03-01"),
+            ("dev-b", "2026-03-01"),
+            ("dev-c", "2026-03-01"),
+            ("dev-a", "2026-03-02"),
+        ]
+
+        with mock.patch.object(s3_domain.cs, "LOG_FETCH_MAX_WORKERS", 4):
+            results = list(s3_domain._iter_s3_device_log_lines(client, targets, tail_only=False))
+
+        self.assertEqual(
+            [item["key"] for item in results],
+            [f"{device}/log-{date}.log" for device, date in targets],
+        )
+        self.assertEqual(results[0]["lines"], ["a1", "a2"])
+        self.assertFalse(results[2]["found"])
+
+    def test_raises_runtime_error_when_object_fetch_times_out(self) -> None:
+        client = _FakeS3Client(
+            {"dev-a/log-2026-03-01.log": b"a1\n", "dev-b/log-2026-03-01.log": b"b1\n"},
+            delays={"dev-a/log-2026-03-01.log": 1.5},
+        )
+
+        with (
+            mock.patch.object(s3_domain.cs, "LOG_FETCH_MAX_WORKERS", 2),
+            mock.patch.object(s3_domain.cs, "LOG_FETCH_OBJECT_TIMEOUT_SEC", 1),
+        ):
+            with self.assertRaises(RuntimeError) as ctx:
+                list(
+                    s3_domain._iter_s3_device_log_lines(
+                        client,
+                        [("dev-a", "2026-03-01"), ("dev-b", "2026-03-01")],
+                        tail_only=False,
+                    )
+                )
+
+        self.assertIn("S3", str(ctx.exception))
+
+    def test_queued_object_deadline_starts_when_worker_picks_it_up(self) -> None:
+        # dev-c는 dev-a, dev-b 뒤에서 0.7초 기다리지만 조회 자체는 0.5초라 1초 제한 안에 끝난다.
+        client = _FakeS3Client(
+            {
+                "dev-a/log-2026-03-01.log": b"a1\n",
+                "dev-b/log-2026-03-01.log": b"b1\n",
+                "dev-c/log-2026-03-01.log": b"c1\n",
+            },
+            delays={
+                "dev-a/log-2026-03-01.log": 0.7,
+                "dev-b/log-2026-03-01.log": 0.7,
+                "dev-c/log-2026-03-01.log": 0.5,
+            },
+        )
+
+        with (
+            mock.patch.object(s3_domain.cs, "LOG_FETCH_MAX_WORKERS", 2),
+            mock.patch.object(s3_domain.cs, "LOG_FETCH_OBJECT_TIMEOUT_SEC", 1),
+        ):
+            results = list(
+                s3_domain._iter_s3_device_log_lines(
+                    client,
+                    [("dev-a", "2026-03-01"), ("dev-b", "2026-03-01"), ("dev-c", "2026-03-01")],
+                    tail_only=False,
+                )
+            )
+
+        self.assertEqual([item["lines"] for item in results], [["a1"], ["b1"], ["c1"]])
+
+
+class S3DeviceLogCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        for name, value in (
+            ("S3_LOG_CACHE_ENABLED", True),
+            ("S3_LOG_CACHE_DIR", self._tmpdir.name),
+            ("S3_LOG_CACHE_MAX_BYTES", 1024 * 1024),
+        ):
+            patcher = mock.patch.object(s3_domain.cs, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_serves_past_day_log_from_disk_without_second_get(self) -> None:
+        client = _FakeS3Client({"dev-a/log-2026-03-01.log": b"l1\nl2\n"}, with_etag=True)
+
+        first = s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+        second = s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+
+        self.assertEqual(first["lines"], ["l1", "l2"])
+        self.assertEqual(second["lines"], ["l1", "l2"])
+        self.assertEqual(client.get_calls, ["dev-a/log-2026-03-01.log"])
+
+    def test_changed_etag_misses_cache(self) -> None:
+        objects = {"dev-a/log-2026-03-01.log": b"old\n"}
+        client = _FakeS3Client(objects, with_etag=True)
+        s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+
+        objects["dev-a/log-2026-03-01.log"] = b"new\n"
+        result = s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+
+        self.assertEqual(result["lines"], ["new"])
+        self.assertEqual(len(client.get_calls), 2)
+
+    def test_does_not_cache_current_day_log(self) -> None:
+        client = _FakeS3Client({"dev-a/log-2026-03-01.log": b"l1\n"}, with_etag=True)
+
+        with mock.patch.object(s3_domain, "_is_past_log_date", return_value=False):
+            s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+            s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+
+        self.assertEqual(len(client.get_calls), 2)
+        self.assertEqual(os.listdir(self._tmpdir.name), [])
+
+    def test_evicts_least_recently_used_entries_over_size_limit(self) -> None:
+        client = _FakeS3Client(
+            {
+                "dev-a/log-2026-03-01.log": b"a" * 600,
+                "dev-b/log-2026-03-01.log": b"b" * 600,
+            },
+            with_etag=True,
+        )
+
+        with mock.patch.object(s3_domain.cs, "S3_LOG_CACHE_MAX_BYTES", 1000):
+            s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+            time.sleep(0.01)
+            s3_domain._fetch_s3_device_log_lines(client, "dev-b", "2026-03-01", tail_only=False)
+            s3_domain._fetch_s3_device_log_lines(client, "dev-b", "2026-03-01", tail_only=False)
+            s3_domain._fetch_s3_device_log_lines(client, "dev-a", "2026-03-01", tail_only=False)
+
+        self.assertEqual(
+            client.get_calls,
+            ["dev-a/log-2026-03-01.log", "dev-b/log-2026-03-01.log", "dev-a/log-2026-03-01.log"],
+        )
+
+
+class StreamS3DeviceLogLinesTests(unittest.TestCase):
+    def test_decoded_lines_match_whole_body_splitlines_across_chunk_boundaries(self) -> None:
+        body = "첫 줄\r\n둘째\r셋째\n\n넷째\x0b다섯\u2028끝".encode("utf-8") + b"\xff\xfe tail\r"
+        expected = body.decode("utf-8", errors="replace").splitlines()
+
+        for chunk_size in range(1, 8):
+            chunks = [body[offset : offset + chunk_size] for offset in range(0, len(body), chunk_size)]
+            self.assertEqual(list(s3_domain._iter_decoded_log_lines(chunks)), expected, chunk_size)
+
+    def test_streamed_past_day_log_is_cached_after_full_read(self) -> None:
+        client = _FakeS3Client({"dev-a/log-2026-03-01.log": b"l1\nl2\n"}, with_etag=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(s3_domain.cs, "S3_LOG_CACHE_DIR", tmpdir):
+            first = s3_domain._stream_s3_device_log_lines(client, "dev-a", "2026-03-01")
+            self.assertEqual(list(first["lines"]), ["l1", "l2"])
+            second = s3_domain._stream_s3_device_log_lines(client, "dev-a", "2026-03-01")
+            self.assertEqual(list(second["lines"]), ["l1", "l2"])
+
+        self.assertEqual(client.get_calls, ["dev-a/log-2026-03-01.log"])
+
+    def test_buffer_chunks_until_found_detects_needle_across_chunk_boundaries(self) -> None:
+        body = b"aaa 12345678901 bbb"
+        for chunk_size in range(1, 6):
+            chunks = [body[offset : offset + chunk_size] for offset in range(0, len(body), chunk_size)]
+            buffered = s3_domain._buffer_chunks_until_found(iter(chunks), b"12345678901")
+            self.assertIsNotNone(buffered, chunk_size)
+            self.assertEqual(b"".join(buffered), body, chunk_size)
+            self.assertIsNone(s3_domain._buffer_chunks_until_found(iter(chunks), b"99999999999"), chunk_size)
+
+    def test_buffer_chunks_until_found_round_trips_chunks_past_spool_limit(self) -> None:
+        chunks = [b"x" * 64 + b"\n" for _ in range(10)] + [b"Scanned : 12345678901\n", b"tail\n"]
+
+        with mock.patch.object(s3_domain, "_S3_LOG_PREFILTER_SPOOL_BYTES", 128):
+            buffered = s3_domain._buffer_chunks_until_found(iter(chunks), b"12345678901")
+            self.assertEqual(b"".join(buffered), b"".join(chunks))
+            self.assertIsNone(s3_domain._buffer_chunks_until_found(iter(chunks), b"99999999999"))
+
+    def test_cache_hit_rejected_by_prefilter_leaves_no_open_file(self) -> None:
+        client = _FakeS3Client({"dev-a/log-2026-03-01.log": b"Scanned : 11111111111\n"}, with_etag=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(s3_domain.cs, "S3_LOG_CACHE_DIR", tmpdir):
+            list(s3_domain._stream_s3_device_log_lines(client, "dev-a", "2026-03-01")["lines"])
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                result = s3_domain._stream_s3_device_log_lines(
+                    client, "dev-a", "2026-03-01", required_text="22222222222"
+                )
+                del result
+                gc.collect()
+
+        self.assertEqual(client.get_calls, ["dev-a/log-2026-03-01.log"])
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+    def test_required_text_skips_decoding_when_absent_and_still_fills_cache(self) -> None:
+        client = _FakeS3Client({"dev-a/log-2026-03-01.log": b"Scanned : 11111111111\nl2\n"}, with_etag=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(s3_domain.cs, "S3_LOG_CACHE_DIR", tmpdir):
+            missing = s3_domain._stream_s3_device_log_lines(
+                client, "dev-a", "2026-03-01", required_text="22222222222"
+            )
+            self.assertTrue(missing["found"])
+            self.assertFalse(missing["matched"])
+            self.assertEqual(list(missing["lines"]), [])
+
+            cached_missing = s3_domain._stream_s3_device_log_lines(
+                client, "dev-a", "2026-03-01", required_text="22222222222"
+            )
+            self.assertFalse(cached_missing["matched"])
+            cached_hit = s3_domain._stream_s3_device_log_lines(
+                client, "dev-a", "2026-03-01", required_text="11111111111"
+            )
+            self.assertTrue(cached_hit["matched"])
+            self.assertEqual(list(cached_hit["lines"]), ["Scanned : 11111111111", "l2"])
+
+        self.assertEqual(client.get_calls, ["dev-a/log-2026-03-01.log"])
+
+
+if __name__ == "__main__":
+    unittest.main()
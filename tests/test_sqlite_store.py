@@ -0,0 +1,472 @@
+import gzip
+import io
+import json
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from boxer.routers.common import request_log
+from boxer.routers.common import sqlite_store
+from boxer.routers.common.request_log import _list_request_log_recent, _save_request_log_records
+
+
+class _FakeS3Client:
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.part_sizes: list[int] = []
+        self.list_call_count = 0
+
+    def upload_file(self, filename: str, bucket: str, key: str, ExtraArgs=None) -> None:
+        self.objects[key] = Path(filename).read_bytes()
+
+    def download_file(self, bucket: str, key: str, filename: str) -> None:
+        Path(filename).write_bytes(self.objects[key])
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **kwargs) -> dict[str, str]:
+        self.objects[Key] = bytes(Body)
+        return {"ETag": "etag"}
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, object]:
+        if Key not in self.objects:
+            raise KeyError(Key)
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, object]:
+        if Key not in self.objects:
+            raise KeyError(Key)
+        return {"ContentLength": len(self.objects[Key])}
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str, **kwargs) -> dict[str, str]:
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes) -> dict[str, str]:
+        self.uploads[UploadId][PartNumber] = Body
+        self.part_sizes.append(len(Body))
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict) -> None:
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b"".join(parts[part["PartNumber"]] for part in MultipartUpload["Parts"])
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> None:
+        self.uploads.pop(UploadId, None)
+
+    def delete_objects(self, *, Bucket: str, Delete: dict) -> None:
+        for item in Delete["Objects"]:
+            self.objects.pop(item["Key"], None)
+
+    def list_objects_v2(self, *, Bucket: str, Prefix: str, MaxKeys: int, ContinuationToken=None):
+        self.list_call_count += 1
+        return {
+            "Contents": [
+                {
+                    "Key": key,
+                    "Size": len(body),
+                    "LastModified": datetime(2026, 3, 1, tzinfo=timezone.utc),
+                }
+                for key, body in sorted(self.objects.items())
+                if key.startswith(Prefix)
+            ],
+            "IsTruncated": False,
+        }
+
+
+def _request_log_record(message_id: str, **overrides: object) -> dict[str, object]:
+    record: dict[str, object] = {
+        "sourcePlatform": "slack",
+        "eventType": "app_mention",
+        "routeName": "barcode_log",
+        "status": "handled",
+        "userId": "U123",
+        "channelId": "C123",
+        "messageId": message_id,
+        "createdAtUtc": "2026-03-01T01:00:00+00:00",
+        "requestText": f"@Boxer 로그 분석 {message_id}",
+    }
+    record.update(overrides)
+    return record
+
+
+class IncrementalSqliteBackupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(request_log._close_request_log_stores)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "request_log.db"
+        self.restore_path = Path(tmpdir.name) / "restored" / "request_log.db"
+        self.s3_client = _FakeS3Client()
+        for name, value in (
+            ("REQUEST_LOG_SQLITE_S3_INCREMENTAL_ENABLED", True),
+            ("REQUEST_LOG_SQLITE_S3_FULL_BACKUP_EVERY", 3),
+            ("REQUEST_LOG_SQLITE_S3_OBJECT_KEY", ""),
+            ("REQUEST_LOG_SQLITE_S3_PREFIX", "backups"),
+            ("REQUEST_LOG_SQLITE_S3_COMPRESSION", "gzip"),
+        ):
+            patcher = mock.patch.object(request_log.s, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        base_ids = iter(f"20260301T0000{index:02d}Z" for index in range(60))
+        patcher = mock.patch.object(
+            sqlite_store,
+            "_new_sqlite_incremental_base_id",
+            side_effect=lambda: next(base_ids),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _backup(self) -> dict[str, object]:
+        return request_log._backup_request_log_to_s3(
+            db_path=self.db_path,
+            bucket="bucket",
+            s3_client=self.s3_client,
+        )
+
+    def _delta_row_count(self, key: str) -> int:
+        with tempfile.NamedTemporaryFile(suffix=".db") as delta_file:
+            delta_file.write(gzip.decompress(self.s3_client.objects[key]))
+            delta_file.flush()
+            connection = sqlite3.connect(delta_file.name)
+            try:
+                return int(connection.execute("SELECT COUNT(*) FROM request_log").fetchone()[0])
+            finally:
+                connection.close()
+
+    def test_deltas_ship_only_rows_changed_since_last_backup(self) -> None:
+        _save_request_log_records(
+            [_request_log_record(f"1.{index}") for index in range(20)],
+            db_path=self.db_path,
+        )
+        base = self._backup()
+        unchanged = self._backup()
+        _save_request_log_records(
+            [_request_log_record("1.3", status="error"), _request_log_record("2.1")],
+            db_path=self.db_path,
+        )
+        delta = self._backup()
+
+        self.assertEqual(base["mode"], "base")
+        self.assertTrue(unchanged["skipped"])
+        self.assertEqual(delta["mode"], "delta")
+        self.assertEqual(delta["key"], "backups/request_log-incremental/20260301T000000Z/delta-000001.db.gz")
+        self.assertEqual(delta["changeCount"], 2)
+        self.assertEqual(self._delta_row_count(str(delta["key"])), 2)
+
+    def test_starts_new_base_after_configured_number_of_deltas(self) -> None:
+        modes = []
+        for index in range(5):
+            _save_request_log_records([_request_log_record(f"1.{index}")], db_path=self.db_path)
+            modes.append(self._backup()["mode"])
+
+        self.assertEqual(modes, ["base", "delta", "delta", "delta", "base"])
+
+    def test_restore_replays_base_and_deltas(self) -> None:
+        _save_request_log_records(
+            [_request_log_record(f"1.{index}") for index in range(5)],
+            db_path=self.db_path,
+        )
+        self._backup()
+        _save_request_log_records(
+            [
+                _request_log_record("1.1", status="error", normalizedQuestion="영상 누락 확인"),
+                _request_log_record("2.1", createdAtUtc="2026-03-02T01:00:00+00:00"),
+            ],
+            db_path=self.db_path,
+        )
+        self._backup()
+        request_log._close_request_log_stores()
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute("DELETE FROM request_log WHERE messageId = '1.4'")
+        self._backup()
+
+        restored = request_log._restore_request_log_from_s3(
+            db_path=self.restore_path,
+            bucket="bucket",
+            s3_client=self.s3_client,
+        )
+        expected = _list_request_log_recent(target_date=None, db_path=self.db_path, limit=30)["rows"]
+        actual = _list_request_log_recent(target_date=None, db_path=self.restore_path, limit=30)["rows"]
+        search = request_log._search_request_log("영상 누락", db_path=self.restore_path)
+
+        self.assertTrue(restored["restored"])
+        self.assertEqual(restored["deltaCount"], 2)
+        self.assertEqual(actual, expected)
+        self.assertEqual(len(actual), 5)
+        self.assertEqual(search["totalCount"], 1)
+
+        _save_request_log_records([_request_log_record("3.1")], db_path=self.restore_path)
+        continued = request_log._backup_request_log_to_s3(
+            db_path=self.restore_path,
+            bucket="bucket",
+            s3_client=self.s3_client,
+        )
+        self.assertEqual(continued["deltaIndex"], 3)
+        self.assertEqual(continued["changeCount"], 1)
+
+    def test_restore_after_archive_keeps_archived_months(self) -> None:
+        for name, value in (
+            ("REQUEST_LOG_SQLITE_S3_BACKUP_ENABLED", True),
+            ("REQUEST_LOG_SQLITE_S3_BACKUP_BUCKET", "bucket"),
+            ("REQUEST_LOG_SQLITE_S3_RETENTION_COUNT", 0),
+            ("REQUEST_LOG_HOT_MONTHS", 1),
+            ("REQUEST_LOG_ARCHIVE_DIR", ""),
+        ):
+            patcher = mock.patch.object(request_log.s, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        for name, value in (
+            ("_request_log_today_local", "2026-03-03"),
+            ("_build_s3_client", self.s3_client),
+        ):
+            patcher = mock.patch.object(request_log, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        _save_request_log_records(
+            [
+                _request_log_record("1.1", createdAtUtc="2026-01-10T01:00:00+00:00"),
+                _request_log_record("1.2", createdAtUtc="2026-03-02T01:00:00+00:00"),
+            ],
+            db_path=self.db_path,
+        )
+        self._backup()
+
+        archived = request_log._run_request_log_backup_job(db_path=self.db_path, s3_client=self.s3_client)
+        _save_request_log_records([_request_log_record("1.3")], db_path=self.db_path)
+        delta = self._backup()
+        restored = request_log._restore_request_log_from_s3(
+            db_path=self.restore_path,
+            bucket="bucket",
+            s3_client=self.s3_client,
+        )
+
+        self.assertEqual(archived["mode"], "base")
+        self.assertEqual([item["month"] for item in archived["archive"]["archived"]], ["2026-01"])
+        self.assertEqual(delta["mode"], "delta")
+        self.assertEqual(restored["deltaCount"], 1)
+        self.assertEqual(
+            _list_request_log_recent(target_date="2026-01-10", db_path=self.restore_path)["totalCount"],
+            1,
+        )
+        self.assertEqual(
+            request_log._summarize_request_log_by_user(target_date="2026-01-10", db_path=self.restore_path)[
+                "totalCount"
+            ],
+            1,
+        )
+        self.assertEqual(_list_request_log_recent(target_date=None, db_path=self.restore_path)["totalCount"], 3)
+
+    def test_restore_reads_chain_from_latest_pointer_without_listing(self) -> None:
+        for index in range(3):
+            _save_request_log_records([_request_log_record(f"1.{index}")], db_path=self.db_path)
+            self._backup()
+
+        pointer = json.loads(self.s3_client.objects["backups/request_log-incremental/latest.json"])
+        restored = request_log._restore_request_log_from_s3(
+            db_path=self.restore_path,
+            bucket="bucket",
+            s3_client=self.s3_client,
+        )
+
+        self.assertEqual(len(pointer["deltaKeys"]), 2)
+        self.assertEqual(restored["deltaCount"], 2)
+        self.assertEqual(self.s3_client.list_call_count, 0)
+        self.assertEqual(
+            _list_request_log_recent(target_date=None, db_path=self.restore_path)["totalCount"],
+            3,
+        )
+
+    def test_prunes_whole_chains_beyond_retention_count(self) -> None:
+        for index in range(9):
+            _save_request_log_records([_request_log_record(f"1.{index}")], db_path=self.db_path)
+            self._backup()
+
+        pruned = request_log._prune_request_log_backups_in_s3(
+            db_path=self.db_path,
+            bucket="bucket",
+            keep_count=1,
+            s3_client=self.s3_client,
+        )
+        remaining_chains = {
+            key.split("/")[2] for key in self.s3_client.objects if key.count("/") == 3
+        }
+
+        self.assertEqual(pruned["deleted"], ["20260301T000001Z", "20260301T000000Z"])
+        self.assertEqual(remaining_chains, {"20260301T000002Z"})
+
+
+class SqliteBackupDiscoveryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "source.db"
+        self.restore_path = Path(tmpdir.name) / "restored.db"
+        self.s3_client = _FakeS3Client()
+        connection = sqlite3.connect(self.db_path)
+        try:
+            connection.execute("CREATE TABLE payload (seq INTEGER PRIMARY KEY, label TEXT)")
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _backup_on(self, local_date: str) -> dict[str, object]:
+        connection = sqlite3.connect(self.db_path)
+        try:
+            connection.execute("INSERT INTO payload (label) VALUES (?)", (local_date,))
+            connection.commit()
+        finally:
+            connection.close()
+        with mock.patch.object(
+            sqlite_store,
+            "_build_sqlite_snapshot_key",
+            return_value=f"daily/{local_date}-source.db",
+        ):
+            return sqlite_store._backup_sqlite_to_s3(
+                self.db_path,
+                bucket="bucket",
+                key_prefix="daily",
+                s3_client=self.s3_client,
+                compression="gzip",
+            )
+
+    def test_restore_finds_latest_snapshot_through_pointer(self) -> None:
+        for local_date in ("2026-03-01", "2026-03-02", "2026-03-03"):
+            self._backup_on(local_date)
+
+        restored = sqlite_store._restore_sqlite_from_s3(
+            self.restore_path,
+            bucket="bucket",
+            key_prefix="daily",
+            s3_client=self.s3_client,
+        )
+
+        self.assertEqual(restored["key"], "daily/2026-03-03-source.db.gz")
+        self.assertEqual(self.s3_client.list_call_count, 0)
+
+    def test_listing_fallback_ignores_pointer_and_manifests(self) -> None:
+        self._backup_on("2026-03-01")
+        del self.s3_client.objects["daily/latest.json"]
+
+        latest = sqlite_store._find_latest_sqlite_backup_in_s3(
+            bucket="bucket",
+            key_prefix="daily",
+            s3_client=self.s3_client,
+        )
+
+        self.assertEqual(latest["key"], "daily/2026-03-01-source.db.gz")
+
+    def test_prunes_snapshots_and_manifests_beyond_retention_count(self) -> None:
+        for local_date in ("2026-03-01", "2026-03-02", "2026-03-03"):
+            self._backup_on(local_date)
+
+        deleted = sqlite_store._prune_sqlite_backups_in_s3(
+            bucket="bucket",
+            key_prefix="daily",
+            keep_count=2,
+            s3_client=self.s3_client,
+        )
+
+        self.assertEqual(deleted, ["daily/2026-03-01-source.db.gz"])
+        self.assertEqual(
+            sorted(self.s3_client.objects),
+            [
+                "daily/2026-03-02-source.db.gz",
+                "daily/2026-03-02-source.db.gz.manifest.json",
+                "daily/2026-03-03-source.db.gz",
+                "daily/2026-03-03-source.db.gz.manifest.json",
+                "daily/latest.json",
+            ],
+        )
+
+
+class CompressedSqliteBackupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.db_path = Path(tmpdir.name) / "source.db"
+        self.restore_path = Path(tmpdir.name) / "restored.db"
+        self.s3_client = _FakeS3Client()
+        connection = sqlite3.connect(self.db_path)
+        try:
+            connection.execute("CREATE TABLE payload (seq INTEGER PRIMARY KEY, body BLOB)")
+            # 압축이 거의 안 되는 데이터를 넣어 multipart part가 여러 개 생기게 한다.
+            connection.executemany(
+                "INSERT INTO payload (body) VALUES (randomblob(65536))",
+                [()] * 180,
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _backup(self) -> dict[str, object]:
+        return sqlite_store._backup_sqlite_to_s3(
+            self.db_path,
+            bucket="bucket",
+            object_key="snapshots/source.db",
+            s3_client=self.s3_client,
+            compression="gzip",
+            multipart_chunk_size=5 * 1024 * 1024,
+        )
+
+    def _restore(self) -> dict[str, object]:
+        return sqlite_store._restore_sqlite_from_s3(
+            self.restore_path,
+            bucket="bucket",
+            object_key="snapshots/source.db",
+            s3_client=self.s3_client,
+            only_if_missing=False,
+        )
+
+    def _payload_rows(self, db_path: Path) -> list[tuple[int, bytes]]:
+        connection = sqlite3.connect(db_path)
+        try:
+            return connection.execute("SELECT seq, body FROM payload ORDER BY seq").fetchall()
+        finally:
+            connection.close()
+
+    def test_streams_gzip_snapshot_through_multipart_upload_with_manifest(self) -> None:
+        result = self._backup()
+
+        manifest = json.loads(self.s3_client.objects["snapshots/source.db.gz.manifest.json"])
+        self.assertEqual(result["key"], "snapshots/source.db.gz")
+        self.assertEqual(len(self.s3_client.part_sizes), 3)
+        self.assertEqual(self.s3_client.part_sizes[0], 5 * 1024 * 1024)
+        self.assertEqual(manifest["compressedSize"], len(self.s3_client.objects["snapshots/source.db.gz"]))
+        self.assertEqual(manifest["rawSize"], self.db_path.stat().st_size)
+
+    def test_restore_decompresses_and_verifies_checksum_without_integrity_scan(self) -> None:
+        self._backup()
+
+        with mock.patch.object(sqlite_store, "_validate_sqlite_file") as validate:
+            restored = self._restore()
+
+        self.assertTrue(restored["restored"])
+        validate.assert_not_called()
+        self.assertEqual(self._payload_rows(self.restore_path), self._payload_rows(self.db_path))
+
+    def test_restore_rejects_snapshot_that_does_not_match_manifest(self) -> None:
+        self._backup()
+        manifest_key = "snapshots/source.db.gz.manifest.json"
+        manifest = json.loads(self.s3_client.objects[manifest_key])
+        manifest["rawSha256"] = "0" * 64
+        self.s3_client.objects[manifest_key] = json.dumps(manifest).encode("utf-8")
+
+        with self.assertRaises(RuntimeError):
+            self._restore()
+        self.assertFalse(self.restore_path.exists())
+
+    def test_restore_falls_back_to_legacy_uncompressed_snapshot(self) -> None:
+        self.s3_client.objects["snapshots/source.db"] = self.db_path.read_bytes()
+
+        restored = self._restore()
+
+        self.assertEqual(restored["key"], "snapshots/source.db")
+        self.assertEqual(len(self._payload_rows(self.restore_path)), 180)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+import logging
+import unittest
+from typing import Any
+from unittest import mock
+
+from boxer.core import thread_context
+from boxer.core.thread_context import _ThreadContextLoader, _load_thread_context, _record_thread_message_event
+
+
+class _RepliesClient:
+    def __init__(
+        self,
+        messages: list[dict[str, Any]] | None = None,
+        error: Exception | None = None,
+        page_size: int = 100,
+    ) -> None:
+        self.messages = messages or []
+        self.error = error
+        self.page_size = page_size
+        self.calls: list[dict[str, Any]] = []
+
+    def conversations_replies(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        oldest = float(kwargs.get("oldest") or 0)
+        matched = [msg for msg in self.messages if float(msg["ts"]) > oldest]
+        offset = int(kwargs.get("cursor") or 0)
+        page = matched[offset : offset + self.page_size]
+        has_more = offset + self.page_size < len(matched)
+        return {
+            "messages": page,
+            "has_more": has_more,
+            "response_metadata": {"next_cursor": str(offset + self.page_size) if has_more else ""},
+        }
+
+
+_THREAD_MESSAGES = [
+    {"ts": "100.0", "user": "U1", "text": "바코드 12345678901 영상 확인해줘"},
+    {"ts": "101.0", "user": "UBOT", "text": "영상 2건 있어"},
+    {"ts": "102.0", "user": "U1", "text": "로그도 봐줘"},
+]
+
+
+class ThreadContextLoaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.logger = logging.getLogger("test_thread_context")
+        thread_context._THREAD_MESSAGE_CACHE.clear()
+        self.addCleanup(thread_context._THREAD_MESSAGE_CACHE.clear)
+
+    def test_fetches_thread_once_per_request(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES)
+        loader = _ThreadContextLoader(client, self.logger, "C1", "100.0", "102.0")
+
+        first = loader.load()
+        second = loader.load()
+
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(first, second)
+        with mock.patch.object(thread_context.s, "THREAD_CONTEXT_CACHE_MAX_THREADS", 0):
+            self.assertEqual(
+                first,
+                _load_thread_context(_RepliesClient(_THREAD_MESSAGES), self.logger, "C1", "100.0", "102.0"),
+            )
+        self.assertEqual(first, "U1: 바코드 12345678901 영상 확인해줘\nUBOT: 영상 2건 있어")
+
+    def test_remembers_fetch_failure_for_the_request(self) -> None:
+        client = _RepliesClient(error=RuntimeError("slack down"))
+        loader = _ThreadContextLoader(client, self.logger, "C1", "100.0", "102.0")
+
+        with self.assertLogs(self.logger, level="ERROR"):
+            self.assertEqual(loader.load(), "")
+        self.assertEqual(loader.load(), "")
+        self.assertEqual(len(client.calls), 1)
+
+    def test_skips_fetch_outside_threads(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES)
+
+        self.assertEqual(_ThreadContextLoader(client, self.logger, "C1", None, "102.0").load(), "")
+        self.assertEqual(client.calls, [])
+
+
+class ThreadMessageCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.logger = logging.getLogger("test_thread_context")
+        thread_context._THREAD_MESSAGE_CACHE.clear()
+        self.addCleanup(thread_context._THREAD_MESSAGE_CACHE.clear)
+
+    def test_follow_up_mentions_reuse_cached_thread_and_message_events(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES[:2])
+        _ThreadContextLoader(client, self.logger, "C1", "100.0", "102.0").load()
+
+        _record_thread_message_event(
+            {"channel": "C1", "thread_ts": "100.0", "ts": "102.0", "user": "U1", "text": "로그도 봐줘"}
+        )
+        _record_thread_message_event(
+            {"channel": "C1", "thread_ts": "999.0", "ts": "999.5", "user": "U2", "text": "다른 스레드"}
+        )
+        context = _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        self.assertEqual(len(client.calls), 1)
+        self.assertTrue(context.endswith("U1: 로그도 봐줘"))
+
+    def test_expired_thread_fetches_only_newer_messages(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES[:2])
+        _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+        client.messages = _THREAD_MESSAGES
+
+        with mock.patch.object(thread_context.s, "THREAD_CONTEXT_CACHE_TTL_SEC", 0):
+            context = _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        self.assertEqual(client.calls[1]["oldest"], "101.0")
+        self.assertFalse(client.calls[1]["inclusive"])
+        self.assertEqual(len(context.splitlines()), 3)
+
+    def test_edits_and_deletes_update_cached_thread(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES)
+        _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        _record_thread_message_event(
+            {
+                "channel": "C1",
+                "subtype": "message_changed",
+                "message": {"ts": "101.0", "thread_ts": "100.0", "user": "UBOT", "text": "영상 3건 있어"},
+            }
+        )
+        _record_thread_message_event(
+            {
+                "channel": "C1",
+                "subtype": "message_deleted",
+                "deleted_ts": "102.0",
+                "previous_message": {"ts": "102.0", "thread_ts": "100.0"},
+            }
+        )
+        context = _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        self.assertEqual(context.splitlines()[-1], "UBOT: 영상 3건 있어")
+        self.assertEqual(len(client.calls), 1)
+
+    def test_missed_events_are_fetched_from_last_api_sync(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES[:2])
+        _ThreadContextLoader(client, self.logger, "C1", "100.0", "104.0").load()
+        client.messages = [*_THREAD_MESSAGES, {"ts": "103.0", "user": "U2", "text": "나도 확인 부탁"}]
+        # 102.0 이벤트는 못 받고 103.0만 받은 상황
+        _record_thread_message_event(
+            {"channel": "C1", "thread_ts": "100.0", "ts": "103.0", "user": "U2", "text": "나도 확인 부탁"}
+        )
+
+        with mock.patch.object(thread_context.s, "THREAD_CONTEXT_CACHE_TTL_SEC", 0):
+            context = _ThreadContextLoader(client, self.logger, "C1", "100.0", "104.0").load()
+
+        self.assertEqual(client.calls[1]["oldest"], "101.0")
+        self.assertEqual(context.splitlines()[-2:], ["U1: 로그도 봐줘", "U2: 나도 확인 부탁"])
+
+    def test_catch_up_follows_cursor_pages(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES[:1], page_size=1)
+        _ThreadContextLoader(client, self.logger, "C1", "100.0", "104.0").load()
+        client.messages = _THREAD_MESSAGES
+
+        with mock.patch.object(thread_context.s, "THREAD_CONTEXT_CACHE_TTL_SEC", 0):
+            context = _ThreadContextLoader(client, self.logger, "C1", "100.0", "104.0").load()
+
+        self.assertEqual([call.get("cursor") for call in client.calls[1:]], [None, "1"])
+        self.assertEqual(len(context.splitlines()), 3)
+
+    def test_file_share_replies_enter_cached_thread(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES[:2])
+        _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        _record_thread_message_event(
+            {
+                "channel": "C1",
+                "subtype": "file_share",
+                "thread_ts": "100.0",
+                "ts": "102.0",
+                "user": "U1",
+                "text": "캡처 첨부했어",
+                "files": [{"id": "F1"}],
+            }
+        )
+        context = _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(context.splitlines()[-1], "U1: 캡처 첨부했어")
+
+    def test_unhandled_reply_subtype_makes_next_read_catch_up(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES[:2])
+        _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+        client.messages = _THREAD_MESSAGES
+
+        _record_thread_message_event(
+            {"channel": "C1", "subtype": "huddle_thread", "thread_ts": "100.0", "ts": "102.0"}
+        )
+        context = _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        self.assertEqual(len(client.calls), 2)
+        self.assertEqual(client.calls[1]["oldest"], "101.0")
+        self.assertEqual(context.splitlines()[-1], "U1: 로그도 봐줘")
+
+    def test_evicts_least_recently_used_threads(self) -> None:
+        client = _RepliesClient(_THREAD_MESSAGES)
+        with mock.patch.object(thread_context.s, "THREAD_CONTEXT_CACHE_MAX_THREADS", 1):
+            _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+            _ThreadContextLoader(client, self.logger, "C2", "100.0", "103.0").load()
+            _ThreadContextLoader(client, self.logger, "C1", "100.0", "103.0").load()
+
+        self.assertEqual([call["channel"] for call in client.calls], ["C1", "C2", "C1"])
+
+
+if __name__ == "__main__":
+    unittest.main()